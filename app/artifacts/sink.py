@@ -0,0 +1,146 @@
+import queue
+import re
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from functools import lru_cache
+from pathlib import Path
+
+from app.config import artifact_config
+from app.utils import get_logger
+
+
+def artifact_name(name: str) -> str:
+    """File-safe artifact name for a task name, e.g. ``research_approach_creation``."""
+    return re.sub(r"[^a-z0-9]+", "_", name.casefold()).strip("_") or "artifact"
+
+
+class ArtifactSink(ABC):
+    """Destination of the task outputs of research requests, namespaced by request id."""
+
+    @abstractmethod
+    def write(self, request_id: str, name: str, content: str) -> None:
+        """Stores the artifact ``name`` of a request; must not block on I/O."""
+
+    @abstractmethod
+    def collect(self, request_id: str) -> dict[str, str] | None:
+        """Returns a request's artifacts (or where they are written) by name, for its response."""
+
+    def close(self) -> None:  # noqa: B027 - optional hook, not every sink holds resources
+        """Flushes pending artifacts and releases the sink; does nothing by default."""
+
+
+class DisabledArtifactSink(ArtifactSink):
+    """Sink that drops every artifact."""
+
+    def write(self, request_id: str, name: str, content: str) -> None:
+        pass
+
+    def collect(self, request_id: str) -> dict[str, str] | None:  # noqa: ARG002
+        return None
+
+
+class InMemoryArtifactSink(ArtifactSink):
+    """
+    Keeps each request's artifacts in memory until they are collected into its response.
+
+    Artifacts of requests that are never collected (e.g. failed ones) are evicted once
+    more than ``max_requests`` requests hold artifacts.
+    """
+
+    def __init__(self, max_requests: int) -> None:
+        self.max_requests = max_requests
+        self._artifacts: OrderedDict[str, dict[str, str]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def write(self, request_id: str, name: str, content: str) -> None:
+        with self._lock:
+            self._artifacts.setdefault(request_id, {})[artifact_name(name)] = content
+            self._artifacts.move_to_end(request_id)
+            while len(self._artifacts) > self.max_requests:
+                self._artifacts.popitem(last=False)
+
+    def collect(self, request_id: str) -> dict[str, str] | None:
+        with self._lock:
+            return self._artifacts.pop(request_id, None)
+
+
+class DirectoryArtifactSink(ArtifactSink):
+    """
+    Writes artifacts to ``<directory>/<request id>/<name>.txt`` from a background thread.
+
+    Writes are queued and flushed in batches, so crew threads never wait on the disk and
+    concurrent requests never share a file. ``collect`` returns the artifacts' paths, which
+    may be written up to ``flush_interval`` seconds later.
+    """
+
+    def __init__(self, directory: str, flush_interval: float, max_requests: int) -> None:
+        self.directory = Path(directory)
+        self.flush_interval = flush_interval
+        self.max_requests = max_requests
+        self._pending: queue.Queue[tuple[str, str, str] | None] = queue.Queue()
+        self._written: OrderedDict[str, dict[str, str]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._writer = threading.Thread(target=self._flush_forever, name="artifact-writer", daemon=True)
+        self._writer.start()
+
+    def _path(self, request_id: str, name: str) -> Path:
+        return self.directory / artifact_name(request_id) / f"{artifact_name(name)}.txt"
+
+    def write(self, request_id: str, name: str, content: str) -> None:
+        with self._lock:
+            self._written.setdefault(request_id, {})[artifact_name(name)] = str(self._path(request_id, name))
+            self._written.move_to_end(request_id)
+            while len(self._written) > self.max_requests:
+                self._written.popitem(last=False)
+        self._pending.put((request_id, name, content))
+
+    def collect(self, request_id: str) -> dict[str, str] | None:
+        with self._lock:
+            return self._written.pop(request_id, None)
+
+    def _flush_forever(self) -> None:
+        closing = False
+        while not closing:
+            batch = [self._pending.get()]
+            # Gather the writes queued within flush_interval so bursts of tasks are flushed together
+            deadline = time.monotonic() + self.flush_interval
+            while batch[-1] is not None and (remaining := deadline - time.monotonic()) > 0:
+                try:
+                    batch.append(self._pending.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            for item in batch:
+                if item is None:
+                    closing = True
+                    continue
+                path = self._path(item[0], item[1])
+                try:
+                    path.parent.mkdir(parents=True, exist_ok=True)
+                    path.write_text(item[2], encoding="utf-8")
+                except OSError as e:
+                    get_logger().error(f"Failed to write artifact {path}: {e!r}")
+
+    def close(self) -> None:
+        self._pending.put(None)
+        self._writer.join()
+
+
+@lru_cache
+def get_artifact_sink() -> ArtifactSink:
+    """
+    Returns the process-wide artifact sink configured by ``artifact_config``.
+
+    Returns:
+        ArtifactSink: The artifact sink.
+    """
+    if artifact_config["backend"] == "memory":
+        return InMemoryArtifactSink(max_requests=artifact_config["max_requests"])
+    if artifact_config["backend"] == "directory":
+        return DirectoryArtifactSink(
+            directory=artifact_config["directory"],
+            flush_interval=artifact_config["flush_interval_seconds"],
+            max_requests=artifact_config["max_requests"],
+        )
+    return DisabledArtifactSink()
@@ -0,0 +1,104 @@
+import hashlib
+from typing import Any
+
+import numpy as np
+from qdrant_client import QdrantClient
+from qdrant_client.http.models import Distance, PointStruct, VectorParams
+from tavily import AsyncTavilyClient, TavilyClient
+
+EMBEDDING_DIM = 64
+WORDS = (  # noqa: SIM905
+    "quantum error correction surface code qubit decoherence fidelity threshold lattice syndrome "
+    "measurement logical physical gate noise model benchmark hardware superconducting ion trap"
+).split()
+
+
+def _words(seed: str, count: int) -> str:
+    digest = hashlib.sha256(seed.encode()).digest()
+    return " ".join(WORDS[(digest[i % len(digest)] + i) % len(WORDS)] for i in range(count))
+
+
+def stub_embedding(text: str) -> list[float]:
+    """Deterministic unit vector for ``text``, standing in for the embedding model."""
+    seed = int.from_bytes(hashlib.sha256(text.encode()).digest()[:8], "little")
+    vector = np.random.default_rng(seed).standard_normal(EMBEDDING_DIM).astype(np.float32)
+    return (vector / np.linalg.norm(vector)).tolist()
+
+
+def search_response(query: str, max_results: int = 5, *, include_raw_content: bool = False) -> dict[str, Any]:
+    """A Tavily search response for ``query`` with ``max_results`` synthetic results."""
+    results = [
+        {
+            "title": f"{query} ({i})",
+            "url": f"https://example.org/{hashlib.sha1(f'{query}{i}'.encode()).hexdigest()[:12]}",
+            "content": _words(f"{query}{i}", 80),
+            "score": round(1.0 - i / (max_results + 1), 4),
+            "raw_content": _words(f"raw{query}{i}", 600) if include_raw_content else None,
+        }
+        for i in range(max_results)
+    ]
+    return {"query": query, "answer": None, "images": [], "results": results, "response_time": 0.0}
+
+
+def extract_response(urls: list[str] | str) -> dict[str, Any]:
+    """A Tavily extract response with synthetic page content for every URL."""
+    urls = [urls] if isinstance(urls, str) else urls
+    results = [{"url": url, "raw_content": _words(url, 1500), "images": []} for url in urls]
+    return {"results": results, "failed_results": [], "response_time": 0.0}
+
+
+class FakeTavilyClient(TavilyClient):
+    """Tavily client answering from synthetic data, without network."""
+
+    def __init__(self) -> None:
+        super().__init__(api_key="tvly-benchmark")
+
+    def search(
+        self,
+        query: str,
+        max_results: int = 5,
+        include_raw_content: bool = False,  # noqa: FBT001, FBT002 - TavilyClient's signature
+        **_kwargs: Any,
+    ) -> dict[str, Any]:
+        return search_response(query, max_results, include_raw_content=include_raw_content)
+
+    def extract(self, urls: list[str] | str, **_kwargs: Any) -> dict[str, Any]:
+        return extract_response(urls)
+
+
+class FakeAsyncTavilyClient(AsyncTavilyClient):
+    """Async Tavily client answering from synthetic data, without network."""
+
+    def __init__(self) -> None:
+        super().__init__(api_key="tvly-benchmark")
+
+    async def search(
+        self,
+        query: str,
+        max_results: int = 5,
+        include_raw_content: bool = False,  # noqa: FBT001, FBT002 - AsyncTavilyClient's signature
+        **_kwargs: Any,
+    ) -> dict[str, Any]:
+        return search_response(query, max_results, include_raw_content=include_raw_content)
+
+    async def extract(self, urls: list[str] | str, **_kwargs: Any) -> dict[str, Any]:
+        return extract_response(urls)
+
+
+def in_memory_qdrant(collection_name: str, points: int = 500) -> QdrantClient:
+    """An in-memory Qdrant client with ``points`` synthetic documents embedded by ``stub_embedding``."""
+    client = QdrantClient(":memory:")
+    client.create_collection(collection_name, vectors_config=VectorParams(size=EMBEDDING_DIM, distance=Distance.COSINE))
+    texts = [_words(f"doc{i}", 120) for i in range(points)]
+    client.upsert(
+        collection_name,
+        points=[
+            PointStruct(
+                id=i,
+                vector=stub_embedding(text),
+                payload={"text": text, "metadata": {"source": f"https://kb.example.org/doc/{i}"}},
+            )
+            for i, text in enumerate(texts)
+        ],
+    )
+    return client
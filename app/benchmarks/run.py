@@ -0,0 +1,142 @@
+"""
+Offline micro-benchmarks of the Research Navigator components.
+
+Runs without network: Tavily is replaced by fake clients, Qdrant by an in-memory client
+and the embedding model by a stub. Results are written as JSON so runs of different
+versions can be compared with ``--compare``.
+
+Usage:
+    uv run bench --output bench.json [--repeat 7] [--min-time 0.2] [--filter tool.] [--compare base.json]
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import timeit
+from datetime import UTC, datetime
+from importlib import metadata
+from pathlib import Path
+from typing import Any
+
+# Placeholders so clients and settings that read them at import time can be created offline
+OFFLINE_ENVIRONMENT = {
+    "TAVILY_API_KEY": "tvly-benchmark",
+    "OPENAI_API_KEY": "sk-benchmark",
+    "QDRANT_URL": ":memory:",
+    "LANGSMITH_TRACING": "false",
+    "LANGCHAIN_TRACING_V2": "false",
+    "OTEL_SDK_DISABLED": "true",
+    "CREWAI_DISABLE_TELEMETRY": "true",
+}
+
+# Calls per round of the fastest benchmarks are capped here
+MAX_LOOPS = 1_000_000
+
+
+def _git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _version() -> str | None:
+    try:
+        return metadata.version("research_navigator")
+    except metadata.PackageNotFoundError:
+        return None
+
+
+def measure(fn: Any, repeat: int, min_time: float) -> dict[str, float]:
+    """
+    Times ``fn`` and returns per-call statistics in seconds.
+
+    Args:
+        fn: The callable to time.
+        repeat: Number of timed rounds.
+        min_time: Minimum duration of a round; fast callables run several times per round.
+
+    Returns:
+        dict[str, float]: The loops per round and the min, median, mean and stdev per call.
+    """
+    fn()  # warm-up: lazy imports, caches and first-call setup are not measured
+    timer = timeit.Timer(fn)
+    loops = 1
+    while (elapsed := timer.timeit(loops)) < min_time and loops < MAX_LOOPS:
+        loops = max(loops * 2, int(loops * min_time / max(elapsed, 1e-9)))
+    per_call = [elapsed / loops for elapsed in timer.repeat(repeat=repeat, number=loops)]
+    return {
+        "loops": loops,
+        "rounds": repeat,
+        "min_s": min(per_call),
+        "median_s": statistics.median(per_call),
+        "mean_s": statistics.fmean(per_call),
+        "stdev_s": statistics.stdev(per_call) if len(per_call) > 1 else 0.0,
+    }
+
+
+def compare(results: dict[str, Any], baseline: dict[str, Any]) -> list[str]:
+    """Returns one line per benchmark with its median against the baseline's."""
+    lines = []
+    for name, result in results["benchmarks"].items():
+        base = baseline.get("benchmarks", {}).get(name)
+        if base is None or "median_s" not in result or "median_s" not in base:
+            lines.append(f"{name:40} {'n/a':>12}")
+            continue
+        ratio = result["median_s"] / base["median_s"]
+        lines.append(f"{name:40} {base['median_s'] * 1e3:10.3f}ms -> {result['median_s'] * 1e3:10.3f}ms  x{ratio:.2f}")
+    return lines
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Offline micro-benchmarks of the Research Navigator components.")
+    parser.add_argument("--output", "-o", help="Write the JSON results to this file instead of stdout.")
+    parser.add_argument("--repeat", type=int, default=7, help="Timed rounds per benchmark.")
+    parser.add_argument("--min-time", type=float, default=0.2, help="Minimum seconds per round.")
+    parser.add_argument("--filter", "-k", default="", help="Only run benchmarks whose name contains this.")
+    parser.add_argument("--compare", help="JSON results of a previous run to compare medians against.")
+    args = parser.parse_args(argv)
+
+    for name, value in OFFLINE_ENVIRONMENT.items():
+        os.environ.setdefault(name, value)
+    from .suite import BENCHMARKS
+
+    results: dict[str, Any] = {
+        "suite": "research_navigator",
+        "version": _version(),
+        "git_commit": _git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "created_at": datetime.now(UTC).isoformat(),
+        "benchmarks": {},
+    }
+    for name, benchmark in BENCHMARKS.items():
+        if args.filter not in name:
+            continue
+        start_time = time.perf_counter()
+        try:
+            results["benchmarks"][name] = measure(benchmark(), args.repeat, args.min_time)
+        except Exception as e:  # noqa: BLE001
+            results["benchmarks"][name] = {"error": repr(e)}
+        print(f"{name}: {time.perf_counter() - start_time:.1f}s", file=sys.stderr)  # noqa: T201
+
+    output = json.dumps(results, indent=2)
+    if args.output:
+        Path(args.output).write_text(output + "\n", encoding="utf-8")
+    else:
+        print(output)  # noqa: T201
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text(encoding="utf-8"))
+        print("\n".join(compare(results, baseline)), file=sys.stderr)  # noqa: T201
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
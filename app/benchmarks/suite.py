@@ -0,0 +1,143 @@
+import json
+from collections.abc import Callable
+from typing import Any
+
+from crewai import TaskOutput
+from qdrant_client import AsyncQdrantClient
+
+from app.clients import get_client_registry
+from app.crew.context import ContextAssembler
+from app.schemas import ResearchQuery, ResearchResponse
+from app.temp.qdrant_search_tool import QdrantVectorBatchSearchTool, QdrantVectorSearchTool
+from app.temp.tavily_extractor_tool import TavilyExtractorTool
+from app.temp.tavily_search_tool import TavilyMultiSearchTool, TavilySearchTool
+
+from .fakes import (
+    FakeAsyncTavilyClient,
+    FakeTavilyClient,
+    extract_response,
+    in_memory_qdrant,
+    search_response,
+    stub_embedding,
+)
+
+QUERY = "How do surface codes improve quantum error correction thresholds?"
+QUERIES = [f"{QUERY} ({aspect})" for aspect in ("hardware", "decoders", "overhead", "benchmarks", "limits")]
+URLS = [f"https://example.org/paper/{i}" for i in range(5)]
+COLLECTION = "research"
+
+# Each benchmark builds its fixtures once and returns the callable that is timed
+Benchmark = Callable[[], Callable[[], Any]]
+
+
+def _register_fake_clients() -> None:
+    registry = get_client_registry()
+    registry.register("tavily", FakeTavilyClient())
+    registry.register("async_tavily", FakeAsyncTavilyClient())
+    registry.register("qdrant", in_memory_qdrant(COLLECTION))
+    registry.register("async_qdrant", AsyncQdrantClient(":memory:"))
+
+
+def crew_build() -> Callable[[], Any]:
+    from app.crew.crew import get_research_crew
+
+    _register_fake_clients()
+    return get_research_crew
+
+
+def crew_clone() -> Callable[[], Any]:
+    from app.crew.crew import get_research_crew_template
+
+    _register_fake_clients()
+    template = get_research_crew_template()
+    return template.copy
+
+
+# Tools are called through ``_run``: crewAI's ``run`` prints a line on every call
+
+
+def tavily_search() -> Callable[[], Any]:
+    tool = TavilySearchTool(client=FakeTavilyClient(), async_client=FakeAsyncTavilyClient())
+    return lambda: tool._run(query=QUERY, max_results=10)  # noqa: SLF001
+
+
+def tavily_multi_search() -> Callable[[], Any]:
+    tool = TavilyMultiSearchTool(client=FakeTavilyClient(), async_client=FakeAsyncTavilyClient())
+    return lambda: tool._run(queries=QUERIES, max_results=10)  # noqa: SLF001
+
+
+def tavily_extract() -> Callable[[], Any]:
+    tool = TavilyExtractorTool(client=FakeTavilyClient(), async_client=FakeAsyncTavilyClient())
+    return lambda: tool._run(urls=URLS)  # noqa: SLF001
+
+
+def _qdrant_tool(tool_class: type[QdrantVectorSearchTool]) -> QdrantVectorSearchTool:
+    return tool_class(
+        client=in_memory_qdrant(COLLECTION),
+        async_client=AsyncQdrantClient(":memory:"),
+        qdrant_url=":memory:",
+        collection_name=COLLECTION,
+        limit=5,
+        score_threshold=0.0,
+        custom_embedding_fn=stub_embedding,
+    )
+
+
+def qdrant_search() -> Callable[[], Any]:
+    tool = _qdrant_tool(QdrantVectorSearchTool)
+    return lambda: tool._run(query=QUERY)  # noqa: SLF001
+
+
+def qdrant_batch_search() -> Callable[[], Any]:
+    tool = _qdrant_tool(QdrantVectorBatchSearchTool)
+    return lambda: tool._run(queries=QUERIES)  # noqa: SLF001
+
+
+def research_query_validate() -> Callable[[], Any]:
+    payload = {"query": QUERY, "context": "Focus on superconducting hardware.", "additional_params": {"depth": 2}}
+    return lambda: ResearchQuery.model_validate(payload)
+
+
+def research_query_hash() -> Callable[[], Any]:
+    query = ResearchQuery(query=QUERY, context="Focus on superconducting hardware.")
+    return lambda: hash(query)
+
+
+def research_response_build() -> Callable[[], Any]:
+    results = search_response(QUERY, 10)["results"]
+    payload = {
+        "query": QUERY,
+        "findings": " ".join(result["content"] for result in results),
+        "sources": [{"url": result["url"], "title": result["title"]} for result in results],
+        "confidence_score": 0.82,
+        "related_topics": ["surface codes", "decoders", "logical qubits"],
+        "processing_time": 42.0,
+        "metadata": {"model": "gpt-4o-mini"},
+    }
+    return lambda: ResearchResponse.model_validate(payload).model_dump_json()
+
+
+def context_assembly() -> Callable[[], Any]:
+    assembler = ContextAssembler(budgets={"synthesis": 2000}, max_chunk_tokens=400, encoding="cl100k_base")
+    # Tool dumps, as the retrieval tasks tend to pass them on
+    dumps = {"web": search_response(QUERY, 10), "extract": extract_response(URLS)}
+    outputs = [
+        TaskOutput(description=name, name=name, agent="retrieval", raw=json.dumps(dump, indent=2))
+        for name, dump in dumps.items()
+    ]
+    return lambda: assembler.assemble("synthesis", outputs, query=QUERY)
+
+
+BENCHMARKS: dict[str, Benchmark] = {
+    "crew.build": crew_build,
+    "crew.clone": crew_clone,
+    "tool.tavily_search": tavily_search,
+    "tool.tavily_multi_search": tavily_multi_search,
+    "tool.tavily_extract": tavily_extract,
+    "tool.qdrant_search": qdrant_search,
+    "tool.qdrant_batch_search": qdrant_batch_search,
+    "schema.research_query_validate": research_query_validate,
+    "schema.research_query_hash": research_query_hash,
+    "schema.research_response_build": research_response_build,
+    "context.assembly": context_assembly,
+}
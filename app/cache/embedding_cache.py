@@ -0,0 +1,303 @@
+import hashlib
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from collections.abc import Sequence
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+
+from app.config import embedding_cache_config
+from app.metrics import count_cache_lookup
+
+
+def normalize_text(text: str) -> str:
+    """Normalizes text for embedding cache keys (NFKC, collapsed whitespace)."""
+    return " ".join(unicodedata.normalize("NFKC", text).split())
+
+
+def embedding_key(model: str, text: str) -> str:
+    """Cache key for the embedding of ``text`` by ``model``."""
+    return hashlib.sha256(f"{model}\0{normalize_text(text)}".encode()).hexdigest()
+
+
+class DiskEmbeddingStore:
+    """
+    On-disk embedding store shared by every process on the host.
+
+    Vectors are packed in one memory-mapped file per (model, dimension), each row tagged
+    with a digest of its key; a SQLite index maps each key to its row. Rows are allocated
+    inside an immediate transaction, so concurrent writers in several workers never share
+    a row. Once a file holds ``max_entries`` vectors, new ones take over the rows of the
+    least recently used. A reader only trusts a row whose tag matches its key before and
+    after reading the vector, since another process may be reusing the row meanwhile. Use
+    times are written at most once per ``touch_seconds`` for each key.
+    """
+
+    # Version of the file layout; older caches are dropped on open
+    LAYOUT_VERSION = 2
+
+    def __init__(
+        self, directory: str, growth_rows: int = 1024, max_entries: int | None = None, touch_seconds: float = 60.0
+    ) -> None:
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.growth_rows = growth_rows
+        self.max_entries = max_entries
+        self.touch_seconds = touch_seconds
+        self._maps: dict[tuple[str, int], np.memmap] = {}
+        self._lock = threading.Lock()
+        self._index = sqlite3.connect(
+            self.directory / "index.sqlite3", timeout=30, check_same_thread=False, isolation_level=None
+        )
+        self._index.execute("PRAGMA journal_mode=WAL")
+        self._index.execute("BEGIN IMMEDIATE")
+        try:
+            (version,) = self._index.execute("PRAGMA user_version").fetchone()
+            if version != self.LAYOUT_VERSION:
+                # Untagged float32 rows of earlier versions can't be verified, so they are dropped
+                self._index.execute("DROP TABLE IF EXISTS embeddings")
+                for path in self.directory.glob("*.f32"):
+                    path.unlink(missing_ok=True)
+                self._index.execute(f"PRAGMA user_version = {self.LAYOUT_VERSION}")
+            self._index.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings ("
+                "key TEXT PRIMARY KEY, model TEXT NOT NULL, dim INTEGER NOT NULL, row INTEGER NOT NULL, "
+                "used_at REAL NOT NULL)"
+            )
+            self._index.execute("CREATE INDEX IF NOT EXISTS embeddings_lru ON embeddings (model, dim, used_at)")
+            self._index.execute("COMMIT")
+        except Exception:
+            self._index.execute("ROLLBACK")
+            raise
+
+    @staticmethod
+    def _tag(key: str) -> int:
+        """Non-zero digest of ``key`` stored with its row; zero marks a row being written."""
+        return int(key[:16], 16) or 1
+
+    @staticmethod
+    def _dtype(dim: int) -> np.dtype:
+        return np.dtype([("tag", "<u8"), ("vector", "<f4", (dim,))])
+
+    def _path(self, model: str, dim: int) -> Path:
+        return self.directory / f"{re.sub(r'[^A-Za-z0-9_.-]', '_', model)}-{dim}.rows"
+
+    def _map(self, model: str, dim: int, min_rows: int) -> np.memmap:
+        """Returns a map of the vector file with at least ``min_rows`` rows, growing the file if needed."""
+        current = self._maps.get((model, dim))
+        if current is not None and current.shape[0] >= min_rows:
+            return current
+        dtype = self._dtype(dim)
+        path = self._path(model, dim)
+        path.touch(exist_ok=True)
+        rows = path.stat().st_size // dtype.itemsize
+        if rows < min_rows:
+            rows = min_rows + self.growth_rows
+            with path.open("r+b") as f:
+                f.truncate(rows * dtype.itemsize)
+        self._maps[(model, dim)] = np.memmap(path, dtype=dtype, mode="r+", shape=(rows,))
+        return self._maps[(model, dim)]
+
+    def _read(self, key: str, model: str, dim: int, index: int) -> np.ndarray | None:
+        """Returns the vector in row ``index`` if the row still holds ``key``'s vector."""
+        row = self._map(model, dim, index + 1)[index : index + 1]
+        tag = self._tag(key)
+        before = int(row["tag"][0])
+        vector = np.array(row["vector"][0])
+        after = int(row["tag"][0])
+        return vector if before == after == tag else None
+
+    def get(self, key: str) -> np.ndarray | None:
+        with self._lock:
+            row = self._index.execute(
+                "SELECT model, dim, row, used_at FROM embeddings WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            model, dim, index, used_at = row
+            vector = self._read(key, model, dim, index)
+            now = time.time()
+            if vector is not None and now - used_at >= self.touch_seconds:
+                self._index.execute("UPDATE embeddings SET used_at = ? WHERE key = ?", (now, key))
+            return vector
+
+    def recent(self, limit: int) -> list[tuple[str, np.ndarray]]:
+        """Returns up to ``limit`` of the most recently stored embeddings by key, oldest first."""
+        with self._lock:
+            rows = self._index.execute(
+                "SELECT key, model, dim, row FROM embeddings ORDER BY used_at DESC, rowid DESC LIMIT ?", (limit,)
+            ).fetchall()
+            embeddings = [(key, self._read(key, model, dim, index)) for key, model, dim, index in reversed(rows)]
+            return [(key, vector) for key, vector in embeddings if vector is not None]
+
+    def _evict(self, model: str, dim: int) -> int | None:
+        """Frees the least recently used rows of a full file, within the caller's transaction; returns one to reuse."""
+        if self.max_entries is None:
+            return None
+        (count,) = self._index.execute(
+            "SELECT COUNT(*) FROM embeddings WHERE model = ? AND dim = ?", (model, dim)
+        ).fetchone()
+        if count < self.max_entries:
+            return None
+        evicted = self._index.execute(
+            "SELECT key, row FROM embeddings WHERE model = ? AND dim = ? ORDER BY used_at, rowid LIMIT ?",
+            (model, dim, count - self.max_entries + 1),
+        ).fetchall()
+        self._index.executemany("DELETE FROM embeddings WHERE key = ?", [(key,) for key, _ in evicted])
+        return evicted[0][1]
+
+    def set(self, key: str, model: str, vector: np.ndarray) -> None:
+        dim = vector.shape[0]
+        with self._lock:
+            self._index.execute("BEGIN IMMEDIATE")
+            try:
+                if self._index.execute("SELECT 1 FROM embeddings WHERE key = ?", (key,)).fetchone():
+                    self._index.execute("COMMIT")
+                    return
+                index = self._evict(model, dim)
+                if index is None:
+                    (index,) = self._index.execute(
+                        "SELECT COALESCE(MAX(row) + 1, 0) FROM embeddings WHERE model = ? AND dim = ?", (model, dim)
+                    ).fetchone()
+                rows = self._map(model, dim, index + 1)
+                # Readers of the row's previous key see the cleared tag, or the new one, and miss
+                rows["tag"][index] = 0
+                rows["vector"][index] = vector
+                rows["tag"][index] = self._tag(key)
+                rows.flush()
+                self._index.execute(
+                    "INSERT INTO embeddings VALUES (?, ?, ?, ?, ?)", (key, model, dim, index, time.time())
+                )
+                self._index.execute("COMMIT")
+            except Exception:
+                self._index.execute("ROLLBACK")
+                raise
+
+
+class EmbeddingCache:
+    """
+    Two-tier embedding cache: an in-memory LRU in front of an optional ``DiskEmbeddingStore``.
+
+    Attributes:
+        memory_hits: Lookups served from memory.
+        disk_hits: Lookups served from disk.
+        misses: Lookups that had to call the embedding model.
+    """
+
+    def __init__(self, memory_max_entries: int = 4096, disk_store: DiskEmbeddingStore | None = None) -> None:
+        self.memory_max_entries = memory_max_entries
+        self.disk_store = disk_store
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self._memory: OrderedDict[str, np.ndarray] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _remember(self, key: str, vector: np.ndarray) -> None:
+        with self._lock:
+            self._memory[key] = vector
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.memory_max_entries:
+                self._memory.popitem(last=False)
+
+    def get(self, model: str, text: str) -> np.ndarray | None:
+        """
+        Returns the cached embedding of ``text`` by ``model``, if any.
+
+        Args:
+            model: The embedding model name.
+            text: The embedded text.
+
+        Returns:
+            np.ndarray | None: The float32 vector, or None on a miss.
+        """
+        key = embedding_key(model, text)
+        with self._lock:
+            vector = self._memory.get(key)
+            if vector is not None:
+                self._memory.move_to_end(key)
+                self.memory_hits += 1
+                count_cache_lookup("embedding", hit=True)
+                return vector
+        vector = self.disk_store.get(key) if self.disk_store else None
+        with self._lock:
+            if vector is None:
+                self.misses += 1
+            else:
+                self.disk_hits += 1
+        count_cache_lookup("embedding", hit=vector is not None)
+        if vector is None:
+            return None
+        self._remember(key, vector)
+        return vector
+
+    def set(self, model: str, text: str, vector: Sequence[float] | np.ndarray) -> None:
+        """
+        Caches the embedding of ``text`` by ``model`` in both tiers.
+
+        Args:
+            model: The embedding model name.
+            text: The embedded text.
+            vector: The embedding.
+        """
+        key = embedding_key(model, text)
+        vector = np.asarray(vector, dtype=np.float32)
+        self._remember(key, vector)
+        if self.disk_store:
+            self.disk_store.set(key, model, vector)
+
+    def preload(self, limit: int | None = None) -> int:
+        """
+        Loads the most recently stored disk embeddings into the memory tier.
+
+        Args:
+            limit: How many to load; at most (and by default) the memory tier's size.
+
+        Returns:
+            int: The number of embeddings loaded.
+        """
+        if self.disk_store is None:
+            return 0
+        limit = self.memory_max_entries if limit is None else min(limit, self.memory_max_entries)
+        embeddings = self.disk_store.recent(limit)
+        for key, vector in embeddings:
+            self._remember(key, vector)
+        return len(embeddings)
+
+    def stats(self) -> dict[str, float]:
+        """Returns hit and miss counters and the overall hit rate."""
+        with self._lock:
+            lookups = self.memory_hits + self.disk_hits + self.misses
+            return {
+                "memory_hits": self.memory_hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "hit_rate": (self.memory_hits + self.disk_hits) / lookups if lookups else 0.0,
+            }
+
+
+@lru_cache
+def get_embedding_cache() -> EmbeddingCache | None:
+    """
+    Returns the process-wide embedding cache configured by ``embedding_cache_config``.
+
+    Returns:
+        EmbeddingCache | None: The cache, or None if it is disabled.
+    """
+    if not embedding_cache_config["enabled"]:
+        return None
+    disk_store = (
+        DiskEmbeddingStore(
+            embedding_cache_config["disk_path"],
+            max_entries=embedding_cache_config["disk_max_entries"],
+            touch_seconds=embedding_cache_config["disk_touch_seconds"],
+        )
+        if embedding_cache_config["disk_enabled"]
+        else None
+    )
+    return EmbeddingCache(memory_max_entries=embedding_cache_config["memory_max_entries"], disk_store=disk_store)
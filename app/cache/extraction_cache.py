@@ -0,0 +1,219 @@
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from abc import ABC, abstractmethod
+from collections import Counter, OrderedDict
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+from app.config import tavily_extract_cache_config
+from app.metrics import count_cache_lookup
+
+
+def _pack(content: dict[str, Any], compression_level: int) -> tuple[str, bytes]:
+    """Serializes ``content`` and returns its (sha256 digest, zlib-compressed bytes)."""
+    data = json.dumps(content, sort_keys=True, default=str).encode()
+    return hashlib.sha256(data).hexdigest(), zlib.compress(data, compression_level)
+
+
+def _unpack(blob: bytes) -> dict[str, Any]:
+    return json.loads(zlib.decompress(blob))
+
+
+class ExtractionStore(ABC):
+    """
+    Content-addressed storage for extracted pages.
+
+    Each key points at the digest of its compressed content, so pages served identically
+    under several URLs (mirrors, redirects, syndication) are stored once.
+    """
+
+    def __init__(self, max_entries: int, compression_level: int = 6) -> None:
+        self.max_entries = max_entries
+        self.compression_level = compression_level
+
+    @abstractmethod
+    def get(self, key: str) -> dict[str, Any] | None:
+        """Returns the content stored under ``key`` if it has not expired."""
+
+    @abstractmethod
+    def set(self, key: str, content: dict[str, Any], ttl_seconds: float) -> None:
+        """Stores ``content`` for ``ttl_seconds``, evicting the least recently used keys beyond ``max_entries``."""
+
+
+class InMemoryExtractionStore(ExtractionStore):
+    """Size-bounded, per-process LRU store; blobs are dropped once no key references them."""
+
+    def __init__(self, max_entries: int, compression_level: int = 6) -> None:
+        super().__init__(max_entries, compression_level)
+        self._keys: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        self._blobs: dict[str, bytes] = {}
+        self._references: Counter[str] = Counter()
+        self._lock = threading.Lock()
+
+    def _drop(self, key: str) -> None:
+        _, digest = self._keys.pop(key)
+        self._references[digest] -= 1
+        if self._references[digest] <= 0:
+            del self._references[digest]
+            del self._blobs[digest]
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        with self._lock:
+            entry = self._keys.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.time():
+                self._drop(key)
+                return None
+            self._keys.move_to_end(key)
+            blob = self._blobs[entry[1]]
+        return _unpack(blob)
+
+    def set(self, key: str, content: dict[str, Any], ttl_seconds: float) -> None:
+        digest, blob = _pack(content, self.compression_level)
+        with self._lock:
+            if key in self._keys:
+                self._drop(key)
+            self._keys[key] = (time.time() + ttl_seconds, digest)
+            self._blobs.setdefault(digest, blob)
+            self._references[digest] += 1
+            while len(self._keys) > self.max_entries:
+                self._drop(next(iter(self._keys)))
+
+
+class SqliteExtractionStore(ExtractionStore):
+    """SQLite store that survives restarts and is shared by every worker on the host."""
+
+    def __init__(self, max_entries: int, path: str, compression_level: int = 6) -> None:
+        super().__init__(max_entries, compression_level)
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(path, timeout=30, check_same_thread=False, isolation_level=None)
+        self._lock = threading.Lock()
+        with self._lock:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("CREATE TABLE IF NOT EXISTS blobs (digest TEXT PRIMARY KEY, data BLOB NOT NULL)")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS pages ("
+                "key TEXT PRIMARY KEY, digest TEXT NOT NULL, expires_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+            )
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        now = time.time()
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT blobs.data FROM pages JOIN blobs ON blobs.digest = pages.digest "
+                "WHERE pages.key = ? AND pages.expires_at > ?",
+                (key, now),
+            ).fetchone()
+            if row is None:
+                return None
+            self._connection.execute("UPDATE pages SET accessed_at = ? WHERE key = ?", (now, key))
+        return _unpack(row[0])
+
+    def set(self, key: str, content: dict[str, Any], ttl_seconds: float) -> None:
+        now = time.time()
+        digest, blob = _pack(content, self.compression_level)
+        with self._lock:
+            self._connection.execute("INSERT OR IGNORE INTO blobs VALUES (?, ?)", (digest, blob))
+            self._connection.execute(
+                "INSERT OR REPLACE INTO pages VALUES (?, ?, ?, ?)", (key, digest, now + ttl_seconds, now)
+            )
+            self._connection.execute("DELETE FROM pages WHERE expires_at <= ?", (now,))
+            self._connection.execute(
+                "DELETE FROM pages WHERE key NOT IN (SELECT key FROM pages ORDER BY accessed_at DESC LIMIT ?)",
+                (self.max_entries,),
+            )
+            self._connection.execute("DELETE FROM blobs WHERE digest NOT IN (SELECT digest FROM pages)")
+
+
+class ExtractionCache:
+    """
+    Per-URL cache of Tavily extraction results.
+
+    Entries are keyed by URL, ``extract_depth`` and ``include_images``, so a multi-URL
+    extraction only has to fetch the pages that are not cached yet.
+
+    Attributes:
+        hits: URLs served from the cache.
+        misses: URLs that had to be extracted.
+    """
+
+    def __init__(self, store: ExtractionStore, ttl_seconds: float) -> None:
+        self.store = store
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(url: str, extract_depth: str, *, include_images: bool) -> str:
+        """Returns the cache key for extracting ``url`` with the given options."""
+        return hashlib.sha256(json.dumps([url, extract_depth, bool(include_images)]).encode()).hexdigest()
+
+    def get(self, url: str, extract_depth: str, *, include_images: bool) -> dict[str, Any] | None:
+        """
+        Returns the cached extraction result for ``url``, if any.
+
+        Args:
+            url: The normalized URL.
+            extract_depth: The extraction depth ('basic' or 'advanced').
+            include_images: Whether images were extracted.
+
+        Returns:
+            dict | None: The Tavily result for the page, without its ``url``, or None on a miss.
+        """
+        content = self.store.get(self.key(url, extract_depth, include_images=include_images))
+        with self._lock:
+            if content is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        count_cache_lookup("tavily_extract", hit=content is not None)
+        return content
+
+    def set(self, url: str, extract_depth: str, result: dict[str, Any], *, include_images: bool) -> None:
+        """
+        Caches a successful extraction result.
+
+        Args:
+            url: The normalized URL.
+            extract_depth: The extraction depth ('basic' or 'advanced').
+            include_images: Whether images were extracted.
+            result: The Tavily result for the page.
+        """
+        content = {name: value for name, value in result.items() if name != "url"}
+        self.store.set(self.key(url, extract_depth, include_images=include_images), content, self.ttl_seconds)
+
+    def stats(self) -> dict[str, float]:
+        """Returns hit and miss counters and the hit rate."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+
+@lru_cache
+def get_extraction_cache() -> ExtractionCache | None:
+    """
+    Returns the process-wide extraction cache configured by ``tavily_extract_cache_config``.
+
+    Returns:
+        ExtractionCache | None: The cache, or None if it is disabled.
+    """
+    if not tavily_extract_cache_config["enabled"]:
+        return None
+    if tavily_extract_cache_config["backend"] == "sqlite":
+        store = SqliteExtractionStore(
+            max_entries=tavily_extract_cache_config["max_entries"], path=tavily_extract_cache_config["sqlite_path"]
+        )
+    else:
+        store = InMemoryExtractionStore(max_entries=tavily_extract_cache_config["max_entries"])
+    return ExtractionCache(store=store, ttl_seconds=tavily_extract_cache_config["ttl_seconds"])
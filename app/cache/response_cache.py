@@ -0,0 +1,364 @@
+import asyncio
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+from pydantic import BaseModel
+
+from app.clients import get_client_registry
+from app.config import response_cache_config
+from app.metrics import count_cache_lookup
+from app.schemas import ResearchQuery, ResearchResponse
+from app.utils import get_logger
+
+from .embedding_cache import get_embedding_cache
+
+
+class CacheLookup(BaseModel):
+    """Result of a response cache lookup, reused to store the response on a miss."""
+
+    model_config = {"arbitrary_types_allowed": True}
+
+    key: str
+    scope: str
+    vector: np.ndarray | None = None
+    response: dict[str, Any] | None = None
+    match: str | None = None
+    similarity: float | None = None
+    cached_at: float | None = None
+    cached_query: str | None = None
+
+
+class ResponseCacheBackend(ABC):
+    """Storage for cached research responses, keyed by ``ResearchQuery.cache_key()``."""
+
+    def __init__(self, ttl_seconds: float, max_entries: int) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+
+    @abstractmethod
+    def get(self, key: str) -> tuple[dict, str, float] | None:
+        """Returns the (response, query text, creation time) stored under ``key``, if fresh."""
+
+    @abstractmethod
+    def nearest(self, vector: np.ndarray, scope: str) -> tuple[dict, str, float, float] | None:
+        """Returns the most similar fresh entry in ``scope`` as (response, query text, creation time, similarity)."""
+
+    @abstractmethod
+    def set(self, key: str, scope: str, text: str, vector: np.ndarray | None, response: dict) -> None:
+        """Stores a response, evicting the least recently used entries beyond ``max_entries``."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Drops every entry."""
+
+
+def _best_match(vectors: list[np.ndarray], vector: np.ndarray) -> tuple[int, float]:
+    # Vectors are stored L2-normalised, so the dot product is the cosine similarity
+    similarities = np.stack(vectors) @ vector
+    index = int(np.argmax(similarities))
+    return index, float(similarities[index])
+
+
+class InMemoryResponseCacheBackend(ResponseCacheBackend):
+    """Per-process LRU backend."""
+
+    def __init__(self, ttl_seconds: float, max_entries: int) -> None:
+        super().__init__(ttl_seconds, max_entries)
+        self._entries: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _is_fresh(self, entry: dict[str, Any]) -> bool:
+        return time.time() - entry["created_at"] < self.ttl_seconds
+
+    def get(self, key: str) -> tuple[dict, str, float] | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if not self._is_fresh(entry):
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry["response"], entry["text"], entry["created_at"]
+
+    def nearest(self, vector: np.ndarray, scope: str) -> tuple[dict, str, float, float] | None:
+        with self._lock:
+            candidates = [
+                (key, entry)
+                for key, entry in self._entries.items()
+                if entry["scope"] == scope and entry["vector"] is not None and self._is_fresh(entry)
+            ]
+            if not candidates:
+                return None
+            index, similarity = _best_match([entry["vector"] for _, entry in candidates], vector)
+            key, entry = candidates[index]
+            self._entries.move_to_end(key)
+            return entry["response"], entry["text"], entry["created_at"], similarity
+
+    def set(self, key: str, scope: str, text: str, vector: np.ndarray | None, response: dict) -> None:
+        with self._lock:
+            self._entries[key] = {
+                "scope": scope,
+                "text": text,
+                "vector": vector,
+                "response": response,
+                "created_at": time.time(),
+            }
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class SqliteResponseCacheBackend(ResponseCacheBackend):
+    """
+    Disk backend in a SQLite database, shareable by several workers on the same host.
+
+    The database runs in WAL mode so readers in other processes do not block writers.
+    Vectors are stored as float32 blobs.
+    """
+
+    def __init__(self, ttl_seconds: float, max_entries: int, path: str) -> None:
+        super().__init__(ttl_seconds, max_entries)
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(path, timeout=30, check_same_thread=False, isolation_level=None)
+        self._lock = threading.Lock()
+        with self._lock:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    scope TEXT NOT NULL,
+                    text TEXT NOT NULL,
+                    vector BLOB,
+                    response TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                )
+                """
+            )
+            self._connection.execute("CREATE INDEX IF NOT EXISTS responses_scope ON responses (scope, created_at)")
+
+    def _touch(self, key: str) -> None:
+        self._connection.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (time.time(), key))
+
+    def get(self, key: str) -> tuple[dict, str, float] | None:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT response, text, created_at FROM responses WHERE key = ? AND created_at > ?",
+                (key, time.time() - self.ttl_seconds),
+            ).fetchone()
+            if row is None:
+                return None
+            self._touch(key)
+        return json.loads(row[0]), row[1], row[2]
+
+    def nearest(self, vector: np.ndarray, scope: str) -> tuple[dict, str, float, float] | None:
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT key, vector FROM responses WHERE scope = ? AND vector IS NOT NULL AND created_at > ?",
+                (scope, time.time() - self.ttl_seconds),
+            ).fetchall()
+            if not rows:
+                return None
+            index, similarity = _best_match([np.frombuffer(row[1], dtype=np.float32) for row in rows], vector)
+            key = rows[index][0]
+            row = self._connection.execute(
+                "SELECT response, text, created_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._touch(key)
+        return json.loads(row[0]), row[1], row[2], similarity
+
+    def set(self, key: str, scope: str, text: str, vector: np.ndarray | None, response: dict) -> None:
+        now = time.time()
+        blob = vector.astype(np.float32).tobytes() if vector is not None else None
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, scope, text, blob, json.dumps(response, default=str), now, now),
+            )
+            self._connection.execute("DELETE FROM responses WHERE created_at <= ?", (now - self.ttl_seconds,))
+            self._connection.execute(
+                "DELETE FROM responses WHERE key NOT IN (SELECT key FROM responses ORDER BY accessed_at DESC LIMIT ?)",
+                (self.max_entries,),
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._connection.execute("DELETE FROM responses")
+
+
+class ResponseCache:
+    """
+    Cache of final research responses with exact and near-duplicate (semantic) matching.
+
+    Exact hits compare queries the way ``ResearchQuery.__eq__`` does. Semantic hits embed
+    the question and return the most similar cached answer within the same
+    ``additional_params`` scope, if its cosine similarity reaches ``similarity_threshold``.
+    """
+
+    def __init__(
+        self,
+        backend: ResponseCacheBackend,
+        *,
+        semantic: bool = True,
+        similarity_threshold: float = 0.95,
+        embedding_model: str = "text-embedding-3-large",
+    ) -> None:
+        self.backend = backend
+        self.semantic = semantic
+        self.similarity_threshold = similarity_threshold
+        self.embedding_model = embedding_model
+
+    @staticmethod
+    def _text(query: ResearchQuery) -> str:
+        return f"{query.query.strip()}{query.context_info}"
+
+    @staticmethod
+    def _scope(query: ResearchQuery) -> str:
+        canonical = json.dumps(query.additional_params or {}, sort_keys=True, default=str)
+        return hashlib.sha256(canonical.encode()).hexdigest()
+
+    async def _embed(self, text: str) -> np.ndarray | None:
+        embedding_cache = get_embedding_cache()
+        vector = embedding_cache.get(self.embedding_model, text) if embedding_cache else None
+        if vector is None:
+            client = get_client_registry().openai_async_client
+            if client is None:
+                return None
+            try:
+                response = await client.embeddings.create(input=[text], model=self.embedding_model)
+            except Exception as e:  # noqa: BLE001
+                get_logger().warning(f"Response cache embedding failed, using exact matching only: {e}")
+                return None
+            vector = np.asarray(response.data[0].embedding, dtype=np.float32)
+            if embedding_cache:
+                embedding_cache.set(self.embedding_model, text, vector)
+        return vector / (np.linalg.norm(vector) or 1.0)
+
+    async def lookup(self, query: ResearchQuery) -> CacheLookup:
+        """
+        Looks up a cached response for ``query``.
+
+        Args:
+            query: The incoming research query.
+
+        Returns:
+            CacheLookup: The lookup; ``response`` is set on a hit. Pass it to ``store`` on a miss.
+        """
+        lookup = await self._lookup(query)
+        count_cache_lookup("response", hit=lookup.response is not None)
+        return lookup
+
+    async def _lookup(self, query: ResearchQuery) -> CacheLookup:
+        lookup = CacheLookup(key=query.cache_key(), scope=self._scope(query))
+        hit = await asyncio.to_thread(self.backend.get, lookup.key)
+        if hit is not None:
+            lookup.response, lookup.cached_query, lookup.cached_at = hit
+            lookup.match = "exact"
+            return lookup
+        if not self.semantic:
+            return lookup
+
+        lookup.vector = await self._embed(self._text(query))
+        if lookup.vector is None:
+            return lookup
+        hit = await asyncio.to_thread(self.backend.nearest, lookup.vector, lookup.scope)
+        if hit is not None and hit[3] >= self.similarity_threshold:
+            lookup.response, lookup.cached_query, lookup.cached_at, lookup.similarity = hit
+            lookup.match = "semantic"
+        return lookup
+
+    async def store(self, query: ResearchQuery, response: ResearchResponse, lookup: CacheLookup) -> None:
+        """
+        Stores the response produced for a cache miss.
+
+        Args:
+            query: The research query that was answered.
+            response: The crew's response.
+            lookup: The lookup returned by ``lookup`` for this query.
+        """
+        await asyncio.to_thread(
+            self.backend.set,
+            lookup.key,
+            lookup.scope,
+            self._text(query),
+            lookup.vector,
+            response.model_dump(mode="json"),
+        )
+
+    @staticmethod
+    def mark_miss(response: ResearchResponse) -> None:
+        """Flags a freshly produced (and stored) response as not cached, mirroring ``build_response``."""
+        response.metadata = {**(response.metadata or {}), "cache": {"hit": False}}
+
+    @staticmethod
+    def build_response(lookup: CacheLookup, processing_time: float) -> ResearchResponse:
+        """
+        Builds the response for a cache hit, flagged as cached in its metadata.
+
+        Args:
+            lookup: A lookup that hit.
+            processing_time: Time actually spent serving this request, in seconds.
+
+        Returns:
+            ResearchResponse: The cached response.
+        """
+        response = ResearchResponse(**lookup.response)
+        response.processing_time = processing_time
+        response.metadata = {
+            **(response.metadata or {}),
+            "cache": {
+                "hit": True,
+                "match": lookup.match,
+                "similarity": lookup.similarity,
+                "cached_at": lookup.cached_at,
+                "cached_query": lookup.cached_query,
+                "original_processing_time": lookup.response.get("processing_time"),
+            },
+        }
+        return response
+
+
+@lru_cache
+def get_response_cache() -> ResponseCache | None:
+    """
+    Returns the process-wide response cache configured by ``response_cache_config``.
+
+    Returns:
+        ResponseCache | None: The cache, or None if it is disabled.
+    """
+    if not response_cache_config["enabled"]:
+        return None
+    if response_cache_config["backend"] == "sqlite":
+        backend = SqliteResponseCacheBackend(
+            ttl_seconds=response_cache_config["ttl_seconds"],
+            max_entries=response_cache_config["max_entries"],
+            path=response_cache_config["sqlite_path"],
+        )
+    else:
+        backend = InMemoryResponseCacheBackend(
+            ttl_seconds=response_cache_config["ttl_seconds"],
+            max_entries=response_cache_config["max_entries"],
+        )
+    return ResponseCache(
+        backend=backend,
+        semantic=response_cache_config["semantic"],
+        similarity_threshold=response_cache_config["similarity_threshold"],
+        embedding_model=response_cache_config["embedding_model"],
+    )
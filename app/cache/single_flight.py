@@ -0,0 +1,81 @@
+import asyncio
+import threading
+from collections.abc import Awaitable, Callable
+from concurrent.futures import Future
+from functools import lru_cache
+from typing import Any
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent identical calls, so each key is computed once while it is in flight.
+
+    The first caller of a key runs the call; callers arriving before it finishes wait for
+    its result (or exception) instead of repeating it. Sync callers in crewAI's worker
+    threads and async callers on any event loop share the same flights.
+
+    Attributes:
+        coalesced: Number of calls served by another caller's flight.
+    """
+
+    def __init__(self) -> None:
+        self.coalesced = 0
+        self._flights: dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    def join(self, key: str) -> tuple[Future, bool]:
+        """Returns the flight for ``key`` and whether the caller leads it."""
+        with self._lock:
+            flight = self._flights.get(key)
+            if flight is not None:
+                self.coalesced += 1
+                return flight, False
+            flight = self._flights[key] = Future()
+            return flight, True
+
+    def land(self, key: str, flight: Future, result: Any = None, error: BaseException | None = None) -> None:
+        """Ends the flight for ``key``, handing its result or error to every waiting caller."""
+        with self._lock:
+            self._flights.pop(key, None)
+        if error is not None:
+            flight.set_exception(error)
+        else:
+            flight.set_result(result)
+
+    def do(self, key: str, fn: Callable[[], Any]) -> Any:
+        """Returns ``fn()``, sharing the call with concurrent callers of ``key``."""
+        flight, leader = self.join(key)
+        if not leader:
+            return flight.result()
+        try:
+            result = fn()
+        except BaseException as e:
+            self.land(key, flight, error=e)
+            raise
+        self.land(key, flight, result)
+        return result
+
+    async def ado(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """Returns ``await fn()``, sharing the call with concurrent callers of ``key``."""
+        flight, leader = self.join(key)
+        if not leader:
+            # Shielded, so a waiter cancelled by its own deadline does not cancel the shared flight
+            return await asyncio.shield(asyncio.wrap_future(flight))
+        try:
+            result = await fn()
+        except BaseException as e:
+            self.land(key, flight, error=e)
+            raise
+        self.land(key, flight, result)
+        return result
+
+
+@lru_cache
+def get_single_flight() -> SingleFlight:
+    """
+    Returns the process-wide single-flight group shared by the retrieval tools.
+
+    Returns:
+        SingleFlight: The shared group; keys must be namespaced by their callers.
+    """
+    return SingleFlight()
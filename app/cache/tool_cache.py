@@ -0,0 +1,210 @@
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from abc import ABC, abstractmethod
+from collections import Counter, OrderedDict
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+from app.config import tavily_cache_config
+from app.metrics import count_cache_lookup
+
+from .embedding_cache import normalize_text
+
+# Parameters that change how a call is made, not what it returns
+IGNORED_PARAMS = frozenset({"timeout"})
+# Parameters compared case-insensitively
+CASELESS_PARAMS = frozenset({"query", "include_domains", "exclude_domains"})
+
+
+class ToolCacheBackend(ABC):
+    """Key-value storage with per-entry expiry for tool call results."""
+
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max_entries
+
+    @abstractmethod
+    def get(self, key: str) -> Any | None:
+        """Returns the value stored under ``key`` if it has not expired."""
+
+    @abstractmethod
+    def set(self, key: str, value: Any, ttl_seconds: float) -> None:
+        """Stores ``value`` for ``ttl_seconds``, evicting the least recently used entries beyond ``max_entries``."""
+
+
+class InMemoryToolCacheBackend(ToolCacheBackend):
+    """Size-bounded, per-process LRU backend."""
+
+    def __init__(self, max_entries: int) -> None:
+        super().__init__(max_entries)
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Any | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, ttl_seconds: float) -> None:
+        with self._lock:
+            self._entries[key] = (time.time() + ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+class DiskToolCacheBackend(ToolCacheBackend):
+    """
+    SQLite backend storing zlib-compressed JSON, so cached results survive restarts
+    and are shared by every worker on the host.
+    """
+
+    def __init__(self, max_entries: int, path: str, compression_level: int = 6) -> None:
+        super().__init__(max_entries)
+        self.compression_level = compression_level
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(path, timeout=30, check_same_thread=False, isolation_level=None)
+        self._lock = threading.Lock()
+        with self._lock:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                "key TEXT PRIMARY KEY, value BLOB NOT NULL, expires_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+            )
+
+    def get(self, key: str) -> Any | None:
+        now = time.time()
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT value FROM results WHERE key = ? AND expires_at > ?", (key, now)
+            ).fetchone()
+            if row is None:
+                return None
+            self._connection.execute("UPDATE results SET accessed_at = ? WHERE key = ?", (now, key))
+        return json.loads(zlib.decompress(row[0]))
+
+    def set(self, key: str, value: Any, ttl_seconds: float) -> None:
+        now = time.time()
+        blob = zlib.compress(json.dumps(value, default=str).encode(), self.compression_level)
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?)", (key, blob, now + ttl_seconds, now)
+            )
+            self._connection.execute("DELETE FROM results WHERE expires_at <= ?", (now,))
+            self._connection.execute(
+                "DELETE FROM results WHERE key NOT IN (SELECT key FROM results ORDER BY accessed_at DESC LIMIT ?)",
+                (self.max_entries,),
+            )
+
+
+class ToolResultCache:
+    """
+    Cache of tool call results shared across crews, keyed by normalized call parameters.
+
+    Entries expire after a TTL chosen per call: ``topic`` picks the base TTL (so news
+    expires faster than general results) and a ``time_range`` TTL, when shorter, caps it.
+
+    Attributes:
+        hits: Lookups served from the cache, per namespace.
+        misses: Lookups that went to the network, per namespace.
+    """
+
+    def __init__(
+        self,
+        backend: ToolCacheBackend,
+        ttl_seconds: dict[str, float],
+        time_range_ttl_seconds: dict[str, float] | None = None,
+    ) -> None:
+        self.backend = backend
+        self.ttl_seconds = ttl_seconds
+        self.time_range_ttl_seconds = time_range_ttl_seconds or {}
+        self.hits: Counter[str] = Counter()
+        self.misses: Counter[str] = Counter()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _normalize(value: Any) -> Any:
+        if isinstance(value, str):
+            return normalize_text(value)
+        if isinstance(value, dict):
+            return {key: ToolResultCache._normalize(item) for key, item in value.items()}
+        if isinstance(value, list | tuple):
+            return [ToolResultCache._normalize(item) for item in value]
+        return value
+
+    def key(self, namespace: str, params: dict[str, Any]) -> str:
+        """Returns the cache key for a call to ``namespace`` with ``params``."""
+        normalized = {
+            name: self._normalize(value)
+            for name, value in params.items()
+            if name not in IGNORED_PARAMS and value is not None
+        }
+        for name in CASELESS_PARAMS & normalized.keys():
+            value = normalized[name]
+            normalized[name] = value.casefold() if isinstance(value, str) else sorted(v.casefold() for v in value)
+        canonical = json.dumps([namespace, normalized], sort_keys=True, default=str)
+        return hashlib.sha256(canonical.encode()).hexdigest()
+
+    def ttl_for(self, namespace: str, params: dict[str, Any]) -> float:
+        """Returns the TTL in seconds for a call to ``namespace`` with ``params``."""
+        ttl = self.ttl_seconds.get(params.get("topic") or namespace, self.ttl_seconds["default"])
+        time_range = params.get("time_range")
+        if time_range in self.time_range_ttl_seconds:
+            ttl = min(ttl, self.time_range_ttl_seconds[time_range])
+        return ttl
+
+    def get(self, namespace: str, params: dict[str, Any]) -> Any | None:
+        value = self.backend.get(self.key(namespace, params))
+        with self._lock:
+            (self.misses if value is None else self.hits)[namespace] += 1
+        count_cache_lookup(f"tavily_{namespace}", hit=value is not None)
+        return value
+
+    def set(self, namespace: str, params: dict[str, Any], value: Any) -> None:
+        self.backend.set(self.key(namespace, params), value, self.ttl_for(namespace, params))
+
+    def stats(self) -> dict[str, dict[str, float]]:
+        """Returns hits, misses and hit rate per namespace."""
+        with self._lock:
+            return {
+                namespace: {
+                    "hits": self.hits[namespace],
+                    "misses": self.misses[namespace],
+                    "hit_rate": self.hits[namespace] / (self.hits[namespace] + self.misses[namespace]),
+                }
+                for namespace in self.hits.keys() | self.misses.keys()
+            }
+
+
+@lru_cache
+def get_tavily_result_cache() -> ToolResultCache | None:
+    """
+    Returns the process-wide Tavily result cache configured by ``tavily_cache_config``.
+
+    Returns:
+        ToolResultCache | None: The cache, or None if it is disabled.
+    """
+    if not tavily_cache_config["enabled"]:
+        return None
+    if tavily_cache_config["backend"] == "disk":
+        backend = DiskToolCacheBackend(
+            max_entries=tavily_cache_config["max_entries"], path=tavily_cache_config["disk_path"]
+        )
+    else:
+        backend = InMemoryToolCacheBackend(max_entries=tavily_cache_config["max_entries"])
+    return ToolResultCache(
+        backend=backend,
+        ttl_seconds=tavily_cache_config["ttl_seconds"],
+        time_range_ttl_seconds=tavily_cache_config["time_range_ttl_seconds"],
+    )
@@ -0,0 +1,256 @@
+import asyncio
+import inspect
+import threading
+from collections.abc import Callable, Coroutine
+from concurrent.futures import Future
+from typing import Any
+
+from .config import (
+    onnx_embedding_config,
+    openai_client_pool_config,
+    qdrant_client_pool_config,
+    qdrant_vector_search_tool_config,
+    tavily_client_pool_config,
+    tavily_rate_limit_config,
+)
+from .rate_limiter import TokenBucketRateLimiter
+from .utils import get_env_variable, get_logger
+
+
+def _httpx_limits(pool_config: dict) -> Any:
+    import httpx
+
+    return httpx.Limits(**pool_config)
+
+
+class BackgroundLoop:
+    """
+    Event loop running on a daemon thread.
+
+    crewAI calls tools synchronously from worker threads, each of which would otherwise need
+    its own event loop. Async clients bound to this loop keep one connection pool that both
+    sync tool calls and coroutines on other loops can use.
+    """
+
+    def __init__(self) -> None:
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self.loop.run_forever, name="client-registry-loop", daemon=True)
+        self._thread.start()
+
+    def submit(self, coro: Coroutine) -> Future:
+        """Schedules ``coro`` on the loop and returns its concurrent future."""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def run(self, coro: Coroutine, timeout: float | None = None) -> Any:
+        """Runs ``coro`` on the loop, blocking the calling thread until it finishes."""
+        return self.submit(coro).result(timeout=timeout)
+
+    async def arun(self, coro: Coroutine) -> Any:
+        """Runs ``coro`` on the loop and awaits it from the caller's loop."""
+        if asyncio.get_running_loop() is self.loop:
+            return await coro
+        return await asyncio.wrap_future(self.submit(coro))
+
+    def stop(self) -> None:
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join(timeout=5)
+        self.loop.close()
+
+
+class ClientRegistry:
+    """
+    Process-wide holder of the long-lived API clients shared by every crew.
+
+    Clients are created on first use and reuse keep-alive connection pools sized by the
+    ``*_client_pool_config`` settings, so building a crew no longer opens new sockets.
+    """
+
+    # Clients whose connections live on the background loop and must be closed there
+    LOOP_BOUND_CLIENTS = frozenset({"async_tavily"})
+
+    def __init__(self) -> None:
+        self._clients: dict[str, Any] = {}
+        self._lock = threading.RLock()
+        self._background_loop: BackgroundLoop | None = None
+
+    @property
+    def background_loop(self) -> BackgroundLoop:
+        """The loop owning the async Tavily client, started on first use."""
+        with self._lock:
+            if self._background_loop is None:
+                self._background_loop = BackgroundLoop()
+            return self._background_loop
+
+    def _get_or_create(self, name: str, factory: Callable[[], Any]) -> Any:
+        client = self._clients.get(name)
+        if client is not None:
+            return client
+        with self._lock:
+            if name not in self._clients:
+                self._clients[name] = factory()
+                get_logger().debug(f"Created shared client '{name}'")
+            return self._clients[name]
+
+    def register(self, name: str, client: Any) -> None:
+        """Uses ``client`` as the shared client ``name`` (e.g. ``"tavily"``) instead of creating one."""
+        with self._lock:
+            self._clients[name] = client
+
+    @property
+    def tavily_rate_limiter(self) -> TokenBucketRateLimiter:
+        """The rate limiter shared by the sync and async Tavily clients."""
+        return self._get_or_create(
+            "tavily_rate_limiter",
+            lambda: TokenBucketRateLimiter.per_minute(
+                tavily_rate_limit_config["requests_per_minute"], tavily_rate_limit_config["burst"]
+            ),
+        )
+
+    def _tavily_client_kwargs(self) -> dict[str, Any]:
+        return {
+            "api_key": get_env_variable("TAVILY_API_KEY"),
+            "rate_limiter": self.tavily_rate_limiter,
+            "max_retries": tavily_rate_limit_config["max_retries"],
+            "retry_backoff": tavily_rate_limit_config["retry_backoff"],
+            **tavily_client_pool_config,
+        }
+
+    @property
+    def tavily_client(self) -> Any:
+        def factory() -> Any:
+            from .temp.tavily_pooled_client import PooledTavilyClient
+
+            return PooledTavilyClient(**self._tavily_client_kwargs())
+
+        return self._get_or_create("tavily", factory)
+
+    @property
+    def async_tavily_client(self) -> Any:
+        def factory() -> Any:
+            from .temp.tavily_pooled_client import PooledAsyncTavilyClient
+
+            return PooledAsyncTavilyClient(**self._tavily_client_kwargs())
+
+        return self._get_or_create("async_tavily", factory)
+
+    @property
+    def qdrant_client(self) -> Any:
+        def factory() -> Any:
+            from qdrant_client import QdrantClient
+
+            return QdrantClient(
+                url=qdrant_vector_search_tool_config["qdrant_url"],
+                api_key=qdrant_vector_search_tool_config["qdrant_api_key"] or None,
+                limits=_httpx_limits(qdrant_client_pool_config),
+            )
+
+        return self._get_or_create("qdrant", factory)
+
+    @property
+    def async_qdrant_client(self) -> Any:
+        def factory() -> Any:
+            from qdrant_client import AsyncQdrantClient
+
+            return AsyncQdrantClient(
+                url=qdrant_vector_search_tool_config["qdrant_url"],
+                api_key=qdrant_vector_search_tool_config["qdrant_api_key"] or None,
+                limits=_httpx_limits(qdrant_client_pool_config),
+            )
+
+        return self._get_or_create("async_qdrant", factory)
+
+    @property
+    def openai_client(self) -> Any | None:
+        """The shared OpenAI client, or None if ``OPENAI_API_KEY`` is not set."""
+        api_key = get_env_variable("OPENAI_API_KEY")
+        if not api_key:
+            return None
+
+        def factory() -> Any:
+            import httpx
+            from openai import Client
+
+            return Client(api_key=api_key, http_client=httpx.Client(limits=_httpx_limits(openai_client_pool_config)))
+
+        return self._get_or_create("openai", factory)
+
+    @property
+    def openai_async_client(self) -> Any | None:
+        """The shared async OpenAI client, or None if ``OPENAI_API_KEY`` is not set."""
+        api_key = get_env_variable("OPENAI_API_KEY")
+        if not api_key:
+            return None
+
+        def factory() -> Any:
+            import httpx
+            from openai import AsyncClient
+
+            return AsyncClient(
+                api_key=api_key,
+                http_client=httpx.AsyncClient(limits=_httpx_limits(openai_client_pool_config)),
+            )
+
+        return self._get_or_create("openai_async", factory)
+
+    @property
+    def onnx_embedder(self) -> Any:
+        """The shared ONNX embedder; its batcher and inference threads stop when the registry closes."""
+
+        def factory() -> Any:
+            from .embeddings import OnnxEmbedder
+
+            return OnnxEmbedder(
+                model_path=onnx_embedding_config["model_path"],
+                max_batch_size=onnx_embedding_config["max_batch_size"],
+                max_wait=onnx_embedding_config["max_wait_ms"] / 1000,
+                workers=onnx_embedding_config["workers"],
+                intra_op_threads=onnx_embedding_config["intra_op_threads"],
+                max_length=onnx_embedding_config["max_length"],
+                pooling=onnx_embedding_config["pooling"],
+                normalize=onnx_embedding_config["normalize"],
+            )
+
+        return self._get_or_create("onnx_embedder", factory)
+
+    async def aclose(self) -> None:
+        """Closes every client created so far, releasing their connection pools."""
+        with self._lock:
+            clients, self._clients = self._clients, {}
+            background_loop, self._background_loop = self._background_loop, None
+        for name, client in clients.items():
+            try:
+                close = getattr(client, "aclose", None) or getattr(client, "close", None)
+                result = close() if close else None
+                if inspect.isawaitable(result):
+                    if name in self.LOOP_BOUND_CLIENTS and background_loop is not None:
+                        await background_loop.arun(result)
+                    else:
+                        await result
+            except Exception as e:  # noqa: BLE001
+                get_logger().warning(f"Failed to close shared client '{name}': {e}")
+        if background_loop is not None:
+            background_loop.stop()
+
+
+_client_registry: ClientRegistry | None = None
+
+
+def get_client_registry() -> ClientRegistry:
+    """
+    Returns the process-wide client registry, creating it if the app lifespan has not.
+
+    Returns:
+        ClientRegistry: The shared registry.
+    """
+    global _client_registry  # noqa: PLW0603
+    if _client_registry is None:
+        _client_registry = ClientRegistry()
+    return _client_registry
+
+
+async def close_client_registry() -> None:
+    """Closes the process-wide client registry, if one was created."""
+    global _client_registry  # noqa: PLW0603
+    if _client_registry is not None:
+        await _client_registry.aclose()
+        _client_registry = None
@@ -6,8 +6,260 @@ qdrant_vector_search_tool_config = {
     "score_threshold": 0.5,
     "qdrant_url": get_env_variable("QDRANT_URL"),
     "qdrant_api_key": get_env_variable("QDRANT_API_KEY"),
+    # "openai" (text-embedding-3-large) or "onnx" (the local model of onnx_embedding_config).
+    # The collection's vectors must come from the same model.
+    "embedding_backend": "openai",
+}
+# Local ONNX sentence-embedding model: a directory with model.onnx and tokenizer.json.
+# Concurrent queries are micro-batched (up to max_batch_size, waiting at most max_wait_ms)
+# and run on `workers` inference threads of intra_op_threads CPU threads each.
+onnx_embedding_config = {
+    "model_path": get_env_variable("ONNX_EMBEDDING_MODEL_PATH") or "models/all-MiniLM-L6-v2",
+    "max_batch_size": 32,
+    "max_wait_ms": 5,
+    "workers": 1,
+    "intra_op_threads": 2,
+    "max_length": 256,
+    "pooling": "mean",
+    "normalize": True,
 }
 AGENT_VERBOSE = True
 CREW_VERBOSE = True
+# Build the crew once and clone it per request instead of rebuilding every agent and task
+CREW_TEMPLATE_MODE = True
+# "dag" runs each crew task as soon as the tasks in its context are done, up to
+# max_parallelism at once; "sequential" keeps crewAI's one-after-another process
+crew_scheduler_config = {
+    "mode": "dag",
+    "max_parallelism": 3,
+}
+# Where crew task outputs go: "disabled", "memory" (returned under the response's
+# metadata["artifacts"], and so in job results) or "directory" (written in the background
+# to <directory>/<request id>/<task>.txt). Uncollected requests beyond max_requests are dropped.
+artifact_config = {
+    "backend": "directory",
+    "directory": "out",
+    "flush_interval_seconds": 0.5,
+    "max_requests": 256,
+}
+# Latency histogram buckets of the Prometheus /metrics endpoint. With request_breakdown,
+# each response's metadata["metrics"] also reports its own stage latencies, tokens and cache lookups.
+metrics_config = {
+    "latency_buckets_seconds": [0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0],
+    "request_breakdown": True,
+}
+# Token budgets of the contexts assembled for the filtering and synthesis tasks, by task name.
+# Earlier outputs are truncated and ranked by relevance to fit. Tasks without a budget, and
+# with no near-duplicate elimination or pre-filter either, get crewAI's full context. Tokens
+# are counted with the tiktoken encoding, or estimated offline.
+# The outputs pinned for a task (the curated data of the synthesis) are kept first, unranked.
+context_budget_config = {
+    "enabled": True,
+    "budgets": {
+        "Strict Relevance Filtering and Data Curation": 6000,
+        "Final Report Synthesis with Citations": 8000,
+    },
+    "pinned": {
+        "Final Report Synthesis with Citations": ["Strict Relevance Filtering and Data Curation"],
+    },
+    "max_chunk_tokens": 600,
+    "encoding": "cl100k_base",
+}
+# Near-duplicate paragraphs (mirrors, syndicated articles, overlapping chunks) dropped from the
+# contexts of the listed tasks before ranking, whether or not they have a budget: MinHash
+# signatures of shingle_size-word shingles, split into LSH bands, with an estimated Jaccard
+# similarity of at least threshold. The attribution of a dropped paragraph is merged into the
+# one that is kept.
+near_duplicate_config = {
+    "enabled": True,
+    "threshold": 0.75,
+    "shingle_size": 3,
+    "num_perm": 128,
+    "bands": 32,
+    "tasks": ["Strict Relevance Filtering and Data Curation", "Final Report Synthesis with Citations"],
+}
+# Embedding pre-filter in front of the LLM relevance filter: the query and every passage of
+# the listed tasks' contexts are embedded in one batch (with the search tools' embedding
+# backend and cache) and scored by cosine similarity. Passages below threshold or outside
+# the top_k are dropped, keeping at least min_keep; with label_scores, the rest are labelled
+# with their score ("[relevance 0.83] ...") so the LLM filter sees how close each one is.
+relevance_prefilter_config = {
+    "enabled": True,
+    "tasks": ["Strict Relevance Filtering and Data Curation"],
+    "threshold": 0.25,
+    "top_k": 40,
+    "min_keep": 5,
+    "label_scores": True,
+}
 tavily_search_tool_config = {}
 tavily_extractor_tool_config = {}
+tavily_multi_search_tool_config = {
+    "max_concurrency": 5,
+    "deadline": 30.0,
+}
+
+# Connection pool sizes for the long-lived clients held by the client registry
+tavily_client_pool_config = {
+    "max_connections": 20,
+    "max_keepalive_connections": 10,
+    "keepalive_expiry": 30.0,
+}
+qdrant_client_pool_config = {
+    "max_connections": 20,
+    "max_keepalive_connections": 10,
+    "keepalive_expiry": 30.0,
+}
+# Shared across every Tavily client in the process; requests queue instead of failing when it runs dry
+tavily_rate_limit_config = {
+    "requests_per_minute": 100,
+    "burst": 10,
+    "max_retries": 3,
+    "retry_backoff": 1.0,
+}
+openai_client_pool_config = {
+    "max_connections": 20,
+    "max_keepalive_connections": 10,
+    "keepalive_expiry": 30.0,
+}
+
+# Response cache in front of /api/v1/research-navigator ("memory" or "sqlite" backend)
+response_cache_config = {
+    "enabled": True,
+    "backend": "memory",
+    "ttl_seconds": 6 * 60 * 60,
+    "max_entries": 1024,
+    "semantic": True,
+    "similarity_threshold": 0.95,
+    "embedding_model": "text-embedding-3-large",
+    "sqlite_path": ".cache/research_responses.sqlite3",
+}
+
+# Two-tier (memory LRU + memory-mapped disk store) cache for query embeddings.
+# The disk store keeps up to disk_max_entries vectors per model, reusing the rows of the
+# least recently used ones beyond that (None for no bound). A disk hit records its use time
+# at most once per disk_touch_seconds, so hot keys don't write to the index on every lookup.
+embedding_cache_config = {
+    "enabled": True,
+    "memory_max_entries": 4096,
+    "disk_enabled": True,
+    "disk_path": ".cache/embeddings",
+    "disk_max_entries": 50_000,
+    "disk_touch_seconds": 60.0,
+}
+
+# TTL result cache for Tavily search calls ("memory" or "disk" backend).
+# TTLs are picked by topic and capped by the time_range TTL.
+tavily_cache_config = {
+    "enabled": True,
+    "backend": "memory",
+    "max_entries": 2048,
+    "disk_path": ".cache/tavily_results.sqlite3",
+    "ttl_seconds": {
+        "default": 6 * 60 * 60,
+        "general": 6 * 60 * 60,
+        "news": 15 * 60,
+        "finance": 30 * 60,
+    },
+    "time_range_ttl_seconds": {
+        "day": 15 * 60,
+        "week": 60 * 60,
+        "month": 6 * 60 * 60,
+        "year": 24 * 60 * 60,
+    },
+}
+
+# Per-URL, content-addressed cache of Tavily extractions ("memory" or "sqlite" backend)
+tavily_extract_cache_config = {
+    "enabled": True,
+    "backend": "memory",
+    "ttl_seconds": 24 * 60 * 60,
+    "max_entries": 4096,
+    "sqlite_path": ".cache/tavily_extracts.sqlite3",
+}
+
+# Server-sent events variant of /api/v1/research-navigator
+streaming_config = {
+    "stream_synthesis_tokens": True,
+    "heartbeat_seconds": 15.0,
+}
+
+# Background research jobs ("memory" or "sqlite" store; use "sqlite" to share the queue between API workers)
+job_config = {
+    "enabled": True,
+    "backend": "memory",
+    "sqlite_path": ".cache/research_jobs.sqlite3",
+    "workers": 2,
+    "poll_interval_seconds": 1.0,
+    "retention_seconds": 24 * 60 * 60,
+}
+
+# Batch research endpoint: queries per request and crews run concurrently per batch
+batch_config = {
+    "max_queries": 50,
+    "max_concurrency": 4,
+}
+
+# Fail-fast relevancy check run with a small model before the full crew is built.
+# Verdicts are cached per normalized query; on timeout or error the full crew decides.
+# A timed-out check can't be cancelled and runs on until the model's own timeout, so at
+# most max_pending_checks run at once; queries beyond that go straight to the full crew.
+relevancy_precheck_config = {
+    "enabled": True,
+    "model": "gpt-4o-mini",
+    "timeout_seconds": 0.8,
+    "max_pending_checks": 8,
+    "cache_ttl_seconds": 24 * 60 * 60,
+    "cache_max_entries": 4096,
+}
+
+# Record/replay of external calls, usually set through the replay CLI. "record" stores every
+# LLM, embedding, Tavily and Qdrant call in <fixtures_dir>/<kind>.jsonl; "replay" answers
+# them from there, waiting the recorded latency times latency_scale. Qdrant's host comes
+# from QDRANT_URL; calls to other hosts go out as usual.
+replay_config = {
+    "mode": get_env_variable("REPLAY_MODE") or "off",
+    "fixtures_dir": get_env_variable("REPLAY_FIXTURES_DIR") or "fixtures/replay",
+    "latency_scale": float(get_env_variable("REPLAY_LATENCY_SCALE") or 1.0),
+    "hosts": {
+        "openai": ["api.openai.com"],
+        "tavily": ["api.tavily.com"],
+    },
+}
+
+# Background warm-up started by the app lifespan; /ready answers 503 until it is done.
+# It imports crewAI, creates the shared clients, builds the crew template (with
+# CREW_TEMPLATE_MODE) and the relevancy precheck, and loads up to preload_embeddings
+# disk-cached embeddings into memory. Disabled, all of that happens on first use.
+warmup_config = {
+    "enabled": True,
+    "clients": True,
+    "crew": True,
+    "preload_embeddings": 4096,
+}
+
+# LangSmith tracing of the @traceable crew factories and callbacks. "off" leaves them
+# unwrapped; "sampled" traces sample_rate of the requests, chosen as they start;
+# "errors_and_slow" traces every request but only exports those that fail (including
+# rejected questions) or take slow_threshold_seconds or more. Runs are exported in
+# batches from a background thread, and dropped when max_queue_size are pending.
+tracing_config = {
+    "mode": "sampled",
+    "sample_rate": 0.1,
+    "slow_threshold_seconds": 120.0,
+    "batch_size": 100,
+    "flush_interval_seconds": 2.0,
+    "max_queue_size": 10_000,
+}
+
+# Bulk ingestion into qdrant_vector_search_tool_config's collection (the ingest CLI).
+# Documents are split into chunks of at most chunk_size characters; chunks whose content
+# hash is already stored are skipped, the rest are embedded and upserted batch_size at a
+# time by max_in_flight threads, and reading pauses while that many batches are pending.
+ingest_config = {
+    "chunk_size": 1200,
+    "chunk_overlap": 200,
+    "batch_size": 128,
+    "max_in_flight": 4,
+    "max_retries": 3,
+    "file_patterns": ["*.txt", "*.md", "*.markdown", "*.rst"],
+}
@@ -0,0 +1,127 @@
+import contextvars
+import threading
+import time
+import uuid
+from concurrent.futures import Future
+from copy import copy as shallow_copy
+from typing import Any
+
+from crewai import Crew, CrewOutput, Task, TaskOutput
+from pydantic import Field, PrivateAttr
+
+from app.metrics import RequestMetrics, observe_stage, record_token_usage, register_crew_event_handlers, track_request
+
+# crewAI fields a copy gets its own clones of, rather than the dumped values
+CLONED_CREW_FIELDS = {"id", "agents", "tasks", "knowledge_sources", "knowledge", "manager_agent", "manager_llm"}
+
+
+class ResearchTask(Task):
+    """
+    Task whose asynchronous runs keep the context of the crew that started them.
+
+    crewAI runs ``async_execution`` tasks of a sequential crew on a bare thread, which loses
+    context variables such as the request metrics and trace; this one starts the thread in
+    a copy of the caller's context, as ``DagCrew`` does for every task it schedules.
+    """
+
+    def execute_async(
+        self, agent: Any = None, context: str | None = None, tools: list[Any] | None = None
+    ) -> Future[TaskOutput]:
+        future: Future[TaskOutput] = Future()
+        threading.Thread(
+            daemon=True,
+            target=contextvars.copy_context().run,
+            args=(self._execute_task_async, agent, context, tools, future),
+        ).start()
+        return future
+
+
+class ResearchCrew(Crew):
+    """
+    Crew serving a single research request.
+
+    Contexts of the filtering and synthesis tasks are built by ``context_assembler``, and each
+    task's output is handed to ``artifact_sink`` under the request's id rather than written
+    to a shared file. Task, tool and LLM latencies and token usage of each kickoff are
+    recorded in ``request_metrics`` as well as in the process-wide metrics.
+
+    Attributes:
+        request_id: Id that namespaces the request's artifacts.
+        artifact_sink: Destination of task outputs, or None to keep none.
+        context_assembler: Assembler of the contexts it handles, or None to use crewAI's full contexts.
+        context_report: Tokens saved by each budgeted task in the last run, by task name.
+        request_metrics: Latencies, tokens and cache lookups of the request.
+    """
+
+    request_id: str = Field(default_factory=lambda: uuid.uuid4().hex, description="Id of the request.")
+    artifact_sink: Any = Field(default=None, description="Destination of task outputs.")
+    context_assembler: Any = Field(default=None, description="Assembler of task contexts.")
+    context_report: dict[str, Any] = Field(default_factory=dict, description="Tokens saved per task.")
+    request_metrics: Any = Field(default_factory=RequestMetrics, description="Metrics of the request.")
+    _task_started_at: dict[int, float] = PrivateAttr(default_factory=dict)
+
+    def _copy_fields(self) -> dict[str, Any]:
+        """Returns the fields a copy shares with this crew beyond crewAI's; per-request fields start afresh."""
+        return {"artifact_sink": self.artifact_sink, "context_assembler": self.context_assembler}
+
+    def copy(self) -> "ResearchCrew":
+        """
+        Creates a deep copy of the crew for a new request, keeping its class and collaborators.
+
+        Agents and tasks are cloned as ``Crew.copy`` does, with each task's context pointing
+        at the cloned tasks, and the copy is validated as this crew's class.
+        """
+        agents = [agent.copy() for agent in self.agents]
+        tasks: list[Task] = []
+        task_mapping: dict[str, Task] = {}
+        for task in self.tasks:
+            tasks.append(task.copy(agents, task_mapping))
+            task_mapping[task.key] = tasks[-1]
+        for cloned, original in zip(tasks, self.tasks, strict=True):
+            if original.context:
+                cloned.context = [task_mapping[context_task.key] for context_task in original.context]
+
+        crew_data = self.model_dump(include=set(Crew.model_fields) - CLONED_CREW_FIELDS)
+        return type(self).model_validate(
+            {
+                **{name: value for name, value in crew_data.items() if value is not None},
+                "agents": agents,
+                "tasks": tasks,
+                "knowledge_sources": shallow_copy(self.knowledge_sources),
+                "knowledge": shallow_copy(self.knowledge),
+                "manager_agent": self.manager_agent.copy() if self.manager_agent else None,
+                "manager_llm": shallow_copy(self.manager_llm) if self.manager_llm else None,
+                **self._copy_fields(),
+            }
+        )
+
+    def kickoff(self, inputs: dict[str, Any] | None = None) -> CrewOutput:
+        register_crew_event_handlers()
+        with track_request(self.request_metrics):
+            output = super().kickoff(inputs=inputs)
+            record_token_usage(output.token_usage)
+        return output
+
+    def _log_task_start(self, task: Task, role: str = "None") -> None:
+        self._task_started_at[id(task)] = time.perf_counter()
+        super()._log_task_start(task, role)
+
+    def _get_context(self, task: Task, task_outputs: list[TaskOutput]) -> str:
+        if self.context_assembler is None or not self.context_assembler.handles(task.name):
+            return super()._get_context(task, task_outputs)
+        if task.context:
+            outputs = [context_task.output for context_task in task.context if context_task.output is not None]
+        else:
+            outputs = task_outputs
+        query = (self._inputs or {}).get("query", "")
+        context, report = self.context_assembler.assemble(task.name, outputs, query=query)
+        self.context_report[task.name] = report
+        return context
+
+    def _process_task_result(self, task: Task, output: TaskOutput) -> None:
+        started_at = self._task_started_at.pop(id(task), None)
+        if started_at is not None:
+            observe_stage("task", task.name or task.description, time.perf_counter() - started_at)
+        super()._process_task_result(task, output)
+        if self.artifact_sink is not None:
+            self.artifact_sink.write(self.request_id, task.name or task.description, output.raw)
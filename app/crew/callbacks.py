@@ -1,6 +1,7 @@
 from crewai import TaskOutput
 from fastapi import HTTPException, status
-from langsmith import traceable
+
+from app.tracing import traceable
 
 
 @traceable(run_type="callback")
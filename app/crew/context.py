@@ -0,0 +1,333 @@
+import json
+import re
+from functools import lru_cache
+from typing import Any
+
+from crewai import TaskOutput
+from pydantic import BaseModel
+
+from app.cache.embedding_cache import normalize_text
+from app.config import context_budget_config
+from app.crew.dedup import MinHashDeduplicator, NearDuplicateIndex, get_near_duplicate_deduplicator
+from app.crew.relevance import EmbeddingRelevanceFilter, get_relevance_filter
+from app.metrics import timed
+from app.utils import get_logger
+
+# crewAI's divider between task outputs in a task's context
+CONTEXT_DIVIDER = "\n\n----------\n\n"
+URL_PATTERN = re.compile(r"https?://[^\s\"'<>()\[\]]+")
+WORD_PATTERN = re.compile(r"\w{3,}")
+# Paragraphs that only attribute the paragraph before them
+ATTRIBUTION_PATTERN = re.compile(r"^\W*(sources?|references?|urls?|citations?|retrieved from)\b", re.IGNORECASE)
+
+
+@lru_cache
+def _encoding(name: str) -> Any:
+    try:
+        import tiktoken
+
+        return tiktoken.get_encoding(name)
+    except Exception as e:  # noqa: BLE001
+        get_logger().warning(f"Tokenizer '{name}' unavailable, estimating tokens from length: {e!r}")
+        return None
+
+
+class ContextChunk(BaseModel):
+    """A paragraph of an earlier task's output, with the URLs that attribute it."""
+
+    source: str
+    position: int
+    text: str
+    tokens: int
+    urls: list[str] = []
+    score: float = 0.0
+    pinned: bool = False
+
+
+class ChunkStats(BaseModel):
+    """Paragraphs dropped or shortened while splitting a task's context."""
+
+    duplicates: int = 0
+    near_duplicates: int = 0
+    truncated: int = 0
+
+
+class ContextAssembler:
+    """
+    Builds the contexts of the filtering and synthesis tasks from earlier task outputs.
+
+    Outputs are split into paragraphs, or into compact items for JSON dumps, and attribution
+    lines (``Sources: ...``) stay attached to the paragraph they attribute. Duplicate
+    paragraphs are dropped and long ones are truncated while keeping every URL they cite.
+    For the tasks of a ``deduplicator``, near-duplicates (mirrors, syndicated articles,
+    overlapping chunks) are dropped too, and their attributions merged into the paragraph
+    that is kept. For the tasks of a ``relevance_filter``, paragraphs far from the query in
+    embedding space are dropped and the rest are scored, and labelled, with their similarity.
+    The outputs ``pinned`` for a task (e.g. the curated data the synthesis builds on) are
+    deduplicated first and never pre-filtered. Tasks with a budget keep the pinned paragraphs,
+    then the others ranked by similarity, or else by word overlap with the query, until the
+    budget is spent. Kept paragraphs stay in their original order.
+
+    Attributes:
+        budgets: Token budget of each task's context, by task name.
+        max_chunk_tokens: Paragraphs longer than this are truncated.
+        encoding: Name of the tiktoken encoding used to count tokens.
+        deduplicator: Finder of near-duplicate paragraphs in the contexts of its tasks, or None.
+        relevance_filter: Embedding pre-filter of the contexts of its tasks, or None.
+        pinned: Names of the tasks whose outputs are kept first and never re-ranked, by the task whose context it is.
+    """
+
+    def __init__(
+        self,
+        budgets: dict[str, int],
+        max_chunk_tokens: int,
+        encoding: str,
+        *,
+        deduplicator: MinHashDeduplicator | None = None,
+        relevance_filter: EmbeddingRelevanceFilter | None = None,
+        pinned: dict[str, list[str]] | None = None,
+    ) -> None:
+        self.budgets = budgets
+        self.max_chunk_tokens = max_chunk_tokens
+        self.encoding = encoding
+        self.deduplicator = deduplicator
+        self.relevance_filter = relevance_filter
+        self.pinned = pinned or {}
+
+    def handles(self, task_name: str) -> bool:
+        """Whether the context of ``task_name`` is built here rather than by crewAI."""
+        return (
+            task_name in self.budgets
+            or (self.deduplicator is not None and task_name in self.deduplicator.tasks)
+            or (self.relevance_filter is not None and task_name in self.relevance_filter.tasks)
+        )
+
+    def count_tokens(self, text: str) -> int:
+        """Returns the number of tokens in ``text``, estimated from its length without a tokenizer."""
+        encoding = _encoding(self.encoding)
+        if encoding is None:
+            return (len(text) + 3) // 4
+        return len(encoding.encode(text, disallowed_special=()))
+
+    def _truncate(self, text: str, urls: list[str]) -> str:
+        encoding = _encoding(self.encoding)
+        if encoding is None:
+            head = text[: self.max_chunk_tokens * 4]
+        else:
+            head = encoding.decode(encoding.encode(text, disallowed_special=())[: self.max_chunk_tokens])
+        dropped = [url for url in urls if url not in head]
+        return f"{head.rstrip()} [...]" + (f"\nSources: {', '.join(dropped)}" if dropped else "")
+
+    def _merge_attribution(self, chunk: ContextChunk, text: str, urls: list[str]) -> None:
+        """Adds the attribution lines and URLs of ``text``, a near-duplicate of ``chunk``, that it lacks."""
+        lines = [
+            line.strip()
+            for line in text.splitlines()
+            if ATTRIBUTION_PATTERN.match(line.strip()) and line.strip() not in chunk.text
+        ]
+        new_urls = [url for url in urls if url not in chunk.urls and not any(url in line for line in lines)]
+        if new_urls:
+            lines.append(f"Also reported by: {', '.join(new_urls)}")
+        chunk.urls.extend(url for url in urls if url not in chunk.urls)
+        if lines:
+            chunk.text = "\n".join([chunk.text, *lines])
+            chunk.tokens = self.count_tokens(chunk.text)
+
+    def _near_duplicate(
+        self, index: NearDuplicateIndex, chunks: list[ContextChunk], text: str, urls: list[str]
+    ) -> bool:
+        """Merges ``text`` into the chunk it nearly duplicates and returns True, or indexes it as the next chunk."""
+        # Attributions are left out so copies citing different sources still match
+        content = "\n".join(line for line in text.splitlines() if not ATTRIBUTION_PATTERN.match(line.strip()))
+        signature = self.deduplicator.signature(URL_PATTERN.sub(" ", content))
+        original = index.find(signature)
+        if original is not None:
+            self._merge_attribution(chunks[original], text, urls)
+            return True
+        index.add(len(chunks), signature)
+        return False
+
+    def _prefilter(self, task_name: str, chunks: list[ContextChunk], query: str) -> list[ContextChunk]:
+        """
+        Keeps the pinned chunks and those the relevance filter selects among the others,
+        scored and labelled with their similarity to the query.
+        """
+        candidates = [chunk for chunk in chunks if not chunk.pinned]
+        if not candidates:
+            return chunks
+        try:
+            with timed("relevance_prefilter", task_name):
+                scores = self.relevance_filter.score(query, [chunk.text for chunk in candidates])
+        except Exception as e:  # noqa: BLE001
+            get_logger().warning(f"Relevance pre-filter failed, keeping every chunk: {e!r}")
+            return chunks
+        kept = [chunk for chunk in chunks if chunk.pinned]
+        for i in self.relevance_filter.select(scores):
+            chunk = candidates[i]
+            chunk.score = float(scores[i])
+            if self.relevance_filter.label_scores:
+                chunk.text = f"[relevance {chunk.score:.2f}] {chunk.text}"
+                chunk.tokens = self.count_tokens(chunk.text)
+            kept.append(chunk)
+        return kept
+
+    @staticmethod
+    def _rank(chunk: ContextChunk) -> tuple:
+        """Sort key of the chunks by the order they are kept in: pinned ones first, as they came."""
+        if chunk.pinned:
+            return (0, chunk.position)
+        # Attributed chunks win ties, so cited facts outlast uncited ones
+        return (1, -chunk.score, not chunk.urls, chunk.position)
+
+    @staticmethod
+    def _json_chunks(raw: str) -> list[str] | None:
+        """Splits a JSON dump into compact chunks, one per item of its top-level or ``results`` list."""
+        stripped = raw.strip()
+        if not stripped.startswith(("{", "[")):
+            return None
+        try:
+            data = json.loads(stripped)
+        except ValueError:
+            return None
+        items = data.get("results") if isinstance(data, dict) else data
+        if not isinstance(items, list):
+            items = [data]
+        return [json.dumps(item, ensure_ascii=False, separators=(",", ":")) for item in items]
+
+    @staticmethod
+    def _chunks(raw: str) -> list[str]:
+        json_chunks = ContextAssembler._json_chunks(raw)
+        if json_chunks is not None:
+            return json_chunks
+        paragraphs: list[str] = []
+        for paragraph in filter(None, (part.strip() for part in re.split(r"\n\s*\n", raw))):
+            if paragraphs and (ATTRIBUTION_PATTERN.match(paragraph) or URL_PATTERN.fullmatch(paragraph)):
+                paragraphs[-1] = f"{paragraphs[-1]}\n{paragraph}"
+            else:
+                paragraphs.append(paragraph)
+        return paragraphs
+
+    def _split(self, task_name: str, outputs: list[TaskOutput], query: str) -> tuple[list[ContextChunk], ChunkStats]:
+        """Splits ``outputs`` into chunks scored by word overlap with ``query``, without duplicates."""
+        pinned_sources = set(self.pinned.get(task_name, []))
+        query_terms = set(WORD_PATTERN.findall(query.casefold()))
+        deduplicate = self.deduplicator is not None and task_name in self.deduplicator.tasks
+        index = self.deduplicator.new_index() if deduplicate else None
+        chunks: list[ContextChunk] = []
+        stats = ChunkStats()
+        seen: set[str] = set()
+        # Pinned outputs go first, so their paragraphs are the ones kept among duplicates
+        for output in sorted(outputs, key=lambda output: output.name not in pinned_sources):
+            for paragraph in self._chunks(output.raw):
+                key = normalize_text(paragraph).casefold()
+                if key in seen:
+                    stats.duplicates += 1
+                    continue
+                seen.add(key)
+                urls = list(dict.fromkeys(URL_PATTERN.findall(paragraph)))
+                if index is not None and self._near_duplicate(index, chunks, paragraph, urls):
+                    stats.near_duplicates += 1
+                    continue
+                text = paragraph
+                if self.count_tokens(paragraph) > self.max_chunk_tokens:
+                    text = self._truncate(paragraph, urls)
+                    stats.truncated += 1
+                terms = set(WORD_PATTERN.findall(text.casefold()))
+                chunks.append(
+                    ContextChunk(
+                        source=output.name or output.description,
+                        position=len(chunks),
+                        text=text,
+                        tokens=self.count_tokens(text),
+                        urls=urls,
+                        score=len(query_terms & terms) / len(query_terms) if query_terms else 0.0,
+                        pinned=output.name in pinned_sources,
+                    )
+                )
+        return chunks, stats
+
+    def _pack(self, chunks: list[ContextChunk], budget: int | None) -> list[ContextChunk]:
+        """Returns the chunks that fit ``budget``, or all of them without one, in their original order."""
+        if budget is None:
+            return sorted(chunks, key=lambda chunk: chunk.position)
+        kept: list[ContextChunk] = []
+        spent = 0
+        # Charge each chunk for the widest separator it may be joined with
+        separator_tokens = self.count_tokens(CONTEXT_DIVIDER)
+        for chunk in sorted(chunks, key=self._rank):
+            if spent + chunk.tokens + separator_tokens <= budget:
+                kept.append(chunk)
+                spent += chunk.tokens + separator_tokens
+        return sorted(kept, key=lambda chunk: chunk.position)
+
+    @staticmethod
+    def _render(outputs: list[TaskOutput], chunks: list[ContextChunk]) -> str:
+        # Sections follow the order of the outputs, whichever were deduplicated first
+        sections: dict[str, list[str]] = {output.name or output.description: [] for output in outputs}
+        for chunk in chunks:
+            sections[chunk.source].append(chunk.text)
+        return CONTEXT_DIVIDER.join("\n\n".join(texts) for texts in sections.values() if texts)
+
+    def assemble(self, task_name: str, outputs: list[TaskOutput], query: str) -> tuple[str, dict[str, Any]]:
+        """
+        Builds the context of ``task_name`` from ``outputs``.
+
+        Args:
+            task_name: Name of the task the context is for.
+            outputs: Outputs of the tasks in its context, in order.
+            query: The research question the chunks are ranked against.
+
+        Returns:
+            tuple[str, dict[str, Any]]: The context and a report of the tokens it saved.
+        """
+        chunks, stats = self._split(task_name, outputs, query)
+        scored = len(chunks)
+        if self.relevance_filter is not None and task_name in self.relevance_filter.tasks and query:
+            chunks = self._prefilter(task_name, chunks, query)
+        budget = self.budgets.get(task_name)
+        kept = self._pack(chunks, budget)
+        context = self._render(outputs, kept)
+
+        tokens_in = self.count_tokens(CONTEXT_DIVIDER.join(output.raw for output in outputs))
+        tokens_out = self.count_tokens(context)
+        dropped = stats.duplicates + stats.near_duplicates
+        total_chunks = scored + dropped
+        return context, {
+            "budget": budget,
+            "tokens_in": tokens_in,
+            "tokens_out": tokens_out,
+            "tokens_saved": max(tokens_in - tokens_out, 0),
+            "chunks": total_chunks,
+            "chunks_kept": len(kept),
+            "pinned": sum(chunk.pinned for chunk in kept),
+            "duplicates": stats.duplicates,
+            "near_duplicates": stats.near_duplicates,
+            "prefiltered": scored - len(chunks),
+            "dedup_ratio": round(dropped / total_chunks, 3) if total_chunks else 0.0,
+            "truncated": stats.truncated,
+        }
+
+
+@lru_cache
+def get_context_assembler() -> ContextAssembler | None:
+    """
+    Returns the process-wide context assembler configured by ``context_budget_config``,
+    ``near_duplicate_config`` and ``relevance_prefilter_config``.
+
+    Returns:
+        ContextAssembler | None: The assembler, or None if budgets, near-duplicate elimination
+        and the relevance pre-filter are all disabled.
+    """
+    budgets = context_budget_config["budgets"] if context_budget_config["enabled"] else {}
+    deduplicator = get_near_duplicate_deduplicator()
+    relevance_filter = get_relevance_filter()
+    if not budgets and deduplicator is None and relevance_filter is None:
+        return None
+    return ContextAssembler(
+        budgets=budgets,
+        max_chunk_tokens=context_budget_config["max_chunk_tokens"],
+        encoding=context_budget_config["encoding"],
+        deduplicator=deduplicator,
+        relevance_filter=relevance_filter,
+        pinned=context_budget_config["pinned"],
+    )
@@ -1,9 +1,9 @@
-from crewai import Crew
-from langsmith import traceable
+from functools import lru_cache, partial
 
-from app.config import CREW_VERBOSE
-from app.models import AgentInput, TaskInput
-from app.schemas import ResearchQuery, ResearchResponse
+from crewai import Crew, TaskOutput
+
+from app.artifacts.sink import get_artifact_sink
+from app.config import CREW_TEMPLATE_MODE, CREW_VERBOSE, crew_scheduler_config
 from app.crew.agents import (
     get_query_agent,
     get_relevancy_agent,
@@ -11,6 +11,9 @@ from app.crew.agents import (
     get_retrieval_agent,
     get_synthesizer_agent,
 )
+from app.crew.base import ResearchCrew
+from app.crew.context import get_context_assembler
+from app.crew.scheduler import DagCrew
 from app.crew.tasks import (
     get_keep_relevant_data_task,
     get_question_relevancy_task,
@@ -21,34 +24,50 @@ from app.crew.tasks import (
     get_web_search_results_task,
 )
 from app.crew.tools import (
+    get_qdrant_vector_batch_search_tool,
     get_qdrant_vector_search_tool,
     get_tavily_extractor_tool,
+    get_tavily_multi_search_tool,
     get_tavily_search_tool,
 )
+from app.models import AgentInput, QuestionRelevancyResponse, TaskInput
+from app.schemas import ResearchQuery, ResearchResponse
+from app.tracing import traceable
 
 
 @traceable(run_type="crew")
-def get_research_crew(query: ResearchQuery) -> Crew:
+def get_research_crew(query: ResearchQuery | None = None) -> Crew:
     """
     Create and configure the Research Navigator crew.
 
     This crew coordinates multiple specialized agents to process research questions,
     gather relevant information, and synthesize comprehensive answers.
 
+    Agent and task prompts contain {query}/{context_info} placeholders, so the crew must
+    be kicked off with the query's inputs.
+
+    Args:
+        query: The research query, if the crew is built for a single request.
+
     Returns:
         Crew: A configured crew instance ready for research tasks.
     """
     # Initialize tools
     tavily_extractor_tool = get_tavily_extractor_tool()
     tavily_search_tool = get_tavily_search_tool()
+    tavily_multi_search_tool = get_tavily_multi_search_tool()
     qdrant_tool = get_qdrant_vector_search_tool()
+    qdrant_batch_tool = get_qdrant_vector_batch_search_tool()
 
     # Initialize agents with appropriate tools
     relevancy_agent = get_relevancy_agent(AgentInput(query=query))
     research_agent = get_research_agent(AgentInput(query=query, tools=[tavily_extractor_tool, tavily_search_tool]))
     query_agent = get_query_agent(AgentInput(query=query))
     retrieval_agent = get_retrieval_agent(
-        AgentInput(query=query, tools=[tavily_extractor_tool, tavily_search_tool, qdrant_tool])
+        AgentInput(
+            query=query,
+            tools=[tavily_extractor_tool, tavily_multi_search_tool, tavily_search_tool, qdrant_batch_tool, qdrant_tool],
+        )
     )
     synthesizer_agent = get_synthesizer_agent(AgentInput(query=query))
 
@@ -66,7 +85,7 @@ def get_research_crew(query: ResearchQuery) -> Crew:
         TaskInput(
             agent=retrieval_agent,
             query=query,
-            tools=[qdrant_tool],
+            tools=[qdrant_batch_tool, qdrant_tool],
             context=[search_query_task],
         )
     )
@@ -74,7 +93,7 @@ def get_research_crew(query: ResearchQuery) -> Crew:
         TaskInput(
             agent=retrieval_agent,
             query=query,
-            tools=[tavily_extractor_tool, tavily_search_tool],
+            tools=[tavily_extractor_tool, tavily_multi_search_tool, tavily_search_tool],
             context=[search_query_task],
         )
     )
@@ -103,8 +122,14 @@ def get_research_crew(query: ResearchQuery) -> Crew:
         )
     )
 
-    # Create the crew with sequential workflow
-    research_crew = Crew(
+    # Create the crew; in DAG mode independent tasks run in parallel, following their context
+    if crew_scheduler_config["mode"] == "dag":
+        crew_class = partial(DagCrew, max_parallelism=crew_scheduler_config["max_parallelism"])
+    else:
+        crew_class = ResearchCrew
+    research_crew = crew_class(
+        artifact_sink=get_artifact_sink(),
+        context_assembler=get_context_assembler(),
         agents=[
             relevancy_agent,
             research_agent,
@@ -130,6 +155,27 @@ def get_research_crew(query: ResearchQuery) -> Crew:
     return research_crew
 
 
+@lru_cache
+def get_research_crew_template() -> Crew:
+    """
+    Build the Research Navigator crew once, to be cloned for each request.
+
+    Returns:
+        Crew: The shared crew template. Never kick it off directly.
+    """
+    return get_research_crew()
+
+
+def clone_research_crew() -> Crew:
+    """
+    Clone the crew template for a single request.
+
+    Returns:
+        Crew: A fresh copy of the template, safe to kick off concurrently with other copies.
+    """
+    return get_research_crew_template().copy()
+
+
 def get_crew(query_dict: dict) -> Crew:
     """
     Legacy function to maintain compatibility with existing code.
@@ -137,6 +183,32 @@ def get_crew(query_dict: dict) -> Crew:
     Returns:
         Crew: A research navigator crew.
     """
+    if CREW_TEMPLATE_MODE:
+        return clone_research_crew()
     # Convert the dict back to ResearchQuery
     query = ResearchQuery(**query_dict)
     return get_research_crew(query)
+
+
+def seed_question_relevancy(crew: Crew, verdict: QuestionRelevancyResponse) -> None:
+    """
+    Removes the question relevancy task from ``crew``, using the precheck's verdict as its output.
+
+    Tasks with the relevancy task in their context read the verdict instead, so a question
+    the precheck accepted is not assessed a second time by the full model.
+
+    Args:
+        crew: A crew built for a single request, e.g. by ``get_crew``.
+        verdict: The precheck's verdict; only relevant verdicts are seeded.
+    """
+    task = next((task for task in crew.tasks if task.output_pydantic is QuestionRelevancyResponse), None)
+    if task is None or not verdict.relevant:
+        return
+    task.output = TaskOutput(
+        description=task.description,
+        name=task.name,
+        agent=task.agent.role if task.agent else "",
+        raw=verdict.model_dump_json(),
+        pydantic=verdict,
+    )
+    crew.tasks = [crew_task for crew_task in crew.tasks if crew_task is not task]
@@ -0,0 +1,111 @@
+import re
+import zlib
+from functools import lru_cache
+
+import numpy as np
+
+from app.config import near_duplicate_config
+
+SHINGLE_WORD_PATTERN = re.compile(r"\w+")
+
+
+class MinHashDeduplicator:
+    """
+    Finds near-duplicate passages by MinHash over word shingles.
+
+    Each passage is reduced to a signature of ``num_perm`` minimum hashes of its
+    ``shingle_size``-word shingles; the share of equal entries of two signatures estimates
+    the Jaccard similarity of their passages. An index splits signatures into ``bands`` to
+    find candidates without comparing every pair. Hashes and permutations are seeded, so
+    results are the same in every process.
+
+    Attributes:
+        tasks: Names of the tasks whose contexts are deduplicated.
+        threshold: Estimated Jaccard similarity from which passages are near-duplicates.
+        num_perm: Length of the signatures.
+        bands: Number of LSH bands; ``num_perm`` must be a multiple of it.
+        shingle_size: Words per shingle.
+    """
+
+    def __init__(
+        self,
+        threshold: float,
+        num_perm: int,
+        bands: int,
+        shingle_size: int,
+        *,
+        seed: int = 1,
+        tasks: list[str] | None = None,
+    ) -> None:
+        if num_perm % bands:
+            msg = f"num_perm ({num_perm}) must be a multiple of bands ({bands})."
+            raise ValueError(msg)
+        self.tasks = tasks or []
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands = bands
+        self.shingle_size = shingle_size
+        generator = np.random.default_rng(seed)
+        # Multiply-shift hash functions: the high half of (a * x + b) mod 2**64, with odd a
+        self._a = generator.integers(0, 1 << 63, size=num_perm, dtype=np.uint64) * np.uint64(2) + np.uint64(1)
+        self._b = generator.integers(0, 1 << 63, size=num_perm, dtype=np.uint64)
+
+    def signature(self, text: str) -> np.ndarray:
+        """Returns the MinHash signature of ``text``, an array of ``num_perm`` unsigned integers."""
+        words = SHINGLE_WORD_PATTERN.findall(text.casefold())
+        size = min(self.shingle_size, len(words)) or 1
+        shingles = {" ".join(words[i : i + size]) for i in range(max(len(words) - size + 1, 1))}
+        hashes = np.fromiter((zlib.crc32(shingle.encode()) for shingle in shingles), dtype=np.uint64)
+        # uint64 arithmetic wraps around, which is the mod 2**64
+        return ((np.outer(hashes, self._a) + self._b) >> np.uint64(32)).min(axis=0)
+
+    def similarity(self, first: np.ndarray, second: np.ndarray) -> float:
+        """Returns the Jaccard similarity estimated from two signatures."""
+        return float(np.mean(first == second))
+
+    def new_index(self) -> "NearDuplicateIndex":
+        return NearDuplicateIndex(self)
+
+
+class NearDuplicateIndex:
+    """LSH index of the signatures of the passages kept so far, by their key."""
+
+    def __init__(self, deduplicator: MinHashDeduplicator) -> None:
+        self.deduplicator = deduplicator
+        self._signatures: dict[int, np.ndarray] = {}
+        self._buckets: dict[tuple[int, bytes], list[int]] = {}
+
+    def _band_keys(self, signature: np.ndarray) -> list[tuple[int, bytes]]:
+        return [(band, rows.tobytes()) for band, rows in enumerate(np.split(signature, self.deduplicator.bands))]
+
+    def find(self, signature: np.ndarray) -> int | None:
+        """Returns the key of the first indexed passage that ``signature`` nearly duplicates, if any."""
+        candidates = sorted({key for band in self._band_keys(signature) for key in self._buckets.get(band, [])})
+        for key in candidates:
+            if self.deduplicator.similarity(signature, self._signatures[key]) >= self.deduplicator.threshold:
+                return key
+        return None
+
+    def add(self, key: int, signature: np.ndarray) -> None:
+        self._signatures[key] = signature
+        for band in self._band_keys(signature):
+            self._buckets.setdefault(band, []).append(key)
+
+
+@lru_cache
+def get_near_duplicate_deduplicator() -> MinHashDeduplicator | None:
+    """
+    Returns the process-wide deduplicator configured by ``near_duplicate_config``.
+
+    Returns:
+        MinHashDeduplicator | None: The deduplicator, or None if near-duplicate elimination is disabled.
+    """
+    if not near_duplicate_config["enabled"]:
+        return None
+    return MinHashDeduplicator(
+        threshold=near_duplicate_config["threshold"],
+        num_perm=near_duplicate_config["num_perm"],
+        bands=near_duplicate_config["bands"],
+        shingle_size=near_duplicate_config["shingle_size"],
+        tasks=near_duplicate_config["tasks"],
+    )
@@ -0,0 +1,133 @@
+import asyncio
+import hashlib
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+from crewai import LLM, Crew
+
+from app.cache.embedding_cache import normalize_text
+from app.cache.tool_cache import InMemoryToolCacheBackend
+from app.config import relevancy_precheck_config
+from app.crew.agents import get_relevancy_agent
+from app.crew.tasks import get_question_relevancy_task
+from app.metrics import count_cache_lookup, timed
+from app.models import AgentInput, QuestionRelevancyResponse, TaskInput
+from app.schemas import ResearchQuery
+from app.utils import get_logger
+
+
+class RelevancyPrecheck:
+    """
+    Fail-fast relevancy check that runs only the relevancy agent, on a small model.
+
+    Verdicts are cached per normalized query and context. The check fails open: if the
+    model times out or errors, no verdict is returned and the full crew's relevancy task
+    decides as before. A thread can't be cancelled, so a timed-out check keeps running until
+    the model answers or its own timeout fires; at most ``max_pending`` checks run at once,
+    and queries arriving beyond that skip the precheck.
+
+    Attributes:
+        model: The model used by the relevancy agent.
+        timeout: Seconds to wait for a verdict.
+        verdicts: Cache of verdicts by query key.
+        ttl_seconds: How long verdicts are cached.
+        max_pending: How many checks, including abandoned ones, may run at once.
+    """
+
+    def __init__(
+        self,
+        model: str,
+        timeout: float,
+        verdicts: InMemoryToolCacheBackend,
+        ttl_seconds: float,
+        max_pending: int = 8,
+    ) -> None:
+        self.model = model
+        self.timeout = timeout
+        self.verdicts = verdicts
+        self.ttl_seconds = ttl_seconds
+        self.max_pending = max_pending
+        self._pending = threading.BoundedSemaphore(max_pending)
+        self._executor = ThreadPoolExecutor(max_workers=max_pending, thread_name_prefix="precheck")
+
+    @staticmethod
+    def _key(query: ResearchQuery) -> str:
+        text = json.dumps([normalize_text(query.query).casefold(), normalize_text(query.context or "").casefold()])
+        return hashlib.sha256(text.encode()).hexdigest()
+
+    def _assess(self, query: ResearchQuery) -> QuestionRelevancyResponse | None:
+        crew = get_precheck_crew_template(self.model, self.timeout).copy()
+        verdict = crew.kickoff(inputs=query.dict(exclude_none=True)).pydantic
+        # A verdict reached after the caller gave up still serves the next identical query
+        if verdict is not None:
+            self.verdicts.set(self._key(query), verdict.model_dump(), self.ttl_seconds)
+        return verdict
+
+    def cached_verdict(self, query: ResearchQuery) -> QuestionRelevancyResponse | None:
+        """Returns the cached verdict for ``query``, if any, without assessing it."""
+        cached = self.verdicts.get(self._key(query))
+        return QuestionRelevancyResponse(**cached) if cached is not None else None
+
+    async def check(self, query: ResearchQuery) -> QuestionRelevancyResponse | None:
+        """
+        Returns the relevancy verdict for ``query``.
+
+        Args:
+            query: The incoming research query.
+
+        Returns:
+            QuestionRelevancyResponse | None: The verdict, or None if none was reached in time.
+        """
+        key = self._key(query)
+        cached = self.verdicts.get(key)
+        count_cache_lookup("relevancy_precheck", hit=cached is not None)
+        if cached is not None:
+            return QuestionRelevancyResponse(**cached)
+        if not self._pending.acquire(blocking=False):
+            get_logger().warning(f"Relevancy precheck skipped: {self.max_pending} checks still running")
+            return None
+        future = self._executor.submit(self._assess, query)
+        # Released when the check ends, not when the caller stops waiting for it
+        future.add_done_callback(lambda _: self._pending.release())
+        try:
+            with timed("precheck", self.model):
+                return await asyncio.wait_for(asyncio.wrap_future(future), timeout=self.timeout)
+        except Exception as e:  # noqa: BLE001
+            get_logger().warning(f"Relevancy precheck skipped: {e!r}")
+            return None
+
+
+@lru_cache
+def get_precheck_crew_template(model: str, timeout: float) -> Crew:
+    """
+    Builds the one-task crew of the precheck once per model, to be cloned for each check.
+
+    Returns:
+        Crew: The shared crew template. Never kick it off directly.
+    """
+    agent = get_relevancy_agent(AgentInput(llm=LLM(model=model, timeout=timeout)))
+    task = get_question_relevancy_task(TaskInput(agent=agent))
+    # The verdict is returned to the router, not raised from the callback
+    task.callback = None
+    return Crew(agents=[agent], tasks=[task], memory=False, cache=False, name="Relevancy Precheck Crew")
+
+
+@lru_cache
+def get_relevancy_precheck() -> RelevancyPrecheck | None:
+    """
+    Returns the process-wide relevancy precheck configured by ``relevancy_precheck_config``.
+
+    Returns:
+        RelevancyPrecheck | None: The precheck, or None if it is disabled.
+    """
+    if not relevancy_precheck_config["enabled"]:
+        return None
+    return RelevancyPrecheck(
+        model=relevancy_precheck_config["model"],
+        timeout=relevancy_precheck_config["timeout_seconds"],
+        verdicts=InMemoryToolCacheBackend(max_entries=relevancy_precheck_config["cache_max_entries"]),
+        ttl_seconds=relevancy_precheck_config["cache_ttl_seconds"],
+        max_pending=relevancy_precheck_config["max_pending_checks"],
+    )
@@ -0,0 +1,79 @@
+from collections.abc import Callable
+from functools import lru_cache, partial
+
+import numpy as np
+
+from app.config import relevance_prefilter_config
+
+
+class EmbeddingRelevanceFilter:
+    """
+    Cheap relevance scores of passages to a query, to spare the LLM filter the obvious misses.
+
+    The query and all passages are embedded in one batch, and the passages are scored by
+    their cosine similarity to the query in a single matrix product.
+
+    Attributes:
+        embed: Batch embedding function, ``texts -> vectors``.
+        tasks: Names of the tasks whose contexts are pre-filtered.
+        threshold: Cosine similarity below which passages are dropped.
+        top_k: Most passages kept, or None for no limit.
+        min_keep: Fewest passages kept, whatever their scores.
+        label_scores: Whether kept passages are labelled with their score for the LLM filter.
+    """
+
+    def __init__(
+        self,
+        embed: Callable[[list[str]], list[list[float]]],
+        tasks: list[str],
+        *,
+        threshold: float,
+        top_k: int | None,
+        min_keep: int,
+        label_scores: bool = True,
+    ) -> None:
+        self.embed = embed
+        self.tasks = tasks
+        self.threshold = threshold
+        self.top_k = top_k
+        self.min_keep = min_keep
+        self.label_scores = label_scores
+
+    def score(self, query: str, texts: list[str]) -> np.ndarray:
+        """Returns the cosine similarity of each of ``texts`` to ``query``."""
+        vectors = np.asarray(self.embed([query, *texts]), dtype=np.float32)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        vectors /= np.clip(norms, 1e-12, None)
+        return vectors[1:] @ vectors[0]
+
+    def select(self, scores: np.ndarray) -> np.ndarray:
+        """Returns the indices of the passages to keep, in their original order."""
+        order = np.argsort(-scores, kind="stable")
+        keep = max(int(np.count_nonzero(scores >= self.threshold)), self.min_keep)
+        if self.top_k is not None:
+            keep = min(keep, self.top_k)
+        return np.sort(order[:keep])
+
+
+@lru_cache
+def get_relevance_filter() -> EmbeddingRelevanceFilter | None:
+    """
+    Returns the process-wide relevance pre-filter configured by ``relevance_prefilter_config``.
+
+    Returns:
+        EmbeddingRelevanceFilter | None: The filter, embedding with the batch search tool, or None if disabled.
+    """
+    if not relevance_prefilter_config["enabled"]:
+        return None
+    from app.crew.tools import get_qdrant_vector_batch_search_tool
+
+    tool = get_qdrant_vector_batch_search_tool()
+    return EmbeddingRelevanceFilter(
+        # Passages are embedded once per request; caching them would evict the cached queries
+        embed=partial(tool.embed, use_cache=False),
+        tasks=relevance_prefilter_config["tasks"],
+        threshold=relevance_prefilter_config["threshold"],
+        top_k=relevance_prefilter_config["top_k"],
+        min_keep=relevance_prefilter_config["min_keep"],
+        label_scores=relevance_prefilter_config["label_scores"],
+    )
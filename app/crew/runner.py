@@ -0,0 +1,141 @@
+import asyncio
+import threading
+import time
+from collections.abc import AsyncIterator, Callable
+from typing import Any
+
+from crewai import Crew, CrewOutput, TaskOutput
+from crewai.utilities.events import crewai_event_bus
+from crewai.utilities.events.llm_events import LLMStreamChunkEvent
+
+
+class CrewCancelledError(Exception):
+    """Raised inside a crew's callbacks to stop a run that was cancelled."""
+
+
+_chunk_listeners: dict[int, Callable[[str], None]] = {}
+_chunk_listeners_lock = threading.Lock()
+_chunk_handler_registered = False
+
+
+def _dispatch_chunk(source: Any, event: LLMStreamChunkEvent) -> None:
+    listener = _chunk_listeners.get(id(source))
+    if listener is not None:
+        listener(event.chunk)
+
+
+def _listen_for_chunks(llm: Any, listener: Callable[[str], None] | None) -> None:
+    """
+    Routes the stream chunks emitted by ``llm`` to ``listener`` (or stops routing them if None).
+
+    crewAI publishes chunks of every LLM on one global event bus that has no way to remove
+    handlers, so a single handler is registered once and dispatches by LLM instance.
+    """
+    global _chunk_handler_registered  # noqa: PLW0603
+    with _chunk_listeners_lock:
+        if not _chunk_handler_registered:
+            crewai_event_bus.register_handler(LLMStreamChunkEvent, _dispatch_chunk)
+            _chunk_handler_registered = True
+        if listener is None:
+            _chunk_listeners.pop(id(llm), None)
+        else:
+            _chunk_listeners[id(llm)] = listener
+
+
+class CrewRun:
+    """
+    A single crew kickoff that publishes its progress and can be cancelled.
+
+    Each finished task is recorded in ``task_outputs`` and published as a ``task`` event.
+    With ``stream_agent`` set, the tokens that agent's LLM streams are published as
+    ``token`` events. Cancelling makes the crew's step and task callbacks raise
+    ``CrewCancelledError``, which stops the run at the next agent step.
+
+    Attributes:
+        crew: The crew to run. It must not be shared with other runs.
+        inputs: The kickoff inputs.
+        task_outputs: Outputs of the tasks finished so far, in completion order.
+        events: Queue of ``(event name, data)`` pairs, ending with ``("end", None)``.
+    """
+
+    def __init__(self, crew: Crew, inputs: dict[str, Any], stream_agent: Any = None) -> None:
+        self.crew = crew
+        self.inputs = inputs
+        self.stream_agent = stream_agent
+        self.task_outputs: list[dict[str, Any]] = []
+        self.events: asyncio.Queue[tuple[str, Any]] = asyncio.Queue()
+        self._cancelled = threading.Event()
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def cancel(self) -> None:
+        """Asks the crew to stop at its next step; the LLM call in flight still completes."""
+        self._cancelled.set()
+
+    def _publish(self, event: str, data: Any) -> None:
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self.events.put_nowait, (event, data))
+
+    def _check_cancelled(self, *_: Any) -> None:
+        if self.cancelled:
+            msg = "The crew run was cancelled."
+            raise CrewCancelledError(msg)
+
+    def _on_task(self, task_output: TaskOutput) -> None:
+        self._check_cancelled()
+        output = {
+            "task": task_output.name,
+            "agent": task_output.agent,
+            "raw": task_output.raw,
+            "pydantic": task_output.pydantic.model_dump(mode="json") if task_output.pydantic else None,
+            "completed_at": time.time(),
+        }
+        self.task_outputs.append(output)
+        self._publish("task", output)
+
+    def _on_chunk(self, chunk: str) -> None:
+        self._publish("token", {"chunk": chunk})
+
+    async def run(self) -> CrewOutput:
+        """
+        Kicks the crew off in a worker thread and waits for it to finish.
+
+        Returns:
+            CrewOutput: The crew's output.
+
+        Raises:
+            CrewCancelledError: If the run was cancelled.
+        """
+        self._loop = asyncio.get_running_loop()
+        self.crew.task_callback = self._on_task
+        self.crew.step_callback = self._check_cancelled
+        llm = getattr(self.stream_agent, "llm", None)
+        if llm is not None:
+            llm.stream = True
+            _listen_for_chunks(llm, self._on_chunk)
+        try:
+            return await asyncio.to_thread(self.crew.kickoff, inputs=self.inputs)
+        finally:
+            if llm is not None:
+                _listen_for_chunks(llm, None)
+            self._publish("end", None)
+
+    async def stream(self, heartbeat: float | None = None) -> AsyncIterator[tuple[str, Any]]:
+        """
+        Yields the run's events until it ends; iterate it alongside ``run``.
+
+        Args:
+            heartbeat: If set, a ``("ping", None)`` event is yielded after this many idle seconds.
+        """
+        while True:
+            try:
+                event = await asyncio.wait_for(self.events.get(), timeout=heartbeat)
+            except TimeoutError:
+                yield "ping", None
+                continue
+            if event[0] == "end":
+                return
+            yield event
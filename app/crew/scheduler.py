@@ -0,0 +1,161 @@
+import contextvars
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any
+
+from crewai import Crew, CrewOutput, Task, TaskOutput
+from pydantic import BaseModel, Field
+
+from app.config import metrics_config
+from app.crew.base import ResearchCrew
+
+
+class DagCrew(ResearchCrew):
+    """
+    Crew that runs its tasks as a dependency graph instead of one after another.
+
+    A task depends only on the tasks in its ``context`` list, so every task whose context
+    is complete starts right away, with at most ``max_parallelism`` tasks running at once.
+    Tasks with an empty context are roots and get no context at all, unlike in a
+    sequential crew where they would receive the previous task's output. The first failure
+    stops scheduling and is raised once the running tasks return.
+
+    Attributes:
+        max_parallelism: Maximum number of tasks running at once.
+        schedule_report: Timings and critical path of the last run (see ``_schedule_report``).
+    """
+
+    max_parallelism: int = Field(default=4, description="Maximum number of tasks running at once.")
+    schedule_report: dict[str, Any] | None = Field(default=None, description="Timings of the last run.")
+
+    def _copy_fields(self) -> dict[str, Any]:
+        return {**super()._copy_fields(), "max_parallelism": self.max_parallelism}
+
+    def _dependencies(self, tasks: list[Task]) -> list[set[int]]:
+        index = {id(task): i for i, task in enumerate(tasks)}
+        dependencies = []
+        for i, task in enumerate(tasks):
+            depends_on = set()
+            for context_task in task.context or []:
+                if id(context_task) not in index and context_task.output is not None:
+                    # Left out of the crew with its output seeded (see seed_question_relevancy)
+                    continue
+                depends_on.add(index.get(id(context_task)))
+            if None in depends_on or any(dependency >= i for dependency in depends_on):
+                msg = f"Task '{task.name}' depends on a task that is not listed before it in the crew."
+                raise ValueError(msg)
+            dependencies.append(depends_on)
+        return dependencies
+
+    def _run_task(self, task: Task) -> tuple[TaskOutput, float, float]:
+        agent = self._get_agent_to_use(task)
+        if agent is None:
+            msg = f"No agent available for task: {task.description}."
+            raise ValueError(msg)
+        tools = self._prepare_tools(agent, task, task.tools or agent.tools or [])
+        self._log_task_start(task, agent.role)
+        started_at = time.perf_counter()
+        output = task.execute_sync(agent=agent, context=self._get_context(task, []), tools=tools)
+        return output, started_at, time.perf_counter()
+
+    def _run_sequential_process(self) -> CrewOutput:
+        tasks = self.tasks
+        dependencies = self._dependencies(tasks)
+        outputs: dict[int, TaskOutput] = {}
+        timings: dict[int, tuple[float, float]] = {}
+        pending = list(range(len(tasks)))
+        running: dict[Future, int] = {}
+        error: BaseException | None = None
+        start_time = time.perf_counter()
+
+        with ThreadPoolExecutor(max_workers=self.max_parallelism, thread_name_prefix="dag-crew") as pool:
+            while running or (pending and error is None):
+                if error is None:
+                    for i in [i for i in pending if dependencies[i] <= outputs.keys()]:
+                        if len(running) >= self.max_parallelism:
+                            break
+                        pending.remove(i)
+                        # Run in a copy of the kickoff's context, so the task's metrics reach its request
+                        running[pool.submit(contextvars.copy_context().run, self._run_task, tasks[i])] = i
+                if not running:
+                    break
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    i = running.pop(future)
+                    try:
+                        outputs[i], *timings[i] = future.result()
+                    except BaseException as e:  # noqa: BLE001
+                        error = error or e
+                        continue
+                    self._process_task_result(tasks[i], outputs[i])
+                    self._store_execution_log(tasks[i], outputs[i], i)
+
+        self.schedule_report = _schedule_report(tasks, dependencies, timings, start_time)
+        if error is not None:
+            raise error
+        return self._create_crew_output([outputs[i] for i in range(len(tasks))])
+
+
+def _schedule_report(
+    tasks: list[Task], dependencies: list[set[int]], timings: dict[int, tuple[float, float]], start_time: float
+) -> dict[str, Any]:
+    """
+    Builds the per-task timing report of a DAG run.
+
+    Each task reports when it started and finished (relative to the run's start) and how
+    long it waited for a free worker after its dependencies finished. The critical path is
+    the chain of tasks, from the last one to finish back through its latest-finishing
+    dependency, that bounded the run's wall time.
+    """
+    report_tasks = []
+    for i, (started_at, finished_at) in sorted(timings.items()):
+        ready_at = max((timings[d][1] for d in dependencies[i] if d in timings), default=start_time)
+        report_tasks.append(
+            {
+                "task": tasks[i].name,
+                "depends_on": [tasks[d].name for d in sorted(dependencies[i])],
+                "started_at": round(started_at - start_time, 3),
+                "finished_at": round(finished_at - start_time, 3),
+                "duration": round(finished_at - started_at, 3),
+                "queued": round(started_at - ready_at, 3),
+            }
+        )
+
+    critical_path = []
+    current = max(timings, key=lambda i: timings[i][1], default=None)
+    while current is not None:
+        critical_path.append(tasks[current].name)
+        current = max((d for d in dependencies[current] if d in timings), key=lambda d: timings[d][1], default=None)
+
+    wall_time = max((finished_at for _, finished_at in timings.values()), default=start_time) - start_time
+    serial_time = sum(finished_at - started_at for started_at, finished_at in timings.values())
+    return {
+        "tasks": report_tasks,
+        "critical_path": critical_path[::-1],
+        "wall_time": round(wall_time, 3),
+        "serial_time": round(serial_time, 3),
+        "parallel_speedup": round(serial_time / wall_time, 2) if wall_time else None,
+    }
+
+
+def attach_crew_reports(crew: Crew, response: BaseModel) -> None:
+    """Adds the crew's schedule, context budget and metrics reports and artifacts, if any, to ``response.metadata``."""
+    reports = {}
+    schedule_report = getattr(crew, "schedule_report", None)
+    if schedule_report is not None:
+        reports["schedule"] = schedule_report
+    context_report = getattr(crew, "context_report", None)
+    if context_report:
+        reports["context"] = {
+            "tasks": context_report,
+            "tokens_saved": sum(report["tokens_saved"] for report in context_report.values()),
+        }
+    request_metrics = getattr(crew, "request_metrics", None)
+    if request_metrics is not None and metrics_config["request_breakdown"]:
+        reports["metrics"] = request_metrics.breakdown()
+    artifact_sink = getattr(crew, "artifact_sink", None)
+    artifacts = artifact_sink.collect(crew.request_id) if artifact_sink is not None else None
+    if artifacts:
+        reports["artifacts"] = artifacts
+    if reports:
+        response.metadata = {**(response.metadata or {}), **reports}
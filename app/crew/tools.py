@@ -1,25 +1,86 @@
-from langsmith import traceable
+from typing import Any
 
-from ..config import (
+from app.cache.embedding_cache import get_embedding_cache
+from app.cache.extraction_cache import get_extraction_cache
+from app.cache.single_flight import get_single_flight
+from app.cache.tool_cache import get_tavily_result_cache
+from app.clients import get_client_registry
+from app.config import (
     qdrant_vector_search_tool_config,
     tavily_extractor_tool_config,
+    tavily_multi_search_tool_config,
     tavily_search_tool_config,
 )
-from ..temp.qdrant_search_tool import QdrantVectorSearchTool
-from ..temp.tavily_extractor_tool import TavilyExtractorTool
-from ..temp.tavily_search_tool import TavilySearchTool
+from app.embeddings import get_onnx_embedder
+from app.temp.qdrant_search_tool import QdrantVectorBatchSearchTool, QdrantVectorSearchTool
+from app.temp.tavily_extractor_tool import TavilyExtractorTool
+from app.temp.tavily_search_tool import TavilyMultiSearchTool, TavilySearchTool
+from app.tracing import traceable
 
 
 @traceable(run_type="tool")
 def get_tavily_extractor_tool() -> TavilyExtractorTool:
-    return TavilyExtractorTool(**tavily_extractor_tool_config)
+    registry = get_client_registry()
+    return TavilyExtractorTool(
+        client=registry.tavily_client,
+        async_client=registry.async_tavily_client,
+        async_runner=registry.background_loop,
+        extraction_cache=get_extraction_cache(),
+        single_flight=get_single_flight(),
+        **tavily_extractor_tool_config,
+    )
 
 
 @traceable(run_type="tool")
 def get_tavily_search_tool() -> TavilySearchTool:
-    return TavilySearchTool(**tavily_search_tool_config)
+    registry = get_client_registry()
+    return TavilySearchTool(
+        client=registry.tavily_client,
+        async_client=registry.async_tavily_client,
+        async_runner=registry.background_loop,
+        result_cache=get_tavily_result_cache(),
+        single_flight=get_single_flight(),
+        **tavily_search_tool_config,
+    )
+
+
+@traceable(run_type="tool")
+def get_tavily_multi_search_tool() -> TavilyMultiSearchTool:
+    registry = get_client_registry()
+    return TavilyMultiSearchTool(
+        client=registry.tavily_client,
+        async_client=registry.async_tavily_client,
+        async_runner=registry.background_loop,
+        result_cache=get_tavily_result_cache(),
+        single_flight=get_single_flight(),
+        **tavily_multi_search_tool_config,
+    )
+
+
+def _qdrant_tool_kwargs() -> dict[str, Any]:
+    registry = get_client_registry()
+    config = dict(qdrant_vector_search_tool_config)
+    embedding_backend = config.pop("embedding_backend")
+    if embedding_backend not in {"openai", "onnx"}:
+        msg = f"Unknown embedding backend {embedding_backend!r}; expected 'openai' or 'onnx'."
+        raise ValueError(msg)
+    return {
+        "client": registry.qdrant_client,
+        "async_client": registry.async_qdrant_client,
+        "openai_client": registry.openai_client,
+        "openai_async_client": registry.openai_async_client,
+        "embedder": get_onnx_embedder() if embedding_backend == "onnx" else None,
+        "embedding_cache": get_embedding_cache(),
+        "single_flight": get_single_flight(),
+        **config,
+    }
 
 
 @traceable(run_type="tool")
 def get_qdrant_vector_search_tool() -> QdrantVectorSearchTool:
-    return QdrantVectorSearchTool(**qdrant_vector_search_tool_config)
+    return QdrantVectorSearchTool(**_qdrant_tool_kwargs())
+
+
+@traceable(run_type="tool")
+def get_qdrant_vector_batch_search_tool() -> QdrantVectorBatchSearchTool:
+    return QdrantVectorBatchSearchTool(**_qdrant_tool_kwargs())
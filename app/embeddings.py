@@ -0,0 +1,166 @@
+import asyncio
+import queue
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
+
+from .metrics import timed
+from .utils import get_logger
+
+# Rank of per-token model outputs, (batch, tokens, dim), which are pooled into one vector per text
+TOKEN_OUTPUT_NDIM = 3
+
+
+class OnnxEmbedder:
+    """
+    Sentence embeddings from a local ONNX model, computed on the CPU.
+
+    ``model_path`` is a directory holding ``model.onnx`` and its ``tokenizer.json``, as
+    exported by Hugging Face Optimum (e.g. ``sentence-transformers/all-MiniLM-L6-v2``).
+    Concurrent requests are micro-batched: texts queued within ``max_wait`` seconds of each
+    other (up to ``max_batch_size``) are embedded in one inference call, run on a pool of
+    ``workers`` threads. The instance is also a plain ``text -> vector`` embedding function.
+
+    Attributes:
+        name: Model name used in cache keys and metrics, e.g. ``onnx:all-MiniLM-L6-v2``.
+        max_batch_size: Most texts embedded by one inference call.
+        max_wait: Seconds a text waits for others to share its inference call.
+        pooling: ``"mean"`` (over non-padding tokens) or ``"cls"``; ignored for models that output pooled vectors.
+        normalize: Whether vectors are scaled to unit length.
+    """
+
+    def __init__(
+        self,
+        model_path: str,
+        *,
+        max_batch_size: int = 32,
+        max_wait: float = 0.005,
+        workers: int = 1,
+        intra_op_threads: int = 2,
+        max_length: int = 256,
+        pooling: str = "mean",
+        normalize: bool = True,
+    ) -> None:
+        try:
+            import onnxruntime as ort
+            from tokenizers import Tokenizer
+        except ImportError as e:
+            msg = "The ONNX embedding backend needs the 'onnx' extra: pip install 'research_navigator[onnx]'."
+            raise ImportError(msg) from e
+        if pooling not in {"mean", "cls"}:
+            msg = f"Unknown pooling {pooling!r}; expected 'mean' or 'cls'."
+            raise ValueError(msg)
+
+        directory = Path(model_path)
+        self.name = f"onnx:{directory.name}"
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.pooling = pooling
+        self.normalize = normalize
+
+        self.tokenizer = Tokenizer.from_file(str(directory / "tokenizer.json"))
+        self.tokenizer.enable_truncation(max_length)
+        if self.tokenizer.padding is None:
+            self.tokenizer.enable_padding()
+        options = ort.SessionOptions()
+        options.intra_op_num_threads = intra_op_threads
+        options.inter_op_num_threads = 1
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        self.session = ort.InferenceSession(
+            str(directory / "model.onnx"), sess_options=options, providers=["CPUExecutionProvider"]
+        )
+        self.input_names = {model_input.name for model_input in self.session.get_inputs()}
+
+        self._pending: queue.Queue[tuple[str, Future] | None] = queue.Queue()
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="onnx-embedder")
+        self._batcher = threading.Thread(target=self._batch_forever, name="onnx-embedder-batcher", daemon=True)
+        self._batcher.start()
+        get_logger().info(f"Loaded ONNX embedding model {self.name} from {directory}")
+
+    def __call__(self, text: str) -> list[float]:
+        return self.embed_many([text])[0]
+
+    def submit(self, text: str) -> Future:
+        """Queues ``text`` for the next inference call and returns the future of its vector."""
+        future: Future = Future()
+        self._pending.put((text, future))
+        return future
+
+    def embed_many(self, texts: list[str]) -> list[list[float]]:
+        """Embeds ``texts``, batched with the texts other threads are embedding at the same time."""
+        return [future.result() for future in [self.submit(text) for text in texts]]
+
+    async def aembed_many(self, texts: list[str]) -> list[list[float]]:
+        """Async ``embed_many``; the event loop is never blocked on inference."""
+        return list(await asyncio.gather(*(asyncio.wrap_future(self.submit(text)) for text in texts)))
+
+    def _batch_forever(self) -> None:
+        while True:
+            item = self._pending.get()
+            if item is None:
+                return
+            batch = [item]
+            deadline = time.monotonic() + self.max_wait
+            while len(batch) < self.max_batch_size and (remaining := deadline - time.monotonic()) > 0:
+                try:
+                    item = self._pending.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is None:
+                    self._pending.put(None)
+                    break
+                batch.append(item)
+            self._executor.submit(self._infer, batch)
+
+    def _infer(self, batch: list[tuple[str, Future]]) -> None:
+        try:
+            vectors = self.embed_batch([text for text, _ in batch])
+        except Exception as e:  # noqa: BLE001
+            for _, future in batch:
+                future.set_exception(e)
+            return
+        for (_, future), vector in zip(batch, vectors, strict=True):
+            future.set_result(vector)
+
+    def embed_batch(self, texts: list[str]) -> list[list[float]]:
+        """Embeds ``texts`` in one inference call, in the calling thread."""
+        encodings = self.tokenizer.encode_batch(texts)
+        features = {
+            "input_ids": np.array([encoding.ids for encoding in encodings], dtype=np.int64),
+            "attention_mask": np.array([encoding.attention_mask for encoding in encodings], dtype=np.int64),
+            "token_type_ids": np.array([encoding.type_ids for encoding in encodings], dtype=np.int64),
+        }
+        with timed("embedding_batch", self.name):
+            output = self.session.run(None, {name: features[name] for name in self.input_names if name in features})[0]
+        if output.ndim == TOKEN_OUTPUT_NDIM:
+            if self.pooling == "cls":
+                output = output[:, 0]
+            else:
+                mask = features["attention_mask"][..., np.newaxis].astype(output.dtype)
+                output = (output * mask).sum(axis=1) / np.clip(mask.sum(axis=1), 1e-9, None)
+        if self.normalize:
+            output = output / np.clip(np.linalg.norm(output, axis=1, keepdims=True), 1e-12, None)
+        return output.astype(np.float32).tolist()
+
+    def close(self) -> None:
+        """Finishes the queued texts and stops the batcher and the inference threads."""
+        self._pending.put(None)
+        self._batcher.join()
+        self._executor.shutdown(wait=True)
+
+
+def get_onnx_embedder() -> OnnxEmbedder:
+    """
+    Returns the process-wide ONNX embedder configured by ``onnx_embedding_config``.
+
+    It is held by the client registry, which closes it with the other shared clients.
+
+    Returns:
+        OnnxEmbedder: The embedder, with its model loaded.
+    """
+    from .clients import get_client_registry
+
+    return get_client_registry().onnx_embedder
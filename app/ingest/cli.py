@@ -0,0 +1,59 @@
+"""
+Bulk ingestion of documents into the Qdrant collection searched by the research crew.
+
+Usage:
+    uv run ingest DIR_OR_JSONL [--backend openai|onnx] [--collection NAME] [--batch-size 128] [--max-in-flight 4]
+        [--delete-missing]
+
+Re-running on the same documents only embeds and upserts the chunks that changed, and deletes
+the chunks a shortened document no longer has. With --delete-missing, the chunks of documents
+no longer in DIR_OR_JSONL are deleted too.
+"""
+
+import argparse
+import json
+import sys
+
+from app.config import ingest_config
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Chunk, embed and upsert documents into the Qdrant collection.")
+    parser.add_argument("path", help="A JSONL file ({'text', 'metadata', 'source'} per line) or a directory.")
+    parser.add_argument("--backend", choices=["openai", "onnx"], help="Embedding backend; the search tools' default.")
+    parser.add_argument("--collection", help="Collection name; the search tools' collection by default.")
+    parser.add_argument(
+        "--pattern",
+        action="append",
+        dest="patterns",
+        help="Glob of the files to read from a directory (repeatable); ingest_config's file_patterns by default.",
+    )
+    parser.add_argument("--chunk-size", type=int, default=ingest_config["chunk_size"])
+    parser.add_argument("--chunk-overlap", type=int, default=ingest_config["chunk_overlap"])
+    parser.add_argument("--batch-size", type=int, default=ingest_config["batch_size"], help="Chunks per batch.")
+    parser.add_argument(
+        "--max-in-flight", type=int, default=ingest_config["max_in_flight"], help="Batches processed at once."
+    )
+    parser.add_argument(
+        "--delete-missing",
+        action="store_true",
+        help="Delete the ingested chunks of documents that are no longer in the source.",
+    )
+    args = parser.parse_args(argv)
+
+    from .pipeline import get_ingestor, read_documents
+
+    ingestor = get_ingestor(embedding_backend=args.backend, collection_name=args.collection)
+    ingestor.chunk_size = args.chunk_size
+    ingestor.chunk_overlap = args.chunk_overlap
+    ingestor.batch_size = args.batch_size
+    ingestor.max_in_flight = args.max_in_flight
+    stats = ingestor.run(read_documents(args.path, args.patterns or ingest_config["file_patterns"]))
+    if args.delete_missing and not stats.failed:
+        ingestor.delete_missing()
+    print(json.dumps(stats.model_dump(), indent=2))  # noqa: T201
+    return 1 if stats.failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
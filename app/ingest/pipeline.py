@@ -0,0 +1,421 @@
+import hashlib
+import json
+import re
+import threading
+import time
+import uuid
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+from app.clients import get_client_registry
+from app.config import ingest_config, qdrant_vector_search_tool_config
+from app.utils import get_logger
+
+OPENAI_EMBEDDING_MODEL = "text-embedding-3-large"
+
+
+class Document(BaseModel):
+    """A document to ingest; ``source`` identifies it across runs (e.g. its path)."""
+
+    source: str
+    text: str
+    metadata: dict[str, Any] = Field(default_factory=dict)
+
+
+class Chunk(BaseModel):
+    """
+    A chunk of a document, stored as one Qdrant point.
+
+    Attributes:
+        id: Point id, stable for the same source and position, so re-ingestion overwrites it.
+        text: The chunk text, stored as the ``text`` payload read by the search tools.
+        metadata: The document metadata with ``source`` and ``chunk_index``, stored as the ``metadata`` payload.
+        content_hash: Hash of the text, metadata and embedding model, to skip unchanged chunks.
+    """
+
+    id: str
+    text: str
+    metadata: dict[str, Any]
+    content_hash: str
+
+
+class IngestStats(BaseModel):
+    documents: int = 0
+    chunks: int = 0
+    unchanged: int = 0
+    upserted: int = 0
+    deleted: int = 0
+    failed: int = 0
+    seconds: float = 0.0
+
+
+def read_documents(path: str, patterns: list[str]) -> Iterator[Document]:
+    """
+    Streams documents from a JSONL file or from the text files under a directory.
+
+    JSONL lines hold a ``text`` and optional ``metadata`` (and ``source``); files are read whole,
+    with their path relative to the directory as source.
+
+    Args:
+        path: A ``.jsonl`` file or a directory.
+        patterns: Glob patterns of the files to read from a directory, e.g. ``["*.md"]``.
+
+    Yields:
+        Document: The documents, one at a time.
+    """
+    root = Path(path)
+    if root.is_file():
+        with root.open(encoding="utf-8") as file:
+            for line_number, line in enumerate(file, start=1):
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                metadata = record.get("metadata") or {}
+                source = record.get("source") or metadata.get("source") or f"{root.name}:{line_number}"
+                yield Document(source=str(source), text=record["text"], metadata=metadata)
+        return
+    if not root.is_dir():
+        msg = f"{path} is neither a JSONL file nor a directory."
+        raise ValueError(msg)
+    files = sorted({file for pattern in patterns for file in root.rglob(pattern) if file.is_file()})
+    for file in files:
+        source = file.relative_to(root).as_posix()
+        yield Document(source=source, text=file.read_text(encoding="utf-8", errors="replace"), metadata={})
+
+
+def split_text(text: str, chunk_size: int, overlap: int) -> list[str]:
+    """
+    Splits ``text`` into chunks of at most ``chunk_size`` characters, on paragraph breaks when possible.
+
+    Paragraphs longer than a chunk are cut on whitespace into windows overlapping by ``overlap`` characters.
+    """
+    chunks: list[str] = []
+    current = ""
+    for paragraph in (part.strip() for part in re.split(r"\n\s*\n", text)):
+        if not paragraph:
+            continue
+        if len(current) + len(paragraph) + 2 <= chunk_size:
+            current = f"{current}\n\n{paragraph}" if current else paragraph
+            continue
+        if current:
+            chunks.append(current)
+            current = ""
+        remaining = paragraph
+        while len(remaining) > chunk_size:
+            cut = remaining.rfind(" ", chunk_size - overlap, chunk_size)
+            cut = cut if cut > 0 else chunk_size
+            chunks.append(remaining[:cut].strip())
+            # Start the overlap on a word boundary, unless the overlap is a single word
+            start = remaining.find(" ", max(cut - overlap, 0), cut)
+            remaining = remaining[start + 1 if start >= 0 else max(cut - overlap, 1) :].lstrip()
+        current = remaining
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def chunk_document(document: Document, chunk_size: int, overlap: int, embedding_model: str) -> list[Chunk]:
+    """Splits a document into chunks with stable point ids and content hashes."""
+    chunks = []
+    for index, text in enumerate(split_text(document.text, chunk_size, overlap)):
+        metadata = {**document.metadata, "source": document.source, "chunk_index": index}
+        canonical = json.dumps([embedding_model, text, metadata], sort_keys=True, default=str)
+        chunks.append(
+            Chunk(
+                id=str(uuid.uuid5(uuid.NAMESPACE_URL, f"{document.source}#{index}")),
+                text=text,
+                metadata=metadata,
+                content_hash=hashlib.sha256(canonical.encode()).hexdigest(),
+            )
+        )
+    return chunks
+
+
+def get_batch_embedder(backend: str) -> tuple[str, Callable[[list[str]], list[list[float]]]]:
+    """
+    Returns the name and the batch embedding function of an embedding backend.
+
+    Args:
+        backend: ``"openai"`` or ``"onnx"``, as in ``qdrant_vector_search_tool_config``.
+
+    Returns:
+        tuple[str, Callable[[list[str]], list[list[float]]]]: The model name and ``texts -> vectors``.
+    """
+    if backend == "onnx":
+        from app.embeddings import get_onnx_embedder
+
+        embedder = get_onnx_embedder()
+        return embedder.name, embedder.embed_many
+    if backend != "openai":
+        msg = f"Unknown embedding backend {backend!r}; expected 'openai' or 'onnx'."
+        raise ValueError(msg)
+    client = get_client_registry().openai_client
+    if client is None:
+        msg = "OPENAI_API_KEY environment variable is not set."
+        raise ValueError(msg)
+
+    def embed(texts: list[str]) -> list[list[float]]:
+        response = client.embeddings.create(input=texts, model=OPENAI_EMBEDDING_MODEL)
+        return [item.embedding for item in response.data]
+
+    return OPENAI_EMBEDDING_MODEL, embed
+
+
+class Ingestor:
+    """
+    Chunks, embeds and upserts documents into a Qdrant collection.
+
+    Batches of ``batch_size`` chunks are processed by ``max_in_flight`` threads; reading
+    pauses while that many batches are pending, so memory stays bounded however large the
+    corpus. Each batch looks up the stored content hashes of its points first, and only
+    embeds and upserts the chunks that changed; it also deletes the chunks of the documents
+    it completes past their new chunk count, left over from longer versions.
+
+    Attributes:
+        client: The Qdrant client.
+        collection_name: The collection to fill, created on first upsert if missing.
+        embedding_model: Name of the embedding model, part of the content hashes.
+        embed: Batch embedding function, ``texts -> vectors``.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        collection_name: str,
+        embedding_model: str,
+        embed: Callable[[list[str]], list[list[float]]],
+        *,
+        chunk_size: int,
+        chunk_overlap: int,
+        batch_size: int,
+        max_in_flight: int,
+        max_retries: int,
+    ) -> None:
+        self.client = client
+        self.collection_name = collection_name
+        self.embedding_model = embedding_model
+        self.embed = embed
+        self.chunk_size = chunk_size
+        self.chunk_overlap = chunk_overlap
+        self.batch_size = batch_size
+        self.max_in_flight = max_in_flight
+        self.max_retries = max_retries
+        self.stats = IngestStats()
+        self.sources: set[str] = set()
+        self._collection_ready = False
+        self._collection_lock = threading.Lock()
+
+    def _retry(self, fn: Callable[[], Any]) -> Any:
+        for attempt in range(self.max_retries):
+            try:
+                return fn()
+            except Exception as e:  # noqa: BLE001
+                get_logger().warning(f"Ingestion call failed (attempt {attempt + 1}): {e!r}")
+                time.sleep(2**attempt)
+        return fn()
+
+    def _collection_exists(self) -> bool:
+        if not self._collection_ready and self.client.collection_exists(self.collection_name):
+            self._collection_ready = True
+        return self._collection_ready
+
+    def _ensure_collection(self, dimension: int) -> None:
+        if self._collection_ready:
+            return
+        from qdrant_client.http.models import Distance, PayloadSchemaType, VectorParams
+
+        # Batches reach this concurrently; only one may create the collection
+        with self._collection_lock:
+            if self._collection_exists():
+                return
+            self.client.create_collection(
+                self.collection_name, vectors_config=VectorParams(size=dimension, distance=Distance.COSINE)
+            )
+            self.client.create_payload_index(
+                self.collection_name, field_name="metadata.source", field_schema=PayloadSchemaType.KEYWORD
+            )
+            get_logger().info(f"Created collection '{self.collection_name}' ({dimension} dimensions)")
+            self._collection_ready = True
+
+    def _delete_stale_chunks(self, chunk_counts: dict[str, int]) -> None:
+        """Deletes the chunks of each document at or past its chunk count, e.g. after it got shorter."""
+        from qdrant_client.http.models import FieldCondition, Filter, FilterSelector, MatchValue, Range
+
+        if not chunk_counts or not self._collection_exists():
+            return
+        stale = Filter(
+            should=[
+                Filter(
+                    must=[
+                        FieldCondition(key="metadata.source", match=MatchValue(value=source)),
+                        FieldCondition(key="metadata.chunk_index", range=Range(gte=count)),
+                    ]
+                )
+                for source, count in chunk_counts.items()
+            ]
+        )
+        self._retry(
+            lambda: self.client.delete(self.collection_name, points_selector=FilterSelector(filter=stale), wait=True)
+        )
+
+    def _stored_hashes(self, batch: list[Chunk]) -> dict[str, str]:
+        if not batch or not self._collection_exists():
+            return {}
+        points = self._retry(
+            lambda: self.client.retrieve(
+                self.collection_name, ids=[chunk.id for chunk in batch], with_payload=["content_hash"]
+            )
+        )
+        return {str(point.id): (point.payload or {}).get("content_hash") for point in points}
+
+    def _ingest_batch(self, batch: list[Chunk], chunk_counts: dict[str, int]) -> tuple[int, int]:
+        """
+        Embeds and upserts the changed chunks of a batch, and deletes the stale chunks of the documents it completes.
+
+        Returns:
+            tuple[int, int]: The upserted and unchanged chunk counts.
+        """
+        from qdrant_client.http.models import PointStruct
+
+        self._delete_stale_chunks(chunk_counts)
+        stored = self._stored_hashes(batch)
+        changed = [chunk for chunk in batch if stored.get(chunk.id) != chunk.content_hash]
+        if not changed:
+            return 0, len(batch)
+        vectors = self._retry(lambda: self.embed([chunk.text for chunk in changed]))
+        self._ensure_collection(len(vectors[0]))
+        points = [
+            PointStruct(
+                id=chunk.id,
+                vector=vector,
+                payload={"text": chunk.text, "metadata": chunk.metadata, "content_hash": chunk.content_hash},
+            )
+            for chunk, vector in zip(changed, vectors, strict=True)
+        ]
+        self._retry(lambda: self.client.upsert(self.collection_name, points=points, wait=True))
+        return len(changed), len(batch) - len(changed)
+
+    def _batches(self, documents: Iterable[Document]) -> Iterator[tuple[list[Chunk], dict[str, int]]]:
+        """Yields batches of chunks, each with the chunk counts of the documents completed by then."""
+        batch: list[Chunk] = []
+        chunk_counts: dict[str, int] = {}
+        for document in documents:
+            self.stats.documents += 1
+            self.sources.add(document.source)
+            chunks = chunk_document(document, self.chunk_size, self.chunk_overlap, self.embedding_model)
+            self.stats.chunks += len(chunks)
+            for chunk in chunks:
+                batch.append(chunk)
+                if len(batch) == self.batch_size:
+                    yield batch, chunk_counts
+                    batch, chunk_counts = [], {}
+            chunk_counts[document.source] = len(chunks)
+        if batch or chunk_counts:
+            yield batch, chunk_counts
+
+    def _collect(self, future: Future, size: int) -> None:
+        try:
+            upserted, unchanged = future.result()
+        except Exception as e:  # noqa: BLE001
+            get_logger().error(f"Failed to ingest a batch of {size} chunks: {e!r}")
+            self.stats.failed += size
+            return
+        self.stats.upserted += upserted
+        self.stats.unchanged += unchanged
+
+    def run(self, documents: Iterable[Document]) -> IngestStats:
+        """
+        Ingests ``documents``.
+
+        Args:
+            documents: The documents, e.g. from ``read_documents``.
+
+        Returns:
+            IngestStats: Documents and chunks read, chunks upserted, unchanged and failed, and the duration.
+        """
+        start_time = time.perf_counter()
+        pending: dict[Future, int] = {}
+        with ThreadPoolExecutor(max_workers=self.max_in_flight, thread_name_prefix="ingest") as executor:
+            for batch, chunk_counts in self._batches(documents):
+                if len(pending) >= self.max_in_flight:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        self._collect(future, pending.pop(future))
+                    get_logger().info(f"Ingesting: {self.stats.model_dump()}")
+                pending[executor.submit(self._ingest_batch, batch, chunk_counts)] = len(batch)
+            for future in list(pending):
+                self._collect(future, pending.pop(future))
+        self.stats.seconds = round(time.perf_counter() - start_time, 3)
+        return self.stats
+
+    def delete_missing(self) -> int:
+        """
+        Deletes the ingested chunks of the documents the last ``run`` did not read, e.g. files since removed.
+
+        Only points written by an ingestor (with a content hash) are considered, so points stored
+        by other means are kept. Call it after ingesting the whole source, never a part of it.
+
+        Returns:
+            int: The number of deleted chunks.
+        """
+        from qdrant_client.http.models import PointIdsList
+
+        if not self._collection_exists():
+            return 0
+        stale: list[Any] = []
+        offset = None
+        while True:
+            points, offset = self._retry(
+                lambda offset=offset: self.client.scroll(
+                    self.collection_name,
+                    limit=1024,
+                    offset=offset,
+                    with_payload=["metadata", "content_hash"],
+                    with_vectors=False,
+                )
+            )
+            for point in points:
+                payload = point.payload or {}
+                source = (payload.get("metadata") or {}).get("source")
+                if payload.get("content_hash") and source not in self.sources:
+                    stale.append(point.id)
+            if offset is None:
+                break
+        for start in range(0, len(stale), self.batch_size):
+            ids = stale[start : start + self.batch_size]
+            self._retry(
+                lambda ids=ids: self.client.delete(self.collection_name, points_selector=PointIdsList(points=ids))
+            )
+        self.stats.deleted += len(stale)
+        return len(stale)
+
+
+def get_ingestor(embedding_backend: str | None = None, collection_name: str | None = None) -> Ingestor:
+    """
+    Returns an ingestor for the search tools' collection, configured by ``ingest_config``.
+
+    Args:
+        embedding_backend: ``"openai"`` or ``"onnx"``; the search tools' backend by default.
+        collection_name: The collection to fill; the search tools' collection by default.
+
+    Returns:
+        Ingestor: The ingestor, using the shared Qdrant client.
+    """
+    embedding_model, embed = get_batch_embedder(
+        embedding_backend or qdrant_vector_search_tool_config["embedding_backend"]
+    )
+    return Ingestor(
+        client=get_client_registry().qdrant_client,
+        collection_name=collection_name or qdrant_vector_search_tool_config["collection_name"],
+        embedding_model=embedding_model,
+        embed=embed,
+        chunk_size=ingest_config["chunk_size"],
+        chunk_overlap=ingest_config["chunk_overlap"],
+        batch_size=ingest_config["batch_size"],
+        max_in_flight=ingest_config["max_in_flight"],
+        max_retries=ingest_config["max_retries"],
+    )
@@ -0,0 +1,248 @@
+import sqlite3
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from functools import lru_cache
+from pathlib import Path
+
+from app.config import job_config
+from app.schemas import JobStatus, ResearchJob, ResearchQuery
+
+
+class JobStore(ABC):
+    """
+    Storage and queue of research jobs.
+
+    Finished jobs are kept for ``retention_seconds`` and then expire.
+    """
+
+    def __init__(self, retention_seconds: float) -> None:
+        self.retention_seconds = retention_seconds
+
+    @staticmethod
+    def _new_job(query: ResearchQuery) -> ResearchJob:
+        return ResearchJob(id=uuid.uuid4().hex, query=query, created_at=time.time())
+
+    def _finish(self, job: ResearchJob, status: JobStatus) -> None:
+        job.status = status
+        job.finished_at = time.time()
+        job.expires_at = job.finished_at + self.retention_seconds
+
+    @abstractmethod
+    def create(self, query: ResearchQuery) -> ResearchJob:
+        """Queues a new job for ``query``."""
+
+    @abstractmethod
+    def get(self, job_id: str) -> ResearchJob | None:
+        """Returns the job, or None if it does not exist or has expired."""
+
+    @abstractmethod
+    def claim(self) -> ResearchJob | None:
+        """Atomically marks the oldest queued job as running and returns it."""
+
+    @abstractmethod
+    def save(self, job: ResearchJob) -> None:
+        """Persists a job's progress and outcome; never clears a pending cancellation request."""
+
+    @abstractmethod
+    def cancel(self, job_id: str) -> ResearchJob | None:
+        """Cancels a queued job, or flags a running one for its worker to stop."""
+
+    @abstractmethod
+    def purge_expired(self) -> int:
+        """Deletes expired jobs and returns how many were deleted."""
+
+    def complete(self, job: ResearchJob, status: JobStatus) -> None:
+        """Marks ``job`` as finished with ``status`` and saves it."""
+        self._finish(job, status)
+        self.save(job)
+
+
+class InMemoryJobStore(JobStore):
+    """Per-process store; jobs are only visible to the API worker that created them."""
+
+    def __init__(self, retention_seconds: float) -> None:
+        super().__init__(retention_seconds)
+        self._jobs: OrderedDict[str, ResearchJob] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def create(self, query: ResearchQuery) -> ResearchJob:
+        job = self._new_job(query)
+        with self._lock:
+            self._jobs[job.id] = job
+        return job.model_copy(deep=True)
+
+    def get(self, job_id: str) -> ResearchJob | None:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None or (job.expires_at is not None and job.expires_at <= time.time()):
+                return None
+            return job.model_copy(deep=True)
+
+    def claim(self) -> ResearchJob | None:
+        with self._lock:
+            for job in self._jobs.values():
+                if job.status == JobStatus.QUEUED:
+                    job.status = JobStatus.RUNNING
+                    job.started_at = time.time()
+                    return job.model_copy(deep=True)
+        return None
+
+    def save(self, job: ResearchJob) -> None:
+        with self._lock:
+            existing = self._jobs.get(job.id)
+            job = job.model_copy(deep=True)
+            job.cancel_requested = job.cancel_requested or bool(existing and existing.cancel_requested)
+            self._jobs[job.id] = job
+
+    def cancel(self, job_id: str) -> ResearchJob | None:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return None
+            if job.status == JobStatus.QUEUED:
+                self._finish(job, JobStatus.CANCELLED)
+            elif job.status == JobStatus.RUNNING:
+                job.cancel_requested = True
+            return job.model_copy(deep=True)
+
+    def purge_expired(self) -> int:
+        now = time.time()
+        with self._lock:
+            expired = [job.id for job in self._jobs.values() if job.expires_at is not None and job.expires_at <= now]
+            for job_id in expired:
+                del self._jobs[job_id]
+        return len(expired)
+
+
+class SqliteJobStore(JobStore):
+    """
+    Store in a SQLite database, so several API workers on the same host share one queue.
+
+    Jobs are claimed inside an immediate transaction, so each one runs on a single worker.
+    """
+
+    def __init__(self, retention_seconds: float, path: str) -> None:
+        super().__init__(retention_seconds)
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(path, timeout=30, check_same_thread=False, isolation_level=None)
+        self._lock = threading.Lock()
+        with self._lock:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS jobs (
+                    id TEXT PRIMARY KEY,
+                    status TEXT NOT NULL,
+                    cancel_requested INTEGER NOT NULL DEFAULT 0,
+                    created_at REAL NOT NULL,
+                    expires_at REAL,
+                    data TEXT NOT NULL
+                )
+                """
+            )
+            self._connection.execute("CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, created_at)")
+
+    @staticmethod
+    def _load(row: tuple) -> ResearchJob:
+        job = ResearchJob.model_validate_json(row[0])
+        job.cancel_requested = job.cancel_requested or bool(row[1])
+        return job
+
+    def _write(self, job: ResearchJob) -> None:
+        self._connection.execute(
+            "INSERT INTO jobs (id, status, cancel_requested, created_at, expires_at, data) VALUES (?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT (id) DO UPDATE SET status = excluded.status, expires_at = excluded.expires_at, "
+            "data = excluded.data, cancel_requested = MAX(cancel_requested, excluded.cancel_requested)",
+            (
+                job.id,
+                job.status.value,
+                int(job.cancel_requested),
+                job.created_at,
+                job.expires_at,
+                job.model_dump_json(),
+            ),
+        )
+
+    def create(self, query: ResearchQuery) -> ResearchJob:
+        job = self._new_job(query)
+        with self._lock:
+            self._write(job)
+        return job
+
+    def get(self, job_id: str) -> ResearchJob | None:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT data, cancel_requested FROM jobs WHERE id = ? AND (expires_at IS NULL OR expires_at > ?)",
+                (job_id, time.time()),
+            ).fetchone()
+        return self._load(row) if row else None
+
+    def claim(self) -> ResearchJob | None:
+        with self._lock:
+            self._connection.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._connection.execute(
+                    "SELECT data, cancel_requested FROM jobs WHERE status = ? ORDER BY created_at LIMIT 1",
+                    (JobStatus.QUEUED.value,),
+                ).fetchone()
+                if row is None:
+                    self._connection.execute("COMMIT")
+                    return None
+                job = self._load(row)
+                job.status = JobStatus.RUNNING
+                job.started_at = time.time()
+                self._write(job)
+                self._connection.execute("COMMIT")
+            except Exception:
+                self._connection.execute("ROLLBACK")
+                raise
+        return job
+
+    def save(self, job: ResearchJob) -> None:
+        with self._lock:
+            self._write(job)
+
+    def cancel(self, job_id: str) -> ResearchJob | None:
+        with self._lock:
+            self._connection.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._connection.execute(
+                    "SELECT data, cancel_requested FROM jobs WHERE id = ?", (job_id,)
+                ).fetchone()
+                if row is None:
+                    self._connection.execute("COMMIT")
+                    return None
+                job = self._load(row)
+                if job.status == JobStatus.QUEUED:
+                    self._finish(job, JobStatus.CANCELLED)
+                elif job.status == JobStatus.RUNNING:
+                    job.cancel_requested = True
+                self._write(job)
+                self._connection.execute("COMMIT")
+            except Exception:
+                self._connection.execute("ROLLBACK")
+                raise
+        return job
+
+    def purge_expired(self) -> int:
+        with self._lock:
+            cursor = self._connection.execute(
+                "DELETE FROM jobs WHERE expires_at IS NOT NULL AND expires_at <= ?", (time.time(),)
+            )
+        return cursor.rowcount
+
+
+@lru_cache
+def get_job_store() -> JobStore:
+    """
+    Returns the process-wide job store configured by ``job_config``.
+
+    Returns:
+        JobStore: The job store.
+    """
+    if job_config["backend"] == "sqlite":
+        return SqliteJobStore(retention_seconds=job_config["retention_seconds"], path=job_config["sqlite_path"])
+    return InMemoryJobStore(retention_seconds=job_config["retention_seconds"])
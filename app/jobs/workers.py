@@ -0,0 +1,157 @@
+import asyncio
+import time
+from functools import lru_cache
+from typing import Any
+
+from fastapi import HTTPException
+
+from app.cache.response_cache import get_response_cache
+from app.config import job_config
+from app.metrics import observe_request
+from app.schemas import JobStatus, ResearchJob
+from app.tracing import trace_request
+from app.utils import get_logger
+
+from .store import JobStore, get_job_store
+
+
+class JobWorkerPool:
+    """
+    Pool of background workers running queued research jobs, one crew per worker at a time.
+
+    Workers poll the store, so with a shared store jobs queued by one API worker may run on
+    another. Progress (each finished task) is saved as it happens, and cancellation
+    requests made through any API worker are picked up within ``poll_interval`` seconds.
+
+    Attributes:
+        store: The job store to take jobs from.
+        workers: Number of jobs run concurrently.
+        poll_interval: Seconds between polls for new jobs and cancellation requests.
+    """
+
+    def __init__(self, store: JobStore, workers: int, poll_interval: float) -> None:
+        self.store = store
+        self.workers = workers
+        self.poll_interval = poll_interval
+        self._tasks: list[asyncio.Task] = []
+        self._runs: dict[str, Any] = {}
+
+    async def start(self) -> None:
+        if self._tasks:
+            return
+        self._tasks = [asyncio.create_task(self._work(), name=f"research-job-worker-{i}") for i in range(self.workers)]
+        self._tasks.append(asyncio.create_task(self._purge_expired(), name="research-job-janitor"))
+
+    async def stop(self) -> None:
+        """Stops the workers, returning the jobs they were running to the queue."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    def cancel(self, job_id: str) -> None:
+        """Stops a job running in this process right away, without waiting for the next poll."""
+        run = self._runs.get(job_id)
+        if run is not None:
+            run.cancel()
+
+    async def _work(self) -> None:
+        while True:
+            job = await asyncio.to_thread(self.store.claim)
+            if job is None:
+                await asyncio.sleep(self.poll_interval)
+                continue
+            try:
+                with trace_request():
+                    await self._execute(job)
+            except asyncio.CancelledError:
+                job.status, job.started_at, job.task_outputs = JobStatus.QUEUED, None, []
+                await asyncio.to_thread(self.store.save, job)
+                raise
+            except Exception as e:  # noqa: BLE001
+                get_logger().exception(f"Research job {job.id} failed: {e}")
+                job.error = str(e)
+                await asyncio.to_thread(self.store.complete, job, JobStatus.FAILED)
+
+    async def _execute(self, job: ResearchJob) -> None:
+        # crewAI is imported on first use (or by the lifespan warm-up), not when the app starts
+        from app.crew.crew import get_crew, seed_question_relevancy
+        from app.crew.precheck import get_relevancy_precheck
+        from app.crew.runner import CrewCancelledError, CrewRun
+        from app.crew.scheduler import attach_crew_reports
+
+        start_time = time.time()
+        response_cache = get_response_cache()
+        lookup = await response_cache.lookup(job.query) if response_cache else None
+        if lookup and lookup.response is not None:
+            job.result = response_cache.build_response(lookup, processing_time=time.time() - start_time)
+            await asyncio.to_thread(self.store.complete, job, JobStatus.SUCCEEDED)
+            return
+
+        inputs = job.query.dict(exclude_none=True)
+        crew = get_crew(inputs)
+        # The precheck accepted the question when it was queued; reuse its verdict if still cached
+        precheck = get_relevancy_precheck()
+        verdict = precheck.cached_verdict(job.query) if precheck else None
+        if verdict is not None:
+            seed_question_relevancy(crew, verdict)
+        # Namespace the job's artifacts by its id, so they can be found from the job API
+        crew.request_id = job.id
+        run = CrewRun(crew, inputs=inputs)
+        self._runs[job.id] = run
+        kickoff = asyncio.create_task(run.run())
+        # Retrieve the exception of runs abandoned on shutdown
+        kickoff.add_done_callback(lambda task: task.cancelled() or task.exception())
+        try:
+            async for event, _ in run.stream(heartbeat=self.poll_interval):
+                if event == "task":
+                    job.task_outputs = list(run.task_outputs)
+                    await asyncio.to_thread(self.store.save, job)
+                stored = await asyncio.to_thread(self.store.get, job.id)
+                if stored is not None and stored.cancel_requested:
+                    run.cancel()
+            output = await kickoff
+        except CrewCancelledError:
+            await asyncio.to_thread(self.store.complete, job, JobStatus.CANCELLED)
+            return
+        except HTTPException as e:
+            job.error = str(e.detail)
+            await asyncio.to_thread(self.store.complete, job, JobStatus.FAILED)
+            return
+        finally:
+            self._runs.pop(job.id, None)
+            if not kickoff.done():
+                run.cancel()
+
+        output.pydantic.processing_time = time.time() - start_time
+        observe_request("job", output.pydantic.processing_time)
+        # Reports first, so a later hit returns the same metadata as this response
+        attach_crew_reports(crew, output.pydantic)
+        if response_cache:
+            await response_cache.store(job.query, output.pydantic, lookup)
+            response_cache.mark_miss(output.pydantic)
+        job.result = output.pydantic
+        await asyncio.to_thread(self.store.complete, job, JobStatus.SUCCEEDED)
+
+    async def _purge_expired(self) -> None:
+        while True:
+            await asyncio.sleep(max(self.poll_interval, 60.0))
+            try:
+                await asyncio.to_thread(self.store.purge_expired)
+            except Exception as e:  # noqa: BLE001
+                get_logger().warning(f"Failed to purge expired research jobs: {e}")
+
+
+@lru_cache
+def get_job_worker_pool() -> JobWorkerPool:
+    """
+    Returns the process-wide job worker pool configured by ``job_config``.
+
+    Returns:
+        JobWorkerPool: The worker pool; started by the app lifespan.
+    """
+    return JobWorkerPool(
+        store=get_job_store(),
+        workers=job_config["workers"],
+        poll_interval=job_config["poll_interval_seconds"],
+    )
@@ -1,9 +1,53 @@
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, PlainTextResponse
 
+from .artifacts.sink import get_artifact_sink
+from .clients import close_client_registry, get_client_registry
+from .config import job_config, replay_config
+from .jobs.workers import get_job_worker_pool
+from .metrics import get_research_metrics
 from .routers import router
+from .tracing import TracingMiddleware, get_tracing_policy
+from .warmup import get_warm_up
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """
+    Holds the shared API clients, the research job workers and the artifact sink for the lifetime of the app.
+
+    The warm-up runs in the background, so the app serves (and reports not ready through
+    ``/ready``) while it does. With ``replay_config["mode"]`` set, external calls are recorded
+    or replayed for the app's lifetime.
+    """
+    recorder = None
+    if replay_config["mode"] != "off":
+        from .replay.recorder import get_external_call_recorder
+
+        recorder = get_external_call_recorder()
+        recorder.install()
+    app.state.client_registry = get_client_registry()
+    warm_up = asyncio.create_task(get_warm_up().run(), name="warm-up")
+    if job_config["enabled"]:
+        await get_job_worker_pool().start()
+    yield
+    warm_up.cancel()
+    if job_config["enabled"]:
+        await get_job_worker_pool().stop()
+    await close_client_registry()
+    await asyncio.to_thread(get_artifact_sink().close)
+    if tracing_policy := get_tracing_policy():
+        await asyncio.to_thread(tracing_policy.exporter.close)
+    if recorder:
+        recorder.uninstall()
 
-app = FastAPI()
+
+app = FastAPI(lifespan=lifespan)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -11,6 +55,8 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+if get_tracing_policy():
+    app.add_middleware(TracingMiddleware)
 app.include_router(router)
 
 
@@ -27,3 +73,16 @@ async def health_check():
 @app.get("/status")
 async def status_check():
     return {"status": "running"}
+
+
+@app.get("/ready")
+async def readiness_check() -> JSONResponse:
+    """Whether the warm-up is done and the app should get traffic (503 until then), with its step timings."""
+    warm_up = get_warm_up()
+    return JSONResponse(warm_up.status(), status_code=200 if warm_up.ready else 503)
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics() -> PlainTextResponse:
+    """Stage latencies, token counts and cache lookups in the Prometheus text format."""
+    return PlainTextResponse(get_research_metrics().render(), media_type="text/plain; version=0.0.4")
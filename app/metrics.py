@@ -0,0 +1,256 @@
+import contextvars
+import threading
+import time
+from collections import defaultdict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Any
+
+from .config import metrics_config
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: tuple[str, ...], values: tuple[str, ...], **extra: str) -> str:
+    pairs = [*zip(names, values, strict=True), *extra.items()]
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}" if pairs else ""
+
+
+class Counter:
+    """Prometheus counter with labels."""
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...]) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self._values: defaultdict[tuple[str, ...], float] = defaultdict(float)
+        self._lock = threading.Lock()
+
+    def inc(self, *labelvalues: str, amount: float = 1.0) -> None:
+        with self._lock:
+            self._values[labelvalues] += amount
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            for labelvalues, value in sorted(self._values.items()):
+                lines.append(f"{self.name}{_labels(self.labelnames, labelvalues)} {value}")
+        return lines
+
+
+class Histogram:
+    """Prometheus histogram with labels and fixed buckets."""
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...], buckets: list[float]) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self.buckets = sorted(buckets)
+        self._series: dict[tuple[str, ...], list[float]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *labelvalues: str) -> None:
+        with self._lock:
+            # Per-bucket counts, then the sum and the total count
+            series = self._series.setdefault(labelvalues, [0.0] * (len(self.buckets) + 2))
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[i] += 1
+            series[-2] += value
+            series[-1] += 1
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            for labelvalues, series in sorted(self._series.items()):
+                for bound, count in zip(self.buckets, series, strict=False):
+                    lines.append(f"{self.name}_bucket{_labels(self.labelnames, labelvalues, le=str(bound))} {count}")
+                lines.append(f"{self.name}_bucket{_labels(self.labelnames, labelvalues, le='+Inf')} {series[-1]}")
+                lines.append(f"{self.name}_sum{_labels(self.labelnames, labelvalues)} {series[-2]}")
+                lines.append(f"{self.name}_count{_labels(self.labelnames, labelvalues)} {series[-1]}")
+        return lines
+
+
+class ResearchMetrics:
+    """
+    Process-wide metrics of research requests, rendered in the Prometheus text format.
+
+    Attributes:
+        request_seconds: Latency of whole requests, by endpoint.
+        stage_seconds: Latency of crew tasks, tool calls, LLM calls and embedding calls, by stage and name.
+        tokens: LLM tokens used by crews, by kind (prompt, completion, cached_prompt).
+        cache_lookups: Cache lookups, by cache and result (hit or miss).
+    """
+
+    def __init__(self, buckets: list[float]) -> None:
+        self.request_seconds = Histogram(
+            "research_request_duration_seconds", "Latency of research requests.", ("endpoint",), buckets
+        )
+        self.stage_seconds = Histogram(
+            "research_stage_duration_seconds",
+            "Latency of the stages of research requests.",
+            ("stage", "name"),
+            buckets,
+        )
+        self.tokens = Counter("research_llm_tokens_total", "LLM tokens used by research crews.", ("kind",))
+        self.cache_lookups = Counter("research_cache_lookups_total", "Cache lookups.", ("cache", "result"))
+
+    def render(self) -> str:
+        metrics = (self.request_seconds, self.stage_seconds, self.tokens, self.cache_lookups)
+        return "\n".join(line for metric in metrics for line in metric.render()) + "\n"
+
+
+class RequestMetrics:
+    """
+    Breakdown of a single request's stage latencies, tokens and cache lookups.
+
+    Everything recorded while it is active (see ``track_request``), in the request's own
+    thread or the threads its crew starts, is also added to the process-wide metrics.
+    """
+
+    def __init__(self) -> None:
+        self.stages: defaultdict[str, defaultdict[str, list[float]]] = defaultdict(
+            lambda: defaultdict(lambda: [0, 0.0])
+        )
+        self.tokens: dict[str, int] = {}
+        self.cache_lookups: defaultdict[str, dict[str, int]] = defaultdict(lambda: {"hit": 0, "miss": 0})
+        self._lock = threading.Lock()
+
+    def add_stage(self, stage: str, name: str, seconds: float) -> None:
+        with self._lock:
+            totals = self.stages[stage][name]
+            totals[0] += 1
+            totals[1] += seconds
+
+    def add_cache_lookup(self, cache: str, result: str) -> None:
+        with self._lock:
+            self.cache_lookups[cache][result] += 1
+
+    def add_tokens(self, tokens: dict[str, int]) -> None:
+        with self._lock:
+            for kind, count in tokens.items():
+                self.tokens[kind] = self.tokens.get(kind, 0) + count
+
+    def breakdown(self) -> dict[str, Any]:
+        """Returns the calls and seconds per stage and name, the tokens and the cache lookups."""
+        with self._lock:
+            return {
+                "stages": {
+                    stage: {
+                        name: {"count": count, "seconds": round(seconds, 3)} for name, (count, seconds) in names.items()
+                    }
+                    for stage, names in self.stages.items()
+                },
+                "tokens": dict(self.tokens),
+                "cache_lookups": {cache: dict(results) for cache, results in self.cache_lookups.items()},
+            }
+
+
+_current_request: contextvars.ContextVar[RequestMetrics | None] = contextvars.ContextVar(
+    "current_request_metrics", default=None
+)
+
+
+@contextmanager
+def track_request(request: RequestMetrics) -> Iterator[RequestMetrics]:
+    """Records the metrics of the enclosed work, and of the threads it starts with its context, in ``request``."""
+    token = _current_request.set(request)
+    try:
+        yield request
+    finally:
+        _current_request.reset(token)
+
+
+def observe_stage(stage: str, name: str, seconds: float) -> None:
+    """Records the latency of one ``stage`` call (e.g. a ``tool`` call to ``name``)."""
+    get_research_metrics().stage_seconds.observe(seconds, stage, name)
+    request = _current_request.get()
+    if request is not None:
+        request.add_stage(stage, name, seconds)
+
+
+def observe_request(endpoint: str, seconds: float) -> None:
+    """Records the latency of a whole request to ``endpoint``."""
+    get_research_metrics().request_seconds.observe(seconds, endpoint)
+
+
+@contextmanager
+def timed(stage: str, name: str) -> Iterator[None]:
+    """Records the latency of the enclosed block as a ``stage`` call to ``name``."""
+    start_time = time.perf_counter()
+    try:
+        yield
+    finally:
+        observe_stage(stage, name, time.perf_counter() - start_time)
+
+
+def count_cache_lookup(cache: str, *, hit: bool) -> None:
+    """Records a lookup in ``cache``."""
+    result = "hit" if hit else "miss"
+    get_research_metrics().cache_lookups.inc(cache, result)
+    request = _current_request.get()
+    if request is not None:
+        request.add_cache_lookup(cache, result)
+
+
+def record_token_usage(usage: Any) -> None:
+    """Records the token usage of a crew run (crewAI's ``UsageMetrics``)."""
+    tokens = {
+        "prompt": usage.prompt_tokens,
+        "completion": usage.completion_tokens,
+        "cached_prompt": usage.cached_prompt_tokens,
+    }
+    for kind, count in tokens.items():
+        get_research_metrics().tokens.inc(kind, amount=count)
+    request = _current_request.get()
+    if request is not None:
+        request.add_tokens(tokens)
+
+
+_llm_calls = threading.local()
+
+
+def _on_llm_started(source: Any, _event: Any) -> None:
+    # LLM calls are synchronous, so each thread has at most one call in flight per LLM
+    if not hasattr(_llm_calls, "started_at"):
+        _llm_calls.started_at = {}
+    _llm_calls.started_at[id(source)] = time.perf_counter()
+
+
+def _on_llm_finished(source: Any, _event: Any) -> None:
+    started_at = getattr(_llm_calls, "started_at", {}).pop(id(source), None)
+    if started_at is not None:
+        observe_stage("llm", str(getattr(source, "model", "unknown")), time.perf_counter() - started_at)
+
+
+def _on_tool_finished(_source: Any, event: Any) -> None:
+    observe_stage("tool", event.tool_name, (event.finished_at - event.started_at).total_seconds())
+    count_cache_lookup("crewai_tool", hit=event.from_cache)
+
+
+@lru_cache
+def register_crew_event_handlers() -> None:
+    """Times LLM and tool calls from crewAI's event bus; registered once, as the bus cannot remove handlers."""
+    # Imported here so that serving /metrics does not import crewAI
+    from crewai.utilities.events import crewai_event_bus
+    from crewai.utilities.events.llm_events import LLMCallCompletedEvent, LLMCallFailedEvent, LLMCallStartedEvent
+    from crewai.utilities.events.tool_usage_events import ToolUsageFinishedEvent
+
+    crewai_event_bus.register_handler(LLMCallStartedEvent, _on_llm_started)
+    crewai_event_bus.register_handler(LLMCallCompletedEvent, _on_llm_finished)
+    crewai_event_bus.register_handler(LLMCallFailedEvent, _on_llm_finished)
+    crewai_event_bus.register_handler(ToolUsageFinishedEvent, _on_tool_finished)
+
+
+@lru_cache
+def get_research_metrics() -> ResearchMetrics:
+    """
+    Returns the process-wide research metrics configured by ``metrics_config``.
+
+    Returns:
+        ResearchMetrics: The metrics.
+    """
+    return ResearchMetrics(buckets=metrics_config["latency_buckets_seconds"])
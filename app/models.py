@@ -1,3 +1,5 @@
+from typing import Any
+
 from crewai import Agent, Task
 from crewai.tools import BaseTool
 from pydantic import BaseModel, Field
@@ -6,11 +8,15 @@ from .schemas import ResearchQuery
 
 
 class AgentInput(BaseModel):
-    query: ResearchQuery = Field(
-        ...,
-        description="The research query to be processed by the agent.",
+    query: ResearchQuery | None = Field(
+        None,
+        description=(
+            "The research query to be processed by the agent. Prompts use {query}/{context_info} placeholders "
+            "filled at kickoff, so this is None when building a reusable crew template."
+        ),
     )
     tools: list[BaseTool] | None = Field(None, description="List of tools available to the agent.")
+    llm: Any = Field(None, description="The LLM or model name used by the agent; None for the default model.")
 
 
 class TaskInput(BaseModel):
@@ -18,9 +24,12 @@ class TaskInput(BaseModel):
         ...,
         description="The agent responsible for executing the task.",
     )
-    query: ResearchQuery = Field(
-        ...,
-        description="The research query to be processed by the task.",
+    query: ResearchQuery | None = Field(
+        None,
+        description=(
+            "The research query to be processed by the task. Prompts use {query}/{context_info} placeholders "
+            "filled at kickoff, so this is None when building a reusable crew template."
+        ),
     )
     tools: list[BaseTool] | None = Field(None, description="List of tools available to the task.")
     context: list[Task] | None = Field(
@@ -29,7 +38,7 @@ class TaskInput(BaseModel):
     )
     output_file: str | None = Field(
         None,
-        description="The file where the output will be saved.",
+        description="A file the output is also written to; task outputs otherwise go to the artifact sink.",
     )
     output_json: type[BaseModel] | None = Field(
         None,
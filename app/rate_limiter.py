@@ -0,0 +1,49 @@
+import asyncio
+import threading
+import time
+
+
+class TokenBucketRateLimiter:
+    """
+    Thread-safe token bucket shared by sync and async callers.
+
+    Callers never fail when the bucket is empty: each one reserves the next token, even if
+    that drives the balance negative, and waits until its token is due. Requests are
+    therefore queued in arrival order across every thread and event loop in the process.
+
+    Attributes:
+        rate: Tokens added per second.
+        burst: Maximum number of tokens the bucket holds.
+    """
+
+    def __init__(self, rate: float, burst: int) -> None:
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def per_minute(cls, requests_per_minute: float, burst: int) -> "TokenBucketRateLimiter":
+        return cls(rate=requests_per_minute / 60, burst=burst)
+
+    def _reserve(self) -> float:
+        """Takes one token and returns how long the caller must wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.rate)
+            self._updated_at = now
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    def acquire(self) -> None:
+        """Blocks the calling thread until a token is available."""
+        delay = self._reserve()
+        if delay:
+            time.sleep(delay)
+
+    async def acquire_async(self) -> None:
+        """Waits, without blocking the event loop, until a token is available."""
+        delay = self._reserve()
+        if delay:
+            await asyncio.sleep(delay)
@@ -0,0 +1,84 @@
+"""
+Record/replay of the app's external calls, and a load generator to drive it.
+
+Usage:
+    uv run replay record [--fixtures DIR]                 # serve the app, recording every external call
+    uv run replay serve [--fixtures DIR] [--latency-scale 0.5]  # serve the app from the recorded calls
+    uv run replay load --concurrency 8 --requests 200 [--queries FILE] [--output report.json]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+from pathlib import Path
+
+
+def _serve(args: argparse.Namespace, mode: str) -> int:
+    import uvicorn
+
+    # Read by app.config when uvicorn imports the app
+    os.environ["REPLAY_MODE"] = mode
+    os.environ["REPLAY_FIXTURES_DIR"] = args.fixtures
+    os.environ["REPLAY_LATENCY_SCALE"] = str(args.latency_scale)
+    uvicorn.run("app.main:app", host=args.host, port=args.port, workers=args.workers)
+    return 0
+
+
+def _load(args: argparse.Namespace) -> int:
+    from .loadgen import load_queries, run_load
+
+    report = asyncio.run(
+        run_load(
+            url=args.url,
+            queries=load_queries(args.queries),
+            requests=args.requests,
+            concurrency=args.concurrency,
+            timeout=args.timeout,
+            unique=args.unique,
+        )
+    )
+    output = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(output + "\n", encoding="utf-8")
+    print(output)  # noqa: T201
+    return 0 if report["succeeded"] else 1
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Record/replay external calls and load-test the research API.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    for command, help_text in (
+        ("record", "Serve the app, recording every LLM, embedding, Tavily and Qdrant call to fixtures."),
+        ("serve", "Serve the app, answering those calls from the recorded fixtures."),
+    ):
+        serve = commands.add_parser(command, help=help_text)
+        serve.add_argument("--fixtures", default="fixtures/replay", help="Fixture directory.")
+        serve.add_argument(
+            "--latency-scale", type=float, default=1.0, help="Multiplier of the recorded latencies on replay."
+        )
+        serve.add_argument("--host", default="127.0.0.1")
+        serve.add_argument("--port", type=int, default=8000)
+        serve.add_argument("--workers", type=int, default=1)
+
+    load = commands.add_parser("load", help="Send research requests at a fixed concurrency and report latencies.")
+    load.add_argument("--url", default="http://127.0.0.1:8000/api/v1/research-navigator")
+    load.add_argument("--requests", type=int, default=50, help="Total requests to send.")
+    load.add_argument("--concurrency", type=int, default=4, help="Requests in flight at once.")
+    load.add_argument("--timeout", type=float, default=600.0, help="Per-request timeout in seconds.")
+    load.add_argument("--queries", help="File with one question or ResearchQuery JSON object per line.")
+    load.add_argument(
+        "--unique", action="store_true", help="Make every question unique so the response cache cannot answer it."
+    )
+    load.add_argument("--output", "-o", help="Also write the JSON report to this file.")
+
+    args = parser.parse_args(argv)
+    if args.command == "load":
+        return _load(args)
+    return _serve(args, "record" if args.command == "record" else "replay")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,110 @@
+import asyncio
+import itertools
+import json
+import statistics
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+DEFAULT_QUERIES = [
+    "How do surface codes improve quantum error correction thresholds?",
+    "What are the latest advances in solid-state battery electrolytes?",
+    "How effective are mRNA vaccines against emerging influenza strains?",
+    "What limits the scaling of transformer language models?",
+]
+
+
+def load_queries(path: str | None) -> list[dict[str, Any]]:
+    """
+    Reads research queries, one per line: a ``ResearchQuery`` JSON object or the plain question.
+
+    Args:
+        path: The queries file, or None for a few built-in questions.
+
+    Returns:
+        list[dict[str, Any]]: The request payloads.
+    """
+    if path is None:
+        return [{"query": query} for query in DEFAULT_QUERIES]
+    lines = [line.strip() for line in Path(path).read_text(encoding="utf-8").splitlines()]
+    queries = [json.loads(line) if line.startswith("{") else {"query": line} for line in lines if line]
+    if not queries:
+        msg = f"No queries in {path}."
+        raise ValueError(msg)
+    return queries
+
+
+def percentiles(latencies: list[float]) -> dict[str, float | None]:
+    """p50, p95 and p99 of ``latencies`` in seconds (None without data)."""
+    if not latencies:
+        return {"p50": None, "p95": None, "p99": None}
+    if len(latencies) == 1:
+        return dict.fromkeys(("p50", "p95", "p99"), latencies[0])
+    cuts = statistics.quantiles(latencies, n=100, method="inclusive")
+    return {"p50": cuts[49], "p95": cuts[94], "p99": cuts[98]}
+
+
+async def run_load(
+    url: str,
+    queries: list[dict[str, Any]],
+    requests: int,
+    concurrency: int,
+    timeout: float,  # noqa: ASYNC109 - the timeout of each HTTP request, not of the load run
+    *,
+    unique: bool = False,
+) -> dict[str, Any]:
+    """
+    Sends ``requests`` research requests to ``url`` from ``concurrency`` concurrent clients.
+
+    Args:
+        url: The research endpoint, e.g. ``http://localhost:8000/api/v1/research-navigator``.
+        queries: The request payloads, sent in turn.
+        requests: How many requests to send.
+        concurrency: How many requests are in flight at once.
+        timeout: Per-request timeout in seconds.
+        unique: Append the request number to each question so the response cache cannot answer it.
+
+    Returns:
+        dict[str, Any]: The requests sent, their outcomes, throughput and latency percentiles.
+    """
+    payloads = itertools.islice(itertools.cycle(queries), requests)
+    numbered = iter(enumerate(payloads))
+    latencies: list[float] = []
+    outcomes: Counter[str] = Counter()
+
+    async def client(http_client: httpx.AsyncClient) -> None:
+        for number, query in numbered:
+            payload = {**query, "query": f"{query['query']} (#{number})"} if unique else query
+            start_time = time.perf_counter()
+            try:
+                response = await http_client.post(url, json=payload)
+            except httpx.HTTPError as e:
+                outcomes[type(e).__name__] += 1
+                continue
+            outcomes[str(response.status_code)] += 1
+            if response.is_success:
+                latencies.append(time.perf_counter() - start_time)
+
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(timeout=timeout, limits=limits) as http_client:
+        start_time = time.perf_counter()
+        await asyncio.gather(*(client(http_client) for _ in range(concurrency)))
+        duration = time.perf_counter() - start_time
+
+    return {
+        "url": url,
+        "requests": requests,
+        "concurrency": concurrency,
+        "duration_seconds": duration,
+        "succeeded": len(latencies),
+        "outcomes": dict(outcomes),
+        "throughput_rps": len(latencies) / duration if duration else 0.0,
+        "latency_seconds": {
+            **percentiles(latencies),
+            "mean": statistics.fmean(latencies) if latencies else None,
+            "max": max(latencies, default=None),
+        },
+    }
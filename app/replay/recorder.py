@@ -0,0 +1,327 @@
+import asyncio
+import base64
+import hashlib
+import itertools
+import json
+import threading
+import time
+from collections import defaultdict
+from functools import lru_cache
+from http import HTTPStatus
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+from urllib.parse import urlsplit
+
+import httpx
+import requests
+from pydantic import BaseModel
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+from app.config import qdrant_vector_search_tool_config, replay_config
+from app.utils import get_logger
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+# Request body fields that are never written to fixtures nor part of their keys
+REDACTED_FIELDS = frozenset({"api_key"})
+
+
+def _normalize_body(body: bytes) -> str:
+    """The request body as fixtures store and key it: canonical JSON without secrets, or the raw text."""
+    text = body.decode("utf-8", errors="replace")
+    try:
+        data = json.loads(text)
+    except ValueError:
+        return text
+    if isinstance(data, dict):
+        data = {name: value for name, value in data.items() if name not in REDACTED_FIELDS}
+    return json.dumps(data, sort_keys=True, ensure_ascii=False)
+
+
+class Fixture(BaseModel):
+    """
+    One recorded external call.
+
+    Attributes:
+        kind: What was called: ``llm``, ``embedding``, ``tavily`` or ``qdrant``.
+        key: Hash of the method, path and normalized body, matched on replay.
+        method: The HTTP method.
+        url: The request URL.
+        request: The normalized request body.
+        status_code: The response status.
+        content_type: The response content type.
+        body: The decoded response body, base64-encoded if it is not UTF-8.
+        binary: Whether ``body`` is base64-encoded.
+        latency_seconds: How long the call took when recorded.
+    """
+
+    kind: str
+    key: str
+    method: str
+    url: str
+    request: str
+    status_code: int
+    content_type: str | None = None
+    body: str
+    binary: bool = False
+    latency_seconds: float
+
+    @property
+    def route(self) -> tuple[str, str, str]:
+        return self.kind, self.method, urlsplit(self.url).path
+
+    def content(self) -> bytes:
+        return base64.b64decode(self.body) if self.binary else self.body.encode("utf-8")
+
+    def headers(self) -> dict[str, str]:
+        return {"content-type": self.content_type} if self.content_type else {}
+
+
+class ExternalCallRecorder:
+    """
+    Records the app's external calls to fixture files, or replays them from there.
+
+    Works at the transport level (``httpx`` transports and ``requests``' ``HTTPAdapter``),
+    which every client in the app (litellm's OpenAI client, the embedding clients, Tavily
+    and Qdrant) sends through, so no client has to know about it.
+
+    On replay, a call is answered by the fixture with the same key; calls with no exact
+    match (e.g. for queries that were never recorded) get the fixtures recorded for the same
+    route in turn, so a few recorded runs can drive any load.
+    """
+
+    def __init__(self, mode: str, fixtures_dir: str, latency_scale: float, hosts: dict[str, list[str]]) -> None:
+        if mode not in {"record", "replay"}:
+            msg = f"Unknown replay mode {mode!r}; expected 'record' or 'replay'."
+            raise ValueError(msg)
+        self.mode = mode
+        self.fixtures_dir = Path(fixtures_dir)
+        self.latency_scale = latency_scale
+        self.hosts = {host: kind for kind, names in hosts.items() for host in names}
+        self.misses = 0
+        self._by_key: dict[str, Iterator[Fixture]] = {}
+        self._by_route: dict[tuple[str, str, str], Iterator[Fixture]] = {}
+        self._lock = threading.Lock()
+        self._originals: dict[str, Any] = {}
+        if mode == "replay":
+            self._load()
+
+    def classify(self, url: str, path: str) -> str | None:
+        """The kind of call to ``url``, or None if calls to its host are not recorded."""
+        parts = urlsplit(url)
+        kind = self.hosts.get(parts.netloc) or self.hosts.get(parts.hostname or "")
+        if kind == "openai":
+            return "embedding" if path.rstrip("/").endswith("/embeddings") else "llm"
+        return kind
+
+    @staticmethod
+    def key(method: str, path: str, request: str) -> str:
+        return hashlib.sha256(json.dumps([method, path, request]).encode()).hexdigest()
+
+    def _load(self) -> None:
+        by_key: defaultdict[str, list[Fixture]] = defaultdict(list)
+        by_route: defaultdict[tuple[str, str, str], list[Fixture]] = defaultdict(list)
+        for path in sorted(self.fixtures_dir.glob("*.jsonl")):
+            with path.open(encoding="utf-8") as file:
+                for line in file:
+                    if line.strip():
+                        fixture = Fixture.model_validate_json(line)
+                        by_key[fixture.key].append(fixture)
+                        by_route[fixture.route].append(fixture)
+        if not by_key:
+            msg = f"No replay fixtures in {self.fixtures_dir}; record some first."
+            raise ValueError(msg)
+        self._by_key = {key: itertools.cycle(fixtures) for key, fixtures in by_key.items()}
+        self._by_route = {route: itertools.cycle(fixtures) for route, fixtures in by_route.items()}
+        get_logger().info(f"Loaded {sum(map(len, by_key.values()))} replay fixtures from {self.fixtures_dir}")
+
+    def lookup(self, kind: str, method: str, url: str, request: str) -> Fixture:
+        """The fixture answering a call, by key or else by route."""
+        path = urlsplit(url).path
+        with self._lock:
+            fixtures = self._by_key.get(self.key(method, path, request))
+            if fixtures is None:
+                self.misses += 1
+                fixtures = self._by_route.get((kind, method, path))
+            if fixtures is None:
+                msg = f"No replay fixture for {kind} call {method} {url}."
+                raise LookupError(msg)
+            return next(fixtures)
+
+    def record(
+        self,
+        kind: str,
+        method: str,
+        url: str,
+        request: str,
+        status_code: int,
+        content_type: str | None,
+        content: bytes,
+        latency_seconds: float,
+    ) -> None:
+        """Appends a call to ``<fixtures_dir>/<kind>.jsonl``."""
+        try:
+            body, encoded = content.decode("utf-8"), False
+        except UnicodeDecodeError:
+            body, encoded = base64.b64encode(content).decode("ascii"), True
+        fixture = Fixture(
+            kind=kind,
+            key=self.key(method, urlsplit(url).path, request),
+            method=method,
+            url=url,
+            request=request,
+            status_code=status_code,
+            content_type=content_type,
+            body=body,
+            binary=encoded,
+            latency_seconds=latency_seconds,
+        )
+        with self._lock:
+            self.fixtures_dir.mkdir(parents=True, exist_ok=True)
+            with (self.fixtures_dir / f"{kind}.jsonl").open("a", encoding="utf-8") as file:
+                file.write(fixture.model_dump_json() + "\n")
+
+    def _httpx_response(self, fixture: Fixture, request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            fixture.status_code, headers=fixture.headers(), content=fixture.content(), request=request
+        )
+
+    def _requests_response(self, fixture: Fixture, request: requests.PreparedRequest) -> requests.Response:
+        response = requests.Response()
+        response.status_code = fixture.status_code
+        response.reason = HTTPStatus(fixture.status_code).phrase
+        response.headers = CaseInsensitiveDict(fixture.headers())
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        response._content = fixture.content()  # noqa: SLF001 - requests has no public setter
+        response.url = request.url
+        response.request = request
+        return response
+
+    def _handle_httpx(self, transport: httpx.HTTPTransport, request: httpx.Request) -> httpx.Response:
+        original = self._originals["httpx"]
+        kind = self.classify(str(request.url), request.url.path)
+        if kind is None:
+            return original(transport, request)
+        method, url, body = request.method, str(request.url), _normalize_body(request.read())
+        if self.mode == "replay":
+            fixture = self.lookup(kind, method, url, body)
+            time.sleep(fixture.latency_seconds * self.latency_scale)
+            return self._httpx_response(fixture, request)
+        start_time = time.perf_counter()
+        response = original(transport, request)
+        content = response.read()
+        latency = time.perf_counter() - start_time
+        self.record(
+            kind, method, url, body, response.status_code, response.headers.get("content-type"), content, latency
+        )
+        return httpx.Response(
+            response.status_code,
+            headers={"content-type": response.headers.get("content-type", "")},
+            content=content,
+            request=request,
+        )
+
+    async def _handle_async_httpx(self, transport: httpx.AsyncHTTPTransport, request: httpx.Request) -> httpx.Response:
+        original = self._originals["async_httpx"]
+        kind = self.classify(str(request.url), request.url.path)
+        if kind is None:
+            return await original(transport, request)
+        method, url, body = request.method, str(request.url), _normalize_body(await request.aread())
+        if self.mode == "replay":
+            fixture = self.lookup(kind, method, url, body)
+            await asyncio.sleep(fixture.latency_seconds * self.latency_scale)
+            return self._httpx_response(fixture, request)
+        start_time = time.perf_counter()
+        response = await original(transport, request)
+        content = await response.aread()
+        latency = time.perf_counter() - start_time
+        content_type = response.headers.get("content-type")
+        await asyncio.to_thread(
+            self.record, kind, method, url, body, response.status_code, content_type, content, latency
+        )
+        return httpx.Response(
+            response.status_code, headers={"content-type": content_type or ""}, content=content, request=request
+        )
+
+    def _handle_requests(
+        self, adapter: HTTPAdapter, request: requests.PreparedRequest, *args: Any, **kwargs: Any
+    ) -> requests.Response:
+        original = self._originals["requests"]
+        path = urlsplit(request.url).path
+        kind = self.classify(request.url, path)
+        if kind is None:
+            return original(adapter, request, *args, **kwargs)
+        raw = request.body.encode("utf-8") if isinstance(request.body, str) else request.body or b""
+        method, url, body = request.method, request.url, _normalize_body(raw)
+        if self.mode == "replay":
+            fixture = self.lookup(kind, method, url, body)
+            time.sleep(fixture.latency_seconds * self.latency_scale)
+            return self._requests_response(fixture, request)
+        start_time = time.perf_counter()
+        response = original(adapter, request, *args, **kwargs)
+        content = response.content
+        latency = time.perf_counter() - start_time
+        self.record(
+            kind, method, url, body, response.status_code, response.headers.get("content-type"), content, latency
+        )
+        return response
+
+    def install(self) -> None:
+        """Routes the calls of every ``httpx`` and ``requests`` client in the process through the recorder."""
+        if self._originals:
+            return
+        self._originals = {
+            "httpx": httpx.HTTPTransport.handle_request,
+            "async_httpx": httpx.AsyncHTTPTransport.handle_async_request,
+            "requests": HTTPAdapter.send,
+        }
+        recorder = self
+
+        def handle_request(transport: httpx.HTTPTransport, request: httpx.Request) -> httpx.Response:
+            return recorder._handle_httpx(transport, request)
+
+        async def handle_async_request(transport: httpx.AsyncHTTPTransport, request: httpx.Request) -> httpx.Response:
+            return await recorder._handle_async_httpx(transport, request)
+
+        def send(adapter: HTTPAdapter, request: requests.PreparedRequest, *args: Any, **kwargs: Any) -> Any:
+            return recorder._handle_requests(adapter, request, *args, **kwargs)
+
+        httpx.HTTPTransport.handle_request = handle_request
+        httpx.AsyncHTTPTransport.handle_async_request = handle_async_request
+        HTTPAdapter.send = send
+        get_logger().info(f"Replay recorder installed in {self.mode} mode, fixtures in {self.fixtures_dir}")
+
+    def uninstall(self) -> None:
+        """Restores the original transports."""
+        if not self._originals:
+            return
+        httpx.HTTPTransport.handle_request = self._originals["httpx"]
+        httpx.AsyncHTTPTransport.handle_async_request = self._originals["async_httpx"]
+        HTTPAdapter.send = self._originals["requests"]
+        self._originals = {}
+        if self.mode == "replay" and self.misses:
+            get_logger().info(f"{self.misses} replayed calls had no exact fixture and were answered by route")
+
+
+@lru_cache
+def get_external_call_recorder() -> ExternalCallRecorder | None:
+    """
+    Returns the process-wide recorder configured by ``replay_config``, or None if it is off.
+
+    Returns:
+        ExternalCallRecorder | None: The recorder.
+    """
+    if replay_config["mode"] == "off":
+        return None
+    hosts = {kind: list(names) for kind, names in replay_config["hosts"].items()}
+    qdrant_url = urlsplit(qdrant_vector_search_tool_config["qdrant_url"] or "")
+    if qdrant_url.netloc:
+        hosts["qdrant"] = [qdrant_url.netloc]
+    return ExternalCallRecorder(
+        mode=replay_config["mode"],
+        fixtures_dir=replay_config["fixtures_dir"],
+        latency_scale=replay_config["latency_scale"],
+        hosts=hosts,
+    )
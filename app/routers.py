@@ -1,25 +1,240 @@
+import asyncio
+import json
 import time
+from collections.abc import AsyncIterator
+from typing import TYPE_CHECKING, Any
 
-from fastapi import APIRouter
+from fastapi import APIRouter, HTTPException, status
+from fastapi.responses import StreamingResponse
 
-from .crew.crew import get_crew
-from .schemas import ResearchQuery, ResearchResponse
+from .cache.response_cache import get_response_cache
+from .config import batch_config, job_config, streaming_config
+from .jobs.store import get_job_store
+from .jobs.workers import get_job_worker_pool
+from .metrics import observe_request
+from .schemas import (
+    BatchResearchItem,
+    BatchResearchRequest,
+    BatchResearchResponse,
+    ResearchJob,
+    ResearchQuery,
+    ResearchResponse,
+)
+from .utils import get_logger
+
+if TYPE_CHECKING:
+    from .models import QuestionRelevancyResponse
 
 router = APIRouter(prefix="/api/v1", tags=["api"])
 
 
-@router.post("/research-navigator", response_model=ResearchResponse)
-async def research_navigator(query_data: ResearchQuery) -> ResearchResponse:
+async def _precheck_relevancy(query_data: ResearchQuery) -> "QuestionRelevancyResponse | None":
     """
-    Endpoint to get the research navigator crew.
+    Rejects irrelevant questions before a crew is built, the way ``question_relevancy_callback`` does.
+
+    Returns:
+        QuestionRelevancyResponse | None: The verdict of a relevant question, to seed the crew with, if any.
     """
+    from .crew.precheck import get_relevancy_precheck
+
+    precheck = get_relevancy_precheck()
+    verdict = await precheck.check(query_data) if precheck else None
+    if verdict is not None and not verdict.relevant:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=verdict.model_dump_json())
+    return verdict
+
+
+async def _research(query_data: ResearchQuery) -> ResearchResponse:
+    # crewAI is imported on first use (or by the lifespan warm-up), not when the app starts
+    from .crew.crew import get_crew, seed_question_relevancy
+    from .crew.scheduler import attach_crew_reports
+
     # Pass the query_data directly to get_crew instead of the hashable key
     start_time = time.time()
+    response_cache = get_response_cache()
+    lookup = await response_cache.lookup(query_data) if response_cache else None
+    if lookup and lookup.response is not None:
+        observe_request("research", time.time() - start_time)
+        return response_cache.build_response(lookup, processing_time=time.time() - start_time)
+    verdict = await _precheck_relevancy(query_data)
+
     crew = get_crew(query_data.dict(exclude_none=True))
+    if verdict is not None:
+        seed_question_relevancy(crew, verdict)
     response = await crew.kickoff_async(
         inputs=query_data.dict(exclude_none=True),
     )
     end_time = time.time()
     print(response)
     response.pydantic.processing_time = end_time - start_time
+    observe_request("research", end_time - start_time)
+    # Reports first, so a later hit returns the same metadata as this response
+    attach_crew_reports(crew, response.pydantic)
+    if response_cache:
+        await response_cache.store(query_data, response.pydantic, lookup)
+        response_cache.mark_miss(response.pydantic)
     return response.pydantic
+
+
+@router.post("/research-navigator", response_model=ResearchResponse)
+async def research_navigator(query_data: ResearchQuery) -> ResearchResponse:
+    """
+    Endpoint to get the research navigator crew.
+    """
+    return await _research(query_data)
+
+
+@router.post("/research-navigator/batch", response_model=BatchResearchResponse)
+async def research_navigator_batch(batch: BatchResearchRequest) -> BatchResearchResponse:
+    """
+    Runs several research queries with bounded concurrency and returns their results in order.
+
+    Identical queries run once. The crews share the process-wide retrieval caches and
+    single-flight group, so searches, embeddings and extractions repeated across the batch
+    are made once. A failing query reports its error without failing the batch.
+    """
+    if len(batch.queries) > batch_config["max_queries"]:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"A batch may contain at most {batch_config['max_queries']} queries.",
+        )
+    start_time = time.time()
+    semaphore = asyncio.Semaphore(batch_config["max_concurrency"])
+
+    async def research(query_data: ResearchQuery) -> ResearchResponse:
+        async with semaphore:
+            return await _research(query_data)
+
+    unique = {query.cache_key(): query for query in batch.queries}
+    outcomes = dict(
+        zip(
+            unique,
+            await asyncio.gather(*(research(query) for query in unique.values()), return_exceptions=True),
+            strict=True,
+        )
+    )
+
+    results = []
+    for query in batch.queries:
+        outcome = outcomes[query.cache_key()]
+        if isinstance(outcome, HTTPException):
+            results.append(
+                BatchResearchItem(query=query, error={"status_code": outcome.status_code, "detail": outcome.detail})
+            )
+        elif isinstance(outcome, BaseException):
+            # gather returns CancelledError and other BaseExceptions as outcomes too
+            get_logger().error(f"Batch research query failed: {outcome!r}")
+            results.append(
+                BatchResearchItem(
+                    query=query, error={"status_code": 500, "detail": str(outcome) or type(outcome).__name__}
+                ),
+            )
+        else:
+            results.append(BatchResearchItem(query=query, response=outcome))
+    return BatchResearchResponse(
+        results=results,
+        processing_time=time.time() - start_time,
+        metadata={"queries": len(batch.queries), "unique_queries": len(unique)},
+    )
+
+
+def _sse(event: str, data: Any) -> str:
+    if event == "ping":
+        return ": ping\n\n"
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+
+@router.post("/research-navigator/stream")
+async def research_navigator_stream(query_data: ResearchQuery) -> StreamingResponse:
+    """
+    Streaming variant of the research navigator endpoint, using server-sent events.
+
+    Emits a ``task`` event as each crew task completes, ``token`` events while the final
+    report is synthesized, and the ``ResearchResponse`` as the last (``result``) event.
+    Failures end the stream with an ``error`` event. Disconnecting stops the crew.
+    """
+    from .crew.crew import get_crew, seed_question_relevancy
+    from .crew.runner import CrewRun
+    from .crew.scheduler import attach_crew_reports
+
+    start_time = time.time()
+    response_cache = get_response_cache()
+    lookup = await response_cache.lookup(query_data) if response_cache else None
+    verdict = None
+    if not (lookup and lookup.response is not None):
+        verdict = await _precheck_relevancy(query_data)
+
+    async def events() -> AsyncIterator[str]:
+        if lookup and lookup.response is not None:
+            response = response_cache.build_response(lookup, processing_time=time.time() - start_time)
+            yield _sse("result", response.model_dump(mode="json"))
+            return
+
+        crew = get_crew(query_data.dict(exclude_none=True))
+        if verdict is not None:
+            seed_question_relevancy(crew, verdict)
+        stream_agent = crew.tasks[-1].agent if streaming_config["stream_synthesis_tokens"] else None
+        run = CrewRun(crew, inputs=query_data.dict(exclude_none=True), stream_agent=stream_agent)
+        kickoff = asyncio.create_task(run.run())
+        # Retrieve the exception of runs abandoned by a disconnected client
+        kickoff.add_done_callback(lambda task: task.cancelled() or task.exception())
+        try:
+            async for event, data in run.stream(heartbeat=streaming_config["heartbeat_seconds"]):
+                yield _sse(event, data)
+            output = await kickoff
+        except HTTPException as e:
+            yield _sse("error", {"status_code": e.status_code, "detail": e.detail})
+            return
+        except Exception as e:  # noqa: BLE001
+            get_logger().exception(f"Streaming research run failed: {e}")
+            yield _sse("error", {"status_code": 500, "detail": str(e)})
+            return
+        finally:
+            if not kickoff.done():
+                run.cancel()
+
+        output.pydantic.processing_time = time.time() - start_time
+        observe_request("stream", output.pydantic.processing_time)
+        attach_crew_reports(crew, output.pydantic)
+        if response_cache:
+            await response_cache.store(query_data, output.pydantic, lookup)
+            response_cache.mark_miss(output.pydantic)
+        yield _sse("result", output.pydantic.model_dump(mode="json"))
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+def _job_not_found(job_id: str) -> HTTPException:
+    return HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Job '{job_id}' not found or expired.")
+
+
+@router.post("/jobs", response_model=ResearchJob, status_code=status.HTTP_202_ACCEPTED)
+async def create_research_job(query_data: ResearchQuery) -> ResearchJob:
+    """Queues a research query for the background workers and returns its job right away."""
+    if not job_config["enabled"]:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="Research jobs are disabled.")
+    await _precheck_relevancy(query_data)
+    return await asyncio.to_thread(get_job_store().create, query_data)
+
+
+@router.get("/jobs/{job_id}", response_model=ResearchJob)
+async def get_research_job(job_id: str) -> ResearchJob:
+    """Returns a job's status, the outputs of the tasks finished so far and, once done, its response."""
+    job = await asyncio.to_thread(get_job_store().get, job_id)
+    if job is None:
+        raise _job_not_found(job_id)
+    return job
+
+
+@router.delete("/jobs/{job_id}", response_model=ResearchJob)
+async def cancel_research_job(job_id: str) -> ResearchJob:
+    """Cancels a job. Queued jobs are cancelled at once; running ones stop at their crew's next step."""
+    job = await asyncio.to_thread(get_job_store().cancel, job_id)
+    if job is None:
+        raise _job_not_found(job_id)
+    get_job_worker_pool().cancel(job_id)
+    return job
@@ -1,3 +1,6 @@
+import hashlib
+import json
+from enum import StrEnum
 from typing import Any
 
 from pydantic import BaseModel, computed_field
@@ -9,8 +12,16 @@ class ResearchQuery(BaseModel):
     additional_params: dict | None = None
 
     def __hash__(self) -> int:
-        dict_items = tuple(frozenset(self.dict(exclude_none=True).items()))
-        return hash(dict_items)
+        return hash(self.cache_key())
+
+    def cache_key(self) -> str:
+        """
+        Stable digest of the fields compared by ``__eq__``.
+
+        Unlike ``hash()``, the digest is the same in every process, so it can key shared caches.
+        """
+        canonical = json.dumps(self.dict(exclude_none=True), sort_keys=True, default=str)
+        return hashlib.sha256(canonical.encode()).hexdigest()
 
     def __eq__(self, other: "ResearchQuery") -> bool:
         if not isinstance(other, ResearchQuery):
@@ -31,3 +42,41 @@ class ResearchResponse(BaseModel):
     related_topics: list[str]
     processing_time: float | None
     metadata: dict[str, Any] | None
+
+
+class JobStatus(StrEnum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+
+class ResearchJob(BaseModel):
+    id: str
+    status: JobStatus = JobStatus.QUEUED
+    query: ResearchQuery
+    task_outputs: list[dict[str, Any]] = []
+    result: ResearchResponse | None = None
+    error: str | None = None
+    cancel_requested: bool = False
+    created_at: float
+    started_at: float | None = None
+    finished_at: float | None = None
+    expires_at: float | None = None
+
+
+class BatchResearchRequest(BaseModel):
+    queries: list[ResearchQuery]
+
+
+class BatchResearchItem(BaseModel):
+    query: ResearchQuery
+    response: ResearchResponse | None = None
+    error: dict[str, Any] | None = None
+
+
+class BatchResearchResponse(BaseModel):
+    results: list[BatchResearchItem]
+    processing_time: float
+    metadata: dict[str, Any] | None = None
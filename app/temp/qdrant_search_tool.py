@@ -5,12 +5,14 @@ from typing import Any, ClassVar  # Import ClassVar
 
 try:
     from qdrant_client import AsyncQdrantClient, QdrantClient
-    from qdrant_client.http.models import FieldCondition, Filter, MatchValue
+    from qdrant_client.http.models import FieldCondition, Filter, MatchValue, QueryRequest
 
     QDRANT_AVAILABLE = True
 except ImportError:
     QDRANT_AVAILABLE = False
     QdrantClient = Any  # type placeholder
+    AsyncQdrantClient = Any
+    QueryRequest = Any
     Filter = Any
     FieldCondition = Any
     MatchValue = Any
@@ -18,6 +20,8 @@ except ImportError:
 from crewai.tools import BaseTool
 from pydantic import BaseModel, Field
 
+from app.metrics import timed
+
 
 class QdrantToolSchema(BaseModel):
     """Input for QdrantTool."""
@@ -83,19 +87,40 @@ class QdrantVectorSearchTool(BaseTool):
             "If not provided, the default model will be used."
         ),
     )
+    embedding_cache: Any = Field(
+        default=None,
+        description=(
+            "Optional cache with get(model, text) and set(model, text, vector) methods, "
+            "consulted before calling the default embedding model."
+        ),
+    )
+    single_flight: Any = Field(
+        default=None,
+        description="Optional SingleFlight sharing identical concurrent calls to the default embedding model.",
+    )
+    embedder: Any = Field(
+        default=None,
+        description=(
+            "Optional local embedding model with a name and embed_many(texts)/aembed_many(texts) methods, "
+            "used instead of OpenAI's text-embedding-3-large."
+        ),
+    )
 
     def __init__(self, **kwargs: Any) -> None:  # Add type hints for kwargs and return
         """Initialize QdrantVectorSearchTool."""  # Add docstring
         super().__init__(**kwargs)
         if QDRANT_AVAILABLE:
-            self.client = QdrantClient(
-                url=self.qdrant_url,
-                api_key=self.qdrant_api_key if self.qdrant_api_key else None,
-            )
-            self.async_client = AsyncQdrantClient(
-                url=self.qdrant_url,
-                api_key=self.qdrant_api_key if self.qdrant_api_key else None,
-            )
+            # Clients may be injected (e.g. shared ones from the client registry)
+            if self.client is None:
+                self.client = QdrantClient(
+                    url=self.qdrant_url,
+                    api_key=self.qdrant_api_key if self.qdrant_api_key else None,
+                )
+            if self.async_client is None:
+                self.async_client = AsyncQdrantClient(
+                    url=self.qdrant_url,
+                    api_key=self.qdrant_api_key if self.qdrant_api_key else None,
+                )
         else:
             import click
 
@@ -114,6 +139,11 @@ class QdrantVectorSearchTool(BaseTool):
                 )
                 raise ImportError(qdrant_client_pkg_required_error_msg)
 
+    @property
+    def embedding_model(self) -> str:
+        """Name of the default embedding model, also used in embedding cache keys."""
+        return self.embedder.name if self.embedder is not None else "text-embedding-3-large"
+
     def _run(
         self,
         query: str,
@@ -146,28 +176,28 @@ class QdrantVectorSearchTool(BaseTool):
 
         # Search in Qdrant using the built-in query method
         query_vector = (
-            self._vectorize_query_sync(query, embedding_model="text-embedding-3-large")
+            self._vectorize_query_sync(query, embedding_model=self.embedding_model)
             if not self.custom_embedding_fn
             else self.custom_embedding_fn(query)
         )
-        search_results = self.client.query_points(
-            collection_name=self.collection_name,
-            query=query_vector,
-            query_filter=search_filter,
-            limit=self.limit,
-            score_threshold=self.score_threshold,
-        )
+        with timed("qdrant", "query_points"):
+            search_results = self.client.query_points(
+                collection_name=self.collection_name,
+                query=query_vector,
+                query_filter=search_filter,
+                limit=self.limit,
+                score_threshold=self.score_threshold,
+            )
 
         # Format results similar to storage implementation
-        results = []
-        # Extract the list of ScoredPoint objects from the tuple
-        for point in search_results:
-            result = {
-                "metadata": point[1][0].payload.get("metadata", {}),
-                "context": point[1][0].payload.get("text", ""),
-                "distance": point[1][0].score,
+        results = [
+            {
+                "metadata": point.payload.get("metadata", {}),
+                "context": point.payload.get("text", ""),
+                "distance": point.score,
             }
-            results.append(result)
+            for point in search_results.points
+        ]
 
         return json.dumps(results, indent=2)
 
@@ -183,24 +213,40 @@ class QdrantVectorSearchTool(BaseTool):
         """
         from openai import Client
 
+        if self.embedding_cache is not None:
+            cached = self.embedding_cache.get(embedding_model, query)
+            if cached is not None:
+                return cached.tolist()
+
         # Define error messages as constants
         openai_api_key_not_set_error_msg = "OPENAI_API_KEY environment variable is not set."
         # Lazy initialization of the sync client
-        if not self.openai_client:
+        if self.embedder is None and not self.openai_client:
             api_key = os.getenv("OPENAI_API_KEY")
             if not api_key:
                 raise ValueError(openai_api_key_not_set_error_msg)
             self.openai_client = Client(api_key=api_key)
 
-        embedding = (
-            self.openai_client.embeddings.create(
-                input=[query],
-                model=embedding_model,
-            )
-            .data[0]
-            .embedding
-        )
-        return embedding
+        def embed() -> list[float]:
+            with timed("embedding", embedding_model):
+                if self.embedder is not None:
+                    embedding = self.embedder.embed_many([query])[0]
+                else:
+                    embedding = (
+                        self.openai_client.embeddings.create(
+                            input=[query],
+                            model=embedding_model,
+                        )
+                        .data[0]
+                        .embedding
+                    )
+            if self.embedding_cache is not None:
+                self.embedding_cache.set(embedding_model, query, embedding)
+            return embedding
+
+        if self.single_flight is None:
+            return embed()
+        return self.single_flight.do(json.dumps(["embedding", embedding_model, query]), embed)
 
     async def _arun(
         self,
@@ -234,28 +280,28 @@ class QdrantVectorSearchTool(BaseTool):
 
         # Search in Qdrant using the built-in query method
         query_vector = (
-            await self._vectorize_query_async(query, embedding_model="text-embedding-3-large")
+            await self._vectorize_query_async(query, embedding_model=self.embedding_model)
             if not self.custom_embedding_fn
             else self.custom_embedding_fn(query)
         )
-        search_results = await self.async_client.query_points(
-            collection_name=self.collection_name,
-            query=query_vector,
-            query_filter=search_filter,
-            limit=self.limit,
-            score_threshold=self.score_threshold,
-        )
+        with timed("qdrant", "query_points"):
+            search_results = await self.async_client.query_points(
+                collection_name=self.collection_name,
+                query=query_vector,
+                query_filter=search_filter,
+                limit=self.limit,
+                score_threshold=self.score_threshold,
+            )
 
         # Format results similar to storage implementation
-        results = []
-        # Extract the list of ScoredPoint objects from the tuple
-        for point in search_results:
-            result = {
-                "metadata": point[1][0].payload.get("metadata", {}),
-                "context": point[1][0].payload.get("text", ""),
-                "distance": point[1][0].score,
+        results = [
+            {
+                "metadata": point.payload.get("metadata", {}),
+                "context": point.payload.get("text", ""),
+                "distance": point.score,
             }
-            results.append(result)
+            for point in search_results.points
+        ]
 
         return json.dumps(results, indent=2)
 
@@ -271,21 +317,307 @@ class QdrantVectorSearchTool(BaseTool):
         """
         from openai import AsyncClient
 
+        if self.embedding_cache is not None:
+            cached = self.embedding_cache.get(embedding_model, query)
+            if cached is not None:
+                return cached.tolist()
+
         # Define error messages as constants
         openai_api_key_not_set_error_msg = "OPENAI_API_KEY environment variable is not set."
         # Lazy initialization of the async client
-        if not self.openai_async_client:
+        if self.embedder is None and not self.openai_async_client:
             api_key = os.getenv("OPENAI_API_KEY")
             if not api_key:
                 raise ValueError(openai_api_key_not_set_error_msg)
             self.openai_async_client = AsyncClient(api_key=api_key)
 
-        embedding = (
-            await self.openai_async_client.embeddings.create(
-                input=[query],
-                model=embedding_model,
+        async def embed() -> list[float]:
+            with timed("embedding", embedding_model):
+                if self.embedder is not None:
+                    embedding = (await self.embedder.aembed_many([query]))[0]
+                else:
+                    response = await self.openai_async_client.embeddings.create(
+                        input=[query],
+                        model=embedding_model,
+                    )
+                    embedding = response.data[0].embedding
+            if self.embedding_cache is not None:
+                self.embedding_cache.set(embedding_model, query, embedding)
+            return embedding
+
+        if self.single_flight is None:
+            return await embed()
+        return await self.single_flight.ado(json.dumps(["embedding", embedding_model, query]), embed)
+
+
+class QdrantBatchToolSchema(BaseModel):
+    """Input for QdrantVectorBatchSearchTool."""
+
+    queries: list[str] = Field(
+        ...,
+        description=(
+            "All queries to search the Qdrant database with, in a single call. Pass only the queries, not the question."
+        ),
+    )
+    filter_by: str | None = Field(
+        default=None,
+        description="Filter by properties. Pass only the properties, not the question.",
+    )
+    filter_value: str | None = Field(
+        default=None,
+        description="Filter by value. Pass only the value, not the question.",
+    )
+
+
+class QdrantVectorBatchSearchTool(QdrantVectorSearchTool):
+    """Tool to run several vector similarity searches on Qdrant in one round trip.
+
+    All queries are embedded in a single embeddings request and searched with a single
+    batch query. Hits are merged by point id, keeping each point's best score.
+    """
+
+    name: str = "QdrantVectorBatchSearchTool"
+    description: str = (
+        "A tool to search the Qdrant database for relevant information on internal documents "
+        "with several queries at once. Prefer it over running single searches one by one."
+    )
+    args_schema: type[BaseModel] = QdrantBatchToolSchema
+
+    def embed(self, texts: list[str], *, use_cache: bool = True) -> list[list[float]]:
+        """Embeds texts in one request with the tool's embedding backend.
+
+        Args:
+            texts (list[str]): The texts to embed
+            use_cache (bool): Whether to read and fill the embedding cache; leave it off for
+                one-off texts such as retrieved passages, which would evict the cached queries
+
+        Returns:
+            list[list[float]]: Their vectors, in order
+        """
+        return self._vectorize_queries_sync(texts, self.embedding_model, use_cache=use_cache)
+
+    def _batch_requests(
+        self,
+        vectors: list[list[float]],
+        filter_by: str | None,
+        filter_value: str | None,
+    ) -> list[QueryRequest]:
+        search_filter = None
+        if filter_by and filter_value:
+            search_filter = Filter(must=[FieldCondition(key=filter_by, match=MatchValue(value=filter_value))])
+        return [
+            QueryRequest(
+                query=vector,
+                filter=search_filter,
+                limit=self.limit,
+                score_threshold=self.score_threshold,
+                with_payload=True,
             )
-            .data[0]
-            .embedding
-        )
-        return embedding
+            for vector in vectors
+        ]
+
+    @staticmethod
+    def _merge_batch_results(queries: list[str], responses: list[Any]) -> str:
+        """Merges per-query responses by point id, keeping the best score and every matching query."""
+        merged: dict[Any, dict[str, Any]] = {}
+        for query, response in zip(queries, responses, strict=True):
+            for point in response.points:
+                result = merged.get(point.id)
+                if result is None:
+                    merged[point.id] = {
+                        "metadata": point.payload.get("metadata", {}),
+                        "context": point.payload.get("text", ""),
+                        "distance": point.score,
+                        "queries": [query],
+                    }
+                    continue
+                result["queries"].append(query)
+                result["distance"] = max(result["distance"], point.score)
+
+        results = sorted(merged.values(), key=lambda result: result["distance"], reverse=True)
+        return json.dumps(results, indent=2)
+
+    def _vectorize_queries_sync(
+        self, queries: list[str], embedding_model: str, *, use_cache: bool = True
+    ) -> list[list[float]]:
+        """Vectorizes every query with one embeddings request for the uncached ones.
+
+        Args:
+            queries (list[str]): The queries to vectorize
+            embedding_model (str): The embedding model to use
+            use_cache (bool): Whether to read and fill the embedding cache
+
+        Returns:
+            list[list[float]]: The vectorized queries, in order
+        """
+        if self.custom_embedding_fn:
+            return [self.custom_embedding_fn(query) for query in queries]
+
+        vectors, missing = self._cached_vectors(queries, embedding_model, use_cache=use_cache)
+        if missing and self.embedder is not None:
+            with timed("embedding", embedding_model):
+                embeddings = self.embedder.embed_many(missing)
+            self._fill_vectors(queries, vectors, missing, embeddings, embedding_model, use_cache=use_cache)
+        elif missing:
+            from openai import Client
+
+            if not self.openai_client:
+                api_key = os.getenv("OPENAI_API_KEY")
+                if not api_key:
+                    openai_api_key_not_set_error_msg = "OPENAI_API_KEY environment variable is not set."
+                    raise ValueError(openai_api_key_not_set_error_msg)
+                self.openai_client = Client(api_key=api_key)
+            with timed("embedding", embedding_model):
+                response = self.openai_client.embeddings.create(input=missing, model=embedding_model)
+            self._fill_vectors(
+                queries,
+                vectors,
+                missing,
+                [item.embedding for item in response.data],
+                embedding_model,
+                use_cache=use_cache,
+            )
+        return vectors
+
+    async def _vectorize_queries_async(
+        self, queries: list[str], embedding_model: str, *, use_cache: bool = True
+    ) -> list[list[float]]:
+        """Vectorizes every query with one async embeddings request for the uncached ones.
+
+        Args:
+            queries (list[str]): The queries to vectorize
+            embedding_model (str): The embedding model to use
+            use_cache (bool): Whether to read and fill the embedding cache
+
+        Returns:
+            list[list[float]]: The vectorized queries, in order
+        """
+        if self.custom_embedding_fn:
+            return [self.custom_embedding_fn(query) for query in queries]
+
+        vectors, missing = self._cached_vectors(queries, embedding_model, use_cache=use_cache)
+        if missing and self.embedder is not None:
+            with timed("embedding", embedding_model):
+                embeddings = await self.embedder.aembed_many(missing)
+            self._fill_vectors(queries, vectors, missing, embeddings, embedding_model, use_cache=use_cache)
+        elif missing:
+            from openai import AsyncClient
+
+            if not self.openai_async_client:
+                api_key = os.getenv("OPENAI_API_KEY")
+                if not api_key:
+                    openai_api_key_not_set_error_msg = "OPENAI_API_KEY environment variable is not set."
+                    raise ValueError(openai_api_key_not_set_error_msg)
+                self.openai_async_client = AsyncClient(api_key=api_key)
+            with timed("embedding", embedding_model):
+                response = await self.openai_async_client.embeddings.create(input=missing, model=embedding_model)
+            self._fill_vectors(
+                queries,
+                vectors,
+                missing,
+                [item.embedding for item in response.data],
+                embedding_model,
+                use_cache=use_cache,
+            )
+        return vectors
+
+    def _cached_vectors(
+        self, queries: list[str], embedding_model: str, *, use_cache: bool = True
+    ) -> tuple[list[Any], list[str]]:
+        """Returns the cached vectors (None where missing) and the distinct queries still to embed."""
+        cache = self.embedding_cache if use_cache else None
+        vectors: list[Any] = [None] * len(queries)
+        missing: list[str] = []
+        for i, query in enumerate(queries):
+            cached = cache.get(embedding_model, query) if cache is not None else None
+            if cached is not None:
+                vectors[i] = cached.tolist()
+            elif query not in missing:
+                missing.append(query)
+        return vectors, missing
+
+    def _fill_vectors(
+        self,
+        queries: list[str],
+        vectors: list[Any],
+        missing: list[str],
+        embeddings: list[list[float]],
+        embedding_model: str,
+        *,
+        use_cache: bool = True,
+    ) -> None:
+        embedded = dict(zip(missing, embeddings, strict=True))
+        if use_cache and self.embedding_cache is not None:
+            for query, embedding in embedded.items():
+                self.embedding_cache.set(embedding_model, query, embedding)
+        for i, query in enumerate(queries):
+            if vectors[i] is None:
+                vectors[i] = embedded[query]
+
+    def _run(
+        self,
+        queries: list[str],
+        filter_by: str | None = None,
+        filter_value: str | None = None,
+    ) -> str:
+        """Execute a batch of vector similarity searches on Qdrant.
+
+        Args:
+            queries: Search queries to vectorize and match
+            filter_by: Optional metadata field to filter on
+            filter_value: Optional value to filter by
+
+        Returns:
+            JSON string containing the merged search results with metadata, best scores and matching queries
+
+        Raises:
+            ValueError: If Qdrant credentials are missing
+        """
+        qdrant_url_not_set_error_msg = "QDRANT_URL is not set"
+        if not self.qdrant_url:
+            raise ValueError(qdrant_url_not_set_error_msg)
+        queries = list(dict.fromkeys(queries))
+        if not queries:
+            return json.dumps([])
+
+        vectors = self._vectorize_queries_sync(queries, embedding_model=self.embedding_model)
+        with timed("qdrant", "query_batch_points"):
+            responses = self.client.query_batch_points(
+                collection_name=self.collection_name,
+                requests=self._batch_requests(vectors, filter_by, filter_value),
+            )
+        return self._merge_batch_results(queries, responses)
+
+    async def _arun(
+        self,
+        queries: list[str],
+        filter_by: str | None = None,
+        filter_value: str | None = None,
+    ) -> str:
+        """Execute a batch of vector similarity searches on Qdrant.
+
+        Args:
+            queries: Search queries to vectorize and match
+            filter_by: Optional metadata field to filter on
+            filter_value: Optional value to filter by
+
+        Returns:
+            JSON string containing the merged search results with metadata, best scores and matching queries
+
+        Raises:
+            ValueError: If Qdrant credentials are missing
+        """
+        qdrant_url_not_set_error_msg = "QDRANT_URL is not set"
+        if not self.qdrant_url:
+            raise ValueError(qdrant_url_not_set_error_msg)
+        queries = list(dict.fromkeys(queries))
+        if not queries:
+            return json.dumps([])
+
+        vectors = await self._vectorize_queries_async(queries, embedding_model=self.embedding_model)
+        with timed("qdrant", "query_batch_points"):
+            responses = await self.async_client.query_batch_points(
+                collection_name=self.collection_name,
+                requests=self._batch_requests(vectors, filter_by, filter_value),
+            )
+        return self._merge_batch_results(queries, responses)
@@ -1,11 +1,15 @@
+import asyncio
 import json
 import os
+import time
 from typing import Any, Literal
 
 from crewai.tools import BaseTool
 from dotenv import load_dotenv
 from pydantic import BaseModel, Field
 
+from .tavily_search_tool import normalize_url
+
 load_dotenv()
 try:
     from tavily import AsyncTavilyClient, TavilyClient
@@ -50,6 +54,11 @@ class TavilyExtractorTool(BaseTool):
         args_schema: The schema for the tool's arguments.
         api_key: The Tavily API key.
         proxies: Optional proxies for the API requests.
+        async_runner: Optional runner with ``run``/``arun`` methods executing coroutines on the
+            event loop that owns ``async_client``.
+        extraction_cache: Optional per-URL ``ExtractionCache``; only uncached URLs are sent to Tavily.
+        single_flight: Optional ``SingleFlight``; URLs being extracted by a concurrent call are awaited,
+            not extracted again.
     """
 
     model_config = {}
@@ -66,6 +75,9 @@ class TavilyExtractorTool(BaseTool):
         default=None,
         description="Optional proxies to use for the Tavily API requests.",
     )
+    async_runner: Any = None
+    extraction_cache: Any = None
+    single_flight: Any = None
 
     def __init__(self, **kwargs):
         """
@@ -76,8 +88,11 @@ class TavilyExtractorTool(BaseTool):
         """
         super().__init__(**kwargs)
         if TAVILY_AVAILABLE:
-            self.client = TavilyClient(api_key=self.api_key, proxies=self.proxies)
-            self.async_client = AsyncTavilyClient(api_key=self.api_key, proxies=self.proxies)
+            # Clients may be injected (e.g. shared ones from the client registry)
+            if self.client is None:
+                self.client = TavilyClient(api_key=self.api_key, proxies=self.proxies)
+            if self.async_client is None:
+                self.async_client = AsyncTavilyClient(api_key=self.api_key, proxies=self.proxies)
         else:
             import click
 
@@ -93,6 +108,153 @@ class TavilyExtractorTool(BaseTool):
                     "Please install it with: uv add tavily-python"
                 )
 
+    def _split_cached(
+        self, urls: list[str], extract_depth: str, include_images: bool
+    ) -> tuple[dict[str, dict[str, Any]], list[str]]:
+        """Returns the cached results by normalized URL and the URLs that still have to be extracted."""
+        if self.extraction_cache is None:
+            return {}, urls
+        cached = {}
+        missing = []
+        for url in urls:
+            content = self.extraction_cache.get(normalize_url(url), extract_depth, include_images=include_images)
+            if content is None:
+                missing.append(url)
+            else:
+                cached[normalize_url(url)] = content
+        return cached, missing
+
+    def _assemble(
+        self,
+        urls: list[str],
+        cached: dict[str, dict[str, Any]],
+        response: dict[str, Any],
+        extract_depth: str,
+        include_images: bool,
+        start_time: float,
+    ) -> dict[str, Any]:
+        """Caches the freshly extracted pages and merges them with the cached ones in request order."""
+        fetched = {}
+        for result in response.get("results", []):
+            key = normalize_url(result.get("url", ""))
+            fetched[key] = result
+            if self.extraction_cache is not None:
+                self.extraction_cache.set(key, extract_depth, result, include_images=include_images)
+
+        results = []
+        for url in urls:
+            key = normalize_url(url)
+            if key in cached:
+                results.append({"url": url, **cached[key]})
+            elif key in fetched:
+                results.append(fetched[key])
+        return {
+            "results": results,
+            "failed_results": response.get("failed_results", []),
+            "response_time": time.perf_counter() - start_time,
+        }
+
+    def _join_flights(
+        self, missing: list[str], extract_depth: str, include_images: bool
+    ) -> tuple[dict[str, Any], dict[str, Any]]:
+        """Splits the missing URLs into flights this call leads and flights led by concurrent calls."""
+        if self.single_flight is None:
+            return dict.fromkeys(missing), {}
+        leading, waiting = {}, {}
+        for url in missing:
+            key = json.dumps(["tavily-extract", normalize_url(url), extract_depth, bool(include_images)])
+            flight, leader = self.single_flight.join(key)
+            (leading if leader else waiting)[url] = (key, flight)
+        return leading, waiting
+
+    def _land_flights(
+        self, leading: dict[str, Any], response: dict[str, Any] | None = None, error: BaseException | None = None
+    ) -> None:
+        """Hands each led URL's result (None if it failed) to the concurrent calls waiting for it."""
+        if self.single_flight is None:
+            return
+        results = {normalize_url(result.get("url", "")): result for result in (response or {}).get("results", [])}
+        for url, (key, flight) in leading.items():
+            self.single_flight.land(key, flight, results.get(normalize_url(url)), error)
+
+    @staticmethod
+    def _merge_waited(response: dict[str, Any], waited: dict[str, Any]) -> dict[str, Any]:
+        """Adds the results extracted for this call by concurrent calls to ``response``."""
+        results = list(response.get("results", []))
+        failed_results = list(response.get("failed_results", []))
+        for url, result in waited.items():
+            if isinstance(result, dict):
+                results.append(result)
+            else:
+                failed_results.append({"url": url, "error": repr(result) if result else "Extraction failed."})
+        return {"results": results, "failed_results": failed_results}
+
+    def _fetch_missing(
+        self, missing: list[str], extract_depth: str, include_images: bool, timeout: int
+    ) -> dict[str, Any]:
+        """Extracts the missing URLs with the sync client."""
+        leading, waiting = self._join_flights(missing, extract_depth, include_images)
+        response = {}
+        if leading:
+            try:
+                response = self.client.extract(
+                    urls=list(leading), extract_depth=extract_depth, include_images=include_images, timeout=timeout
+                )
+            except BaseException as e:
+                self._land_flights(leading, error=e)
+                raise
+            self._land_flights(leading, response)
+        waited = {}
+        for url, (_, flight) in waiting.items():
+            try:
+                waited[url] = flight.result()
+            except Exception as e:  # noqa: BLE001
+                waited[url] = e
+        return self._merge_waited(response, waited)
+
+    async def _afetch_missing(
+        self, missing: list[str], extract_depth: str, include_images: bool, timeout: int
+    ) -> dict[str, Any]:
+        """Extracts the missing URLs with the async client."""
+        leading, waiting = self._join_flights(missing, extract_depth, include_images)
+        response = {}
+        if leading:
+            try:
+                response = await self.async_client.extract(
+                    urls=list(leading), extract_depth=extract_depth, include_images=include_images, timeout=timeout
+                )
+            except BaseException as e:
+                self._land_flights(leading, error=e)
+                raise
+            self._land_flights(leading, response)
+        waited = {}
+        for url, (_, flight) in waiting.items():
+            try:
+                waited[url] = await asyncio.wrap_future(flight)
+            except Exception as e:  # noqa: BLE001
+                waited[url] = e
+        return self._merge_waited(response, waited)
+
+    def _cached_extract(
+        self, urls: list[str] | str, extract_depth: str, include_images: bool, timeout: int
+    ) -> dict[str, Any]:
+        """Extracts with the sync client, fetching only the URLs missing from ``extraction_cache``."""
+        start_time = time.perf_counter()
+        urls = list(dict.fromkeys([urls] if isinstance(urls, str) else urls))
+        cached, missing = self._split_cached(urls, extract_depth, include_images)
+        response = self._fetch_missing(missing, extract_depth, include_images, timeout) if missing else {}
+        return self._assemble(urls, cached, response, extract_depth, include_images, start_time)
+
+    async def _acached_extract(
+        self, urls: list[str] | str, extract_depth: str, include_images: bool, timeout: int
+    ) -> dict[str, Any]:
+        """Extracts with the async client, fetching only the URLs missing from ``extraction_cache``."""
+        start_time = time.perf_counter()
+        urls = list(dict.fromkeys([urls] if isinstance(urls, str) else urls))
+        cached, missing = self._split_cached(urls, extract_depth, include_images)
+        response = await self._afetch_missing(missing, extract_depth, include_images, timeout) if missing else {}
+        return self._assemble(urls, cached, response, extract_depth, include_images, start_time)
+
     def _run(
         self,
         urls: list[str] | str,
@@ -113,7 +275,7 @@ class TavilyExtractorTool(BaseTool):
             A JSON string containing the extracted data.
         """
         return json.dumps(
-            self.client.extract(
+            self._cached_extract(
                 urls=urls,
                 extract_depth=extract_depth,
                 include_images=include_images,
@@ -141,12 +303,13 @@ class TavilyExtractorTool(BaseTool):
         Returns:
             A JSON string containing the extracted data.
         """
+        coro = self._acached_extract(
+            urls=urls,
+            extract_depth=extract_depth,
+            include_images=include_images,
+            timeout=timeout,
+        )
         return json.dumps(
-            self.async_client.extract(
-                urls=urls,
-                extract_depth=extract_depth,
-                include_images=include_images,
-                timeout=timeout,
-            ),
+            await (self.async_runner.arun(coro) if self.async_runner else coro),
             indent=2,
         )
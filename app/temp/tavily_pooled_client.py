@@ -0,0 +1,209 @@
+import asyncio
+import json
+import os
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager, suppress
+from http import HTTPStatus
+from typing import Any
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    from tavily import AsyncTavilyClient, TavilyClient
+    from tavily.errors import BadRequestError, ForbiddenError, InvalidAPIKeyError, UsageLimitExceededError
+
+    TAVILY_AVAILABLE = True
+except ImportError:
+    TAVILY_AVAILABLE = False
+    TavilyClient = object
+    AsyncTavilyClient = object
+
+TAVILY_BASE_URL = "https://api.tavily.com"
+TAVILY_MAX_TIMEOUT = 120
+
+
+def _raise_for_tavily_status(status_code: int, body: Any, response: Any) -> None:
+    """
+    Maps a non-200 Tavily response onto the exceptions raised by tavily-python.
+
+    Args:
+        status_code: The HTTP status code of the response.
+        body: The decoded JSON body of the response, if any.
+        response: The raw response object, used for the generic fallback.
+    """
+    detail = ""
+    with suppress(AttributeError, TypeError):
+        detail = body.get("detail", {}).get("error", None)
+
+    if status_code == HTTPStatus.TOO_MANY_REQUESTS:
+        raise UsageLimitExceededError(detail)
+    if status_code in [403, 432, 433]:
+        raise ForbiddenError(detail)
+    if status_code == HTTPStatus.UNAUTHORIZED:
+        raise InvalidAPIKeyError(detail)
+    if status_code == HTTPStatus.BAD_REQUEST:
+        raise BadRequestError(detail)
+    response.raise_for_status()
+
+
+class PooledTavilyClient(TavilyClient):
+    """
+    TavilyClient that sends every request over one keep-alive ``requests.Session``.
+
+    The stock client calls ``requests.post`` for each request, which opens a new
+    connection (and TLS handshake) every time. Requests wait for the optional shared
+    rate limiter and are retried with exponential backoff when Tavily answers 429.
+
+    Attributes:
+        session: The shared session holding the connection pool.
+        rate_limiter: Optional limiter with a blocking ``acquire()`` method.
+        max_retries: How many times a rate-limited request is retried.
+        retry_backoff: Initial retry delay in seconds, doubled on each attempt.
+    """
+
+    def __init__(
+        self,
+        api_key: str | None = None,
+        proxies: dict[str, str] | None = None,
+        max_keepalive_connections: int = 10,
+        rate_limiter: Any = None,
+        max_retries: int = 3,
+        retry_backoff: float = 1.0,
+        **_: Any,
+    ) -> None:
+        super().__init__(api_key=api_key, proxies=proxies)
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_keepalive_connections)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.rate_limiter = rate_limiter
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+
+    def _post_once(self, path: str, data: dict, timeout: int) -> dict:
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+        response = self.session.post(
+            self.base_url + path,
+            data=json.dumps(data),
+            headers=self.headers,
+            timeout=min(timeout, TAVILY_MAX_TIMEOUT),
+            proxies=self.proxies,
+        )
+        if response.status_code == HTTPStatus.OK:
+            return response.json()
+        try:
+            body = response.json()
+        except ValueError:
+            body = None
+        _raise_for_tavily_status(response.status_code, body, response)
+        return {}
+
+    def _post(self, path: str, data: dict, timeout: int) -> dict:
+        for attempt in range(self.max_retries):
+            try:
+                return self._post_once(path, data, timeout)
+            except UsageLimitExceededError:
+                time.sleep(self.retry_backoff * 2**attempt)
+        return self._post_once(path, data, timeout)
+
+    def _search(self, query: str, timeout: int = 60, **kwargs: Any) -> dict:
+        return self._post("/search", {"query": query, **kwargs}, timeout)
+
+    def _extract(
+        self,
+        urls: list[str] | str,
+        include_images: bool = False,  # noqa: FBT001, FBT002 - TavilyClient._extract's signature
+        extract_depth: str = "basic",
+        timeout: int = 60,
+        **kwargs: Any,
+    ) -> dict:
+        data = {"urls": urls, "include_images": include_images, "extract_depth": extract_depth, **kwargs}
+        return self._post("/extract", data, timeout)
+
+    def close(self) -> None:
+        """Closes the pooled connections."""
+        self.session.close()
+
+
+class PooledAsyncTavilyClient(AsyncTavilyClient):
+    """
+    AsyncTavilyClient that reuses one keep-alive ``httpx.AsyncClient``.
+
+    The stock client creates (and closes) a new ``httpx.AsyncClient`` inside every
+    call; here the client factory hands out the shared client instead. Requests wait
+    for the optional shared rate limiter and are retried with exponential backoff when
+    Tavily answers 429.
+
+    Attributes:
+        http_client: The shared httpx client holding the connection pool.
+        rate_limiter: Optional limiter with an awaitable ``acquire_async()`` method.
+        max_retries: How many times a rate-limited request is retried.
+        retry_backoff: Initial retry delay in seconds, doubled on each attempt.
+    """
+
+    def __init__(
+        self,
+        api_key: str | None = None,
+        proxies: dict[str, str] | None = None,
+        max_connections: int = 20,
+        max_keepalive_connections: int = 10,
+        keepalive_expiry: float = 30.0,
+        rate_limiter: Any = None,
+        max_retries: int = 3,
+        retry_backoff: float = 1.0,
+        **_: Any,
+    ) -> None:
+        super().__init__(api_key=api_key, proxies=proxies)
+        self.rate_limiter = rate_limiter
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        api_key = api_key or os.getenv("TAVILY_API_KEY")
+        limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        proxies = proxies or {}
+        mounts = {
+            f"{scheme}://": httpx.AsyncHTTPTransport(proxy=proxies[scheme], limits=limits)
+            for scheme in ("http", "https")
+            if proxies.get(scheme)
+        }
+        self.http_client = httpx.AsyncClient(
+            headers={"Content-Type": "application/json", "Authorization": f"Bearer {api_key}"},
+            base_url=TAVILY_BASE_URL,
+            limits=limits,
+            mounts=mounts or None,
+        )
+        self._client_creator = self._shared_client
+
+    @asynccontextmanager
+    async def _shared_client(self) -> AsyncIterator[httpx.AsyncClient]:
+        # Unlike ``async with httpx.AsyncClient()``, leaving this block keeps the pool open
+        yield self.http_client
+
+    async def _call(self, request: Callable[..., Awaitable[dict]], *args: Any, **kwargs: Any) -> dict:
+        for attempt in range(self.max_retries + 1):
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire_async()
+            try:
+                return await request(*args, **kwargs)
+            except UsageLimitExceededError:
+                if attempt == self.max_retries:
+                    raise
+                await asyncio.sleep(self.retry_backoff * 2**attempt)
+        return {}
+
+    async def _search(self, query: str, **kwargs: Any) -> dict:
+        return await self._call(super()._search, query, **kwargs)
+
+    async def _extract(self, urls: list[str] | str, *args: Any, **kwargs: Any) -> dict:
+        return await self._call(super()._extract, urls, *args, **kwargs)
+
+    async def aclose(self) -> None:
+        """Closes the pooled connections."""
+        await self.http_client.aclose()
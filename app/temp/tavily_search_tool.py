@@ -1,7 +1,10 @@
+import asyncio
 import json
 import os
+import time
 from collections.abc import Sequence
 from typing import Any, Literal
+from urllib.parse import urlsplit, urlunsplit
 
 from crewai.tools import BaseTool
 from dotenv import load_dotenv
@@ -51,6 +54,10 @@ class TavilySearchTool(BaseTool):
         args_schema: The schema for the tool's arguments.
         api_key: The Tavily API key.
         proxies: Optional proxies for the API requests.
+        async_runner: Optional runner with ``run``/``arun`` methods executing coroutines on the
+            event loop that owns ``async_client``.
+        result_cache: Optional ``ToolResultCache`` serving repeated searches without an API call.
+        single_flight: Optional ``SingleFlight`` sharing identical concurrent searches.
     """
 
     model_config = {}
@@ -70,12 +77,18 @@ class TavilySearchTool(BaseTool):
         default=None,
         description="Optional proxies to use for the Tavily API requests.",
     )
+    async_runner: Any = None
+    result_cache: Any = None
+    single_flight: Any = None
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         if TAVILY_AVAILABLE:
-            self.client = TavilyClient(api_key=self.api_key, proxies=self.proxies)
-            self.async_client = AsyncTavilyClient(api_key=self.api_key, proxies=self.proxies)
+            # Clients may be injected (e.g. shared ones from the client registry)
+            if self.client is None:
+                self.client = TavilyClient(api_key=self.api_key, proxies=self.proxies)
+            if self.async_client is None:
+                self.async_client = AsyncTavilyClient(api_key=self.api_key, proxies=self.proxies)
         else:
             import click
 
@@ -91,6 +104,44 @@ class TavilySearchTool(BaseTool):
                     "Please install it with: uv add tavily-python"
                 )
 
+    @staticmethod
+    def _flight_key(search_kwargs: dict[str, Any]) -> str:
+        return json.dumps(["tavily-search", search_kwargs], sort_keys=True, default=str)
+
+    def _cached_search(self, timeout: int, **search_kwargs: Any) -> dict:
+        """Searches with the sync client, serving repeated searches from ``result_cache``."""
+        if self.result_cache is not None:
+            cached = self.result_cache.get("search", search_kwargs)
+            if cached is not None:
+                return cached
+
+        def search() -> dict:
+            response = self.client.search(timeout=timeout, **search_kwargs)
+            if self.result_cache is not None:
+                self.result_cache.set("search", search_kwargs, response)
+            return response
+
+        if self.single_flight is None:
+            return search()
+        return self.single_flight.do(self._flight_key(search_kwargs), search)
+
+    async def _acached_search(self, timeout: int, **search_kwargs: Any) -> dict:
+        """Searches with the async client, serving repeated searches from ``result_cache``."""
+        if self.result_cache is not None:
+            cached = self.result_cache.get("search", search_kwargs)
+            if cached is not None:
+                return cached
+
+        async def search() -> dict:
+            response = await self.async_client.search(timeout=timeout, **search_kwargs)
+            if self.result_cache is not None:
+                self.result_cache.set("search", search_kwargs, response)
+            return response
+
+        if self.single_flight is None:
+            return await search()
+        return await self.single_flight.ado(self._flight_key(search_kwargs), search)
+
     def _run(
         self,
         query: str,
@@ -127,7 +178,7 @@ class TavilySearchTool(BaseTool):
             A JSON string containing the search results.
         """
         return json.dumps(
-            self.client.search(
+            self._cached_search(
                 query=query,
                 search_depth=search_depth,
                 topic=topic,
@@ -179,20 +230,215 @@ class TavilySearchTool(BaseTool):
         Returns:
             A JSON string containing the search results.
         """
+        coro = self._acached_search(
+            query=query,
+            search_depth=search_depth,
+            topic=topic,
+            time_range=time_range,
+            days=days,
+            max_results=max_results,
+            include_domains=include_domains,
+            exclude_domains=exclude_domains,
+            include_answer=include_answer,
+            include_raw_content=include_raw_content,
+            include_images=include_images,
+            timeout=timeout,
+        )
         return json.dumps(
-            self.async_client.search(
-                query=query,
-                search_depth=search_depth,
-                topic=topic,
-                time_range=time_range,
-                days=days,
-                max_results=max_results,
-                include_domains=include_domains,
-                exclude_domains=exclude_domains,
-                include_answer=include_answer,
-                include_raw_content=include_raw_content,
-                include_images=include_images,
-                timeout=timeout,
-            ),
+            await (self.async_runner.arun(coro) if self.async_runner else coro),
             indent=2,
         )
+
+
+class TavilyMultiSearchToolSchema(BaseModel):
+    """Input schema for TavilyMultiSearchTool."""
+
+    queries: list[str] = Field(..., description="All search query strings to run, in a single call.")
+    search_depth: Literal["basic", "advanced"] = Field("basic", description="The depth of the search.")
+    topic: Literal["general", "news", "finance"] = Field("general", description="The topic to focus the search on.")
+    time_range: Literal["day", "week", "month", "year"] | None = Field(
+        None, description="The time range for the search."
+    )
+    days: int = Field(7, description="The number of days to search back.")
+    max_results: int = Field(5, description="The maximum number of results to return per query.")
+    include_domains: Sequence[str] | None = Field(None, description="A list of domains to include in the search.")
+    exclude_domains: Sequence[str] | None = Field(None, description="A list of domains to exclude from the search.")
+    include_raw_content: bool = Field(False, description="Whether to include the raw content of the search results.")
+
+
+def normalize_url(url: str) -> str:
+    """
+    Normalizes a URL for deduplication (lowercase scheme and host, no fragment or trailing slash).
+
+    Args:
+        url: The URL to normalize.
+
+    Returns:
+        The normalized URL.
+    """
+    parts = urlsplit(url.strip())
+    path = parts.path.rstrip("/")
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, parts.query, ""))
+
+
+class TavilyMultiSearchTool(TavilySearchTool):
+    """
+    Tool that runs several Tavily searches concurrently and merges their results.
+
+    Searches run on the async client with at most ``max_concurrency`` in flight, each bounded
+    by ``deadline`` seconds. Results are deduplicated by URL, keeping the best-scoring snippet.
+
+    Attributes:
+        max_concurrency: Maximum number of searches in flight at once.
+        deadline: Per-search deadline in seconds; searches exceeding it are reported as failed.
+    """
+
+    name: str = "Tavily Multi Search"
+    description: str = (
+        "A tool that runs several web searches at once using the Tavily Search API. "
+        "Pass every query in one call. It returns a JSON object with the merged results, duplicate URLs removed."
+    )
+    args_schema: type[BaseModel] = TavilyMultiSearchToolSchema
+    max_concurrency: int = Field(default=5, description="Maximum number of searches in flight at once.")
+    deadline: float = Field(default=30.0, description="Per-search deadline in seconds.")
+
+    async def _search_all(self, queries: list[str], **search_kwargs: Any) -> dict:
+        """
+        Runs every query concurrently and merges the results.
+
+        Args:
+            queries: The search query strings.
+            **search_kwargs: Search parameters shared by every query.
+
+        Returns:
+            A dict with the merged ``results``, the ``failed_queries`` and the total ``response_time``.
+        """
+        start_time = time.perf_counter()
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def search(query: str) -> dict:
+            async with semaphore:
+                # The search may lead a single flight other requests wait on; the deadline
+                # only abandons this caller's wait, the search itself runs to completion
+                flight = asyncio.ensure_future(
+                    self._acached_search(query=query, timeout=int(self.deadline), **search_kwargs)
+                )
+                flight.add_done_callback(lambda task: task.cancelled() or task.exception())
+                return await asyncio.wait_for(asyncio.shield(flight), timeout=self.deadline)
+
+        queries = list(dict.fromkeys(queries))
+        responses = await asyncio.gather(*(search(query) for query in queries), return_exceptions=True)
+
+        merged: dict[str, dict[str, Any]] = {}
+        unattributed: list[dict[str, Any]] = []
+        failed_queries = []
+        for query, response in zip(queries, responses, strict=True):
+            if isinstance(response, BaseException):
+                failed_queries.append({"query": query, "error": repr(response)})
+                continue
+            for result in response.get("results", []):
+                if not result.get("url"):
+                    # Nothing to match results without a URL by
+                    unattributed.append({**result, "queries": [query]})
+                    continue
+                key = normalize_url(result["url"])
+                existing = merged.get(key)
+                if existing is None or result.get("score", 0) > existing.get("score", 0):
+                    merged[key] = {**result, "queries": [*(existing["queries"] if existing else []), query]}
+                else:
+                    existing["queries"].append(query)
+
+        return {
+            "queries": queries,
+            "results": sorted(
+                [*merged.values(), *unattributed], key=lambda result: result.get("score", 0), reverse=True
+            ),
+            "failed_queries": failed_queries,
+            "response_time": time.perf_counter() - start_time,
+        }
+
+    def _run(
+        self,
+        queries: list[str],
+        search_depth: Literal["basic", "advanced"] = "basic",
+        topic: Literal["general", "news", "finance"] = "general",
+        time_range: Literal["day", "week", "month", "year"] | None = None,
+        days: int = 7,
+        max_results: int = 5,
+        include_domains: Sequence[str] | None = None,
+        exclude_domains: Sequence[str] | None = None,
+        include_raw_content: bool = False,
+    ) -> str:
+        """
+        Synchronously runs several searches concurrently using the Tavily API.
+
+        Args:
+            queries: The search query strings.
+            search_depth: The depth of the search ('basic' or 'advanced').
+            topic: The topic to focus the search on ('general', 'news', 'finance').
+            time_range: The time range for the search ('day', 'week', 'month', 'year').
+            days: The number of days to search back.
+            max_results: The maximum number of results to return per query.
+            include_domains: A list of domains to include in the search.
+            exclude_domains: A list of domains to exclude from the search.
+            include_raw_content: Whether to include the raw content of the search results.
+
+        Returns:
+            A JSON string containing the merged search results.
+        """
+        coro = self._search_all(
+            queries,
+            search_depth=search_depth,
+            topic=topic,
+            time_range=time_range,
+            days=days,
+            max_results=max_results,
+            include_domains=include_domains,
+            exclude_domains=exclude_domains,
+            include_raw_content=include_raw_content,
+        )
+        result = self.async_runner.run(coro) if self.async_runner else asyncio.run(coro)
+        return json.dumps(result, indent=2)
+
+    async def _arun(
+        self,
+        queries: list[str],
+        search_depth: Literal["basic", "advanced"] = "basic",
+        topic: Literal["general", "news", "finance"] = "general",
+        time_range: Literal["day", "week", "month", "year"] | None = None,
+        days: int = 7,
+        max_results: int = 5,
+        include_domains: Sequence[str] | None = None,
+        exclude_domains: Sequence[str] | None = None,
+        include_raw_content: bool = False,
+    ) -> str:
+        """
+        Asynchronously runs several searches concurrently using the Tavily API.
+
+        Args:
+            queries: The search query strings.
+            search_depth: The depth of the search ('basic' or 'advanced').
+            topic: The topic to focus the search on ('general', 'news', 'finance').
+            time_range: The time range for the search ('day', 'week', 'month', 'year').
+            days: The number of days to search back.
+            max_results: The maximum number of results to return per query.
+            include_domains: A list of domains to include in the search.
+            exclude_domains: A list of domains to exclude from the search.
+            include_raw_content: Whether to include the raw content of the search results.
+
+        Returns:
+            A JSON string containing the merged search results.
+        """
+        coro = self._search_all(
+            queries,
+            search_depth=search_depth,
+            topic=topic,
+            time_range=time_range,
+            days=days,
+            max_results=max_results,
+            include_domains=include_domains,
+            exclude_domains=exclude_domains,
+            include_raw_content=include_raw_content,
+        )
+        result = await (self.async_runner.arun(coro) if self.async_runner else coro)
+        return json.dumps(result, indent=2)
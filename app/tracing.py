@@ -0,0 +1,271 @@
+import contextvars
+import functools
+import queue
+import random
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from functools import lru_cache
+from http import HTTPStatus
+from typing import Any
+
+from .config import tracing_config
+from .utils import get_logger
+
+# A queued LangSmith call: ("create", create_run kwargs) or ("update", update_run kwargs)
+RunOperation = tuple[str, dict[str, Any]]
+
+
+class RequestTrace:
+    """
+    Tracing decision and, when exporting is deferred, the buffered runs of one request.
+
+    Attributes:
+        sampled: Whether the request's ``@traceable`` functions create runs at all.
+        buffered: Whether its runs are held until the request ends instead of exported at once.
+        failed: Whether the request raised or answered with a server error.
+        started_at: ``time.perf_counter()`` when the request started.
+        operations: The buffered run operations.
+    """
+
+    def __init__(self, *, sampled: bool, buffered: bool) -> None:
+        self.sampled = sampled
+        self.buffered = buffered
+        self.failed = False
+        self.started_at = time.perf_counter()
+        self.operations: list[RunOperation] = []
+        self._lock = threading.Lock()
+
+    def add(self, operation: RunOperation) -> None:
+        with self._lock:
+            self.operations.append(operation)
+
+    @property
+    def has_errors(self) -> bool:
+        """Whether any buffered run ended with an error (e.g. a callback rejecting the question)."""
+        with self._lock:
+            return any(kind == "update" and kwargs.get("error") for kind, kwargs in self.operations)
+
+
+_current_trace: contextvars.ContextVar[RequestTrace | None] = contextvars.ContextVar("current_trace", default=None)
+
+
+class TraceExporter:
+    """
+    Stand-in for the LangSmith client of ``@traceable`` runs that never blocks the caller.
+
+    Runs are queued as they start and end, and a background thread hands them to the real
+    client in batches, so their serialization and upload stay off the serving path. Runs of
+    buffered requests are held by their ``RequestTrace`` until ``TracingPolicy`` keeps them.
+    When the queue is full, runs are dropped and counted.
+
+    Attributes:
+        batch_size: Most runs handed to the client at once.
+        flush_interval: Seconds to gather runs into a batch.
+        dropped: Runs dropped because the queue was full.
+    """
+
+    def __init__(self, batch_size: int, flush_interval: float, max_queue_size: int) -> None:
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.dropped = 0
+        self._pending: queue.Queue[RunOperation | None] = queue.Queue(maxsize=max_queue_size)
+        self._client: Any = None
+        self._exporter = threading.Thread(target=self._export_forever, name="trace-exporter", daemon=True)
+        self._exporter.start()
+
+    def create_run(self, **kwargs: Any) -> None:
+        self._route(("create", kwargs))
+
+    def update_run(self, **kwargs: Any) -> None:
+        self._route(("update", kwargs))
+
+    def _route(self, operation: RunOperation) -> None:
+        trace = _current_trace.get()
+        if trace is not None and trace.buffered:
+            trace.add(operation)
+        else:
+            self.submit([operation])
+
+    def submit(self, operations: list[RunOperation]) -> None:
+        """Queues run operations for export."""
+        for operation in operations:
+            try:
+                self._pending.put_nowait(operation)
+            except queue.Full:
+                self.dropped += 1
+
+    def _export(self, batch: list[RunOperation]) -> None:
+        for kind, kwargs in batch:
+            try:
+                if self._client is None:
+                    from langsmith import Client
+
+                    self._client = Client()
+                if kind == "create":
+                    self._client.create_run(**kwargs)
+                else:
+                    self._client.update_run(**kwargs)
+            except Exception as e:  # noqa: BLE001
+                get_logger().warning(f"Failed to export trace run: {e!r}")
+
+    def _export_forever(self) -> None:
+        closing = False
+        while not closing:
+            batch = [self._pending.get()]
+            deadline = time.monotonic() + self.flush_interval
+            while batch[-1] is not None and len(batch) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._pending.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            if batch[-1] is None:
+                closing = True
+                batch.pop()
+            self._export(batch)
+        if self._client is not None:
+            self._client.flush()
+
+    def close(self) -> None:
+        """Exports the queued runs and stops the background thread."""
+        self._pending.put(None)
+        self._exporter.join()
+
+
+class TracingPolicy:
+    """
+    Decides which requests are traced and which traces are exported.
+
+    ``sampled`` traces a ``sample_rate`` fraction of requests, chosen when they start;
+    ``errors_and_slow`` traces every request but only exports those that fail or take at
+    least ``slow_threshold`` seconds.
+    """
+
+    def __init__(self, mode: str, sample_rate: float, slow_threshold: float, exporter: TraceExporter) -> None:
+        if mode not in {"sampled", "errors_and_slow"}:
+            msg = f"Unknown tracing mode {mode!r}; expected 'off', 'sampled' or 'errors_and_slow'."
+            raise ValueError(msg)
+        self.mode = mode
+        self.sample_rate = sample_rate
+        self.slow_threshold = slow_threshold
+        self.exporter = exporter
+
+    def start(self) -> RequestTrace:
+        if self.mode == "sampled":
+            return RequestTrace(sampled=random.random() < self.sample_rate, buffered=False)
+        return RequestTrace(sampled=True, buffered=True)
+
+    def finish(self, trace: RequestTrace) -> None:
+        if not trace.buffered or not trace.operations:
+            return
+        slow = time.perf_counter() - trace.started_at >= self.slow_threshold
+        if trace.failed or slow or trace.has_errors:
+            self.exporter.submit(trace.operations)
+
+
+@lru_cache
+def get_tracing_policy() -> TracingPolicy | None:
+    """
+    Returns the process-wide tracing policy configured by ``tracing_config``, or None if tracing is off.
+
+    Returns:
+        TracingPolicy | None: The policy.
+    """
+    if tracing_config["mode"] == "off":
+        return None
+    return TracingPolicy(
+        mode=tracing_config["mode"],
+        sample_rate=tracing_config["sample_rate"],
+        slow_threshold=tracing_config["slow_threshold_seconds"],
+        exporter=TraceExporter(
+            batch_size=tracing_config["batch_size"],
+            flush_interval=tracing_config["flush_interval_seconds"],
+            max_queue_size=tracing_config["max_queue_size"],
+        ),
+    )
+
+
+@contextmanager
+def trace_request() -> Iterator[RequestTrace | None]:
+    """
+    Applies the tracing policy to the enclosed request, including the threads it starts with its context.
+
+    Yields:
+        RequestTrace | None: The request's trace (set ``failed`` to export it in ``errors_and_slow``
+        mode), or None if tracing is off.
+    """
+    policy = get_tracing_policy()
+    if policy is None:
+        yield None
+        return
+    from langsmith import tracing_context
+
+    trace = policy.start()
+    token = _current_trace.set(trace)
+    try:
+        with tracing_context(client=policy.exporter):
+            yield trace
+    except BaseException:
+        trace.failed = True
+        raise
+    finally:
+        _current_trace.reset(token)
+        policy.finish(trace)
+
+
+def traceable(run_type: str) -> Callable[[Callable], Callable]:
+    """
+    LangSmith's ``@traceable``, applied according to ``tracing_config``.
+
+    With tracing off, functions are returned as they are. Otherwise they are traced only
+    within requests the policy samples (see ``trace_request``), and called directly elsewhere.
+
+    Args:
+        run_type: The LangSmith run type, e.g. ``"agent"`` or ``"tool"``.
+    """
+
+    def decorator(fn: Callable) -> Callable:
+        if tracing_config["mode"] == "off":
+            return fn
+        from langsmith import traceable as langsmith_traceable
+
+        traced = langsmith_traceable(run_type=run_type)(fn)
+
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            trace = _current_trace.get()
+            if trace is None or not trace.sampled:
+                return fn(*args, **kwargs)
+            return traced(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+class TracingMiddleware:
+    """ASGI middleware running each HTTP request within ``trace_request``; server errors count as failures."""
+
+    def __init__(self, app: Any) -> None:
+        self.app = app
+
+    async def __call__(self, scope: dict, receive: Callable, send: Callable) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        status: dict[str, int] = {}
+
+        async def send_with_status(message: dict) -> None:
+            if message["type"] == "http.response.start":
+                status["code"] = message["status"]
+            await send(message)
+
+        with trace_request() as trace:
+            await self.app(scope, receive, send_with_status)
+            code = status.get("code", HTTPStatus.INTERNAL_SERVER_ERROR)
+            if trace is not None and code >= HTTPStatus.INTERNAL_SERVER_ERROR:
+                trace.failed = True
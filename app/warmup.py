@@ -0,0 +1,98 @@
+import asyncio
+import time
+from collections.abc import Callable
+from functools import lru_cache
+from typing import Any
+
+from .config import CREW_TEMPLATE_MODE, warmup_config
+from .utils import get_logger
+
+
+def _create_clients() -> None:
+    from .clients import get_client_registry
+
+    registry = get_client_registry()
+    for name in (
+        "tavily_client",
+        "async_tavily_client",
+        "qdrant_client",
+        "async_qdrant_client",
+        "openai_client",
+        "openai_async_client",
+    ):
+        getattr(registry, name)
+
+
+def _build_crew() -> None:
+    from .crew.crew import get_research_crew_template
+    from .crew.precheck import get_relevancy_precheck
+    from .crew.runner import CrewRun  # noqa: F401
+    from .crew.scheduler import attach_crew_reports  # noqa: F401
+
+    if CREW_TEMPLATE_MODE:
+        get_research_crew_template()
+    get_relevancy_precheck()
+
+
+def _preload_embeddings(limit: int) -> None:
+    from .cache.embedding_cache import get_embedding_cache
+
+    embedding_cache = get_embedding_cache()
+    if embedding_cache is not None:
+        get_logger().debug(f"Preloaded {embedding_cache.preload(limit)} cached embeddings")
+
+
+class WarmUp:
+    """
+    Prepares the app for traffic in the background, so it can start serving right away.
+
+    Steps run one after another in a worker thread; a failing step is logged and skipped,
+    and whatever it would have created is created on first use instead.
+
+    Attributes:
+        steps: The warm-up steps by name.
+        ready: Whether every step has run.
+        durations: Seconds taken by each step that has run.
+        errors: The error of each failed step.
+    """
+
+    def __init__(self, steps: dict[str, Callable[[], Any]]) -> None:
+        self.steps = steps
+        self.ready = False
+        self.durations: dict[str, float] = {}
+        self.errors: dict[str, str] = {}
+
+    async def run(self) -> None:
+        for name, step in self.steps.items():
+            start_time = time.perf_counter()
+            try:
+                await asyncio.to_thread(step)
+            except Exception as e:  # noqa: BLE001
+                get_logger().warning(f"Warm-up step '{name}' failed: {e!r}")
+                self.errors[name] = repr(e)
+            self.durations[name] = round(time.perf_counter() - start_time, 3)
+        self.ready = True
+        if self.steps:
+            get_logger().info(f"Warm-up done in {sum(self.durations.values()):.2f}s: {self.durations}")
+
+    def status(self) -> dict[str, Any]:
+        return {"ready": self.ready, "steps": self.durations, "errors": self.errors}
+
+
+@lru_cache
+def get_warm_up() -> WarmUp:
+    """
+    Returns the process-wide warm-up configured by ``warmup_config``.
+
+    Returns:
+        WarmUp: The warm-up; run by the app lifespan.
+    """
+    steps: dict[str, Callable[[], Any]] = {}
+    if warmup_config["enabled"]:
+        if warmup_config["clients"]:
+            steps["clients"] = _create_clients
+        if warmup_config["crew"]:
+            steps["crew"] = _build_crew
+        if warmup_config["preload_embeddings"]:
+            steps["embeddings"] = lambda: _preload_embeddings(warmup_config["preload_embeddings"])
+    return WarmUp(steps)
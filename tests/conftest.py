@@ -0,0 +1,42 @@
+import os
+import time
+from typing import Any
+
+import pytest
+
+from app.benchmarks.run import OFFLINE_ENVIRONMENT
+
+# Clients and settings that read these at import time are created offline
+for name, value in OFFLINE_ENVIRONMENT.items():
+    os.environ.setdefault(name, value)
+
+
+class Clock:
+    """Stand-in for ``time.time`` that only moves when told to."""
+
+    def __init__(self) -> None:
+        self.now = 1_700_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> Clock:
+    """Freezes ``time.time`` for the test; expiry is tested by advancing it."""
+    clock = Clock()
+    monkeypatch.setattr(time, "time", clock)
+    return clock
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def backend(request: pytest.FixtureRequest, tmp_path) -> Any:
+    """
+    Runs a test against each backend of the module's ``BACKENDS``, by kind.
+
+    Each factory takes the path of a fresh SQLite database, which only the SQLite one uses.
+    """
+    return request.module.BACKENDS[request.param](str(tmp_path / "backend.sqlite3"))
@@ -0,0 +1,150 @@
+import json
+
+import pytest
+from crewai import TaskOutput
+
+from app.crew.context import CONTEXT_DIVIDER, ContextAssembler
+from app.crew.relevance import EmbeddingRelevanceFilter
+
+SYNTHESIS = "Final Report Synthesis with Citations"
+CURATION = "Strict Relevance Filtering and Data Curation"
+QUERY = "surface code error threshold"
+
+
+def _output(name: str, raw: str) -> TaskOutput:
+    return TaskOutput(description=f"{name} description", name=name, agent="Researcher", raw=raw)
+
+
+def _assembler(budget: int, **kwargs) -> ContextAssembler:
+    return ContextAssembler(
+        {SYNTHESIS: budget, CURATION: budget}, max_chunk_tokens=60, encoding="cl100k_base", **kwargs
+    )
+
+
+def _paragraphs(count: int, topic: str) -> str:
+    return "\n\n".join(f"Paragraph {i} about {topic} and related background." for i in range(count))
+
+
+def test_context_fits_the_budget() -> None:
+    assembler = _assembler(budget=60)
+    outputs = [_output("Web", _paragraphs(20, "surface code error threshold"))]
+
+    context, report = assembler.assemble(SYNTHESIS, outputs, QUERY)
+
+    assert assembler.count_tokens(context) <= 60
+    assert report["budget"] == 60
+    assert report["tokens_out"] == assembler.count_tokens(context)
+    assert report["tokens_saved"] == report["tokens_in"] - report["tokens_out"]
+    assert 0 < report["chunks_kept"] < report["chunks"] == 20
+
+
+def test_relevant_paragraphs_are_kept_in_their_original_order() -> None:
+    relevant = ["The surface code error threshold is near one percent.", "Error threshold estimates vary by decoder."]
+    filler = [f"Unrelated note {i} on cryogenic wiring." for i in range(6)]
+    raw = "\n\n".join([filler[0], relevant[0], *filler[1:4], relevant[1], *filler[4:]])
+    counter = _assembler(budget=0)
+    # Just enough for the relevant paragraphs, each charged for a divider
+    budget = sum(counter.count_tokens(text) + counter.count_tokens(CONTEXT_DIVIDER) for text in relevant)
+    assembler = _assembler(budget=budget)
+
+    context, _ = assembler.assemble(SYNTHESIS, [_output("Web", raw)], QUERY)
+
+    assert context == "\n\n".join(relevant)
+
+
+def test_exact_duplicates_are_dropped_across_outputs() -> None:
+    paragraph = "The surface code error threshold is near one percent."
+    outputs = [_output("RAG", paragraph), _output("Web", f"{paragraph.upper()}  \n\nAnother finding.")]
+
+    context, report = _assembler(budget=1000).assemble(SYNTHESIS, outputs, QUERY)
+
+    assert report["duplicates"] == 1
+    assert context == f"{paragraph}{CONTEXT_DIVIDER}Another finding."
+
+
+def test_attribution_paragraphs_stay_with_the_paragraph_they_attribute() -> None:
+    raw = "Thresholds near one percent.\n\nSources: https://a.org/1, https://b.org/2\n\nIon traps are slower."
+
+    context, report = _assembler(budget=1000).assemble(SYNTHESIS, [_output("Web", raw)], QUERY)
+
+    assert report["chunks"] == 2
+    assert "Thresholds near one percent.\nSources: https://a.org/1, https://b.org/2" in context
+
+
+def test_long_paragraphs_are_truncated_keeping_their_urls() -> None:
+    raw = " ".join(["surface code threshold"] * 200) + " https://a.org/cited"
+
+    context, report = _assembler(budget=1000).assemble(SYNTHESIS, [_output("Web", raw)], QUERY)
+
+    assert report["truncated"] == 1
+    assert "[...]" in context
+    assert context.endswith("Sources: https://a.org/cited")
+
+
+def test_json_dumps_are_split_into_their_results() -> None:
+    results = [{"url": f"https://a.org/{i}", "content": f"surface code result {i}"} for i in range(3)]
+
+    context, report = _assembler(budget=1000).assemble(
+        SYNTHESIS, [_output("Web", json.dumps({"results": results}, indent=2))], QUERY
+    )
+
+    assert report["chunks"] == 3
+    assert context.split("\n\n") == [json.dumps(result, separators=(",", ":")) for result in results]
+
+
+def test_pinned_outputs_are_kept_before_higher_scoring_paragraphs() -> None:
+    curated = "Curated: decoders matter.\nSources: https://a.org/curated"
+    outputs = [_output("Web", _paragraphs(20, "surface code error threshold")), _output(CURATION, curated)]
+    budget = _assembler(budget=0).count_tokens(curated) + 30
+    assembler = _assembler(budget=budget, pinned={SYNTHESIS: [CURATION]})
+
+    context, report = assembler.assemble(SYNTHESIS, outputs, QUERY)
+
+    assert report["pinned"] == 1
+    assert context.endswith(curated)
+    unpinned, _ = _assembler(budget=budget).assemble(SYNTHESIS, outputs, QUERY)
+    assert "Curated" not in unpinned
+
+
+def test_relevance_filter_drops_dissimilar_paragraphs_but_not_pinned_ones() -> None:
+    vectors = {QUERY: [1.0, 0.0], "Thresholds near one percent.": [0.9, 0.1], "Cryostat wiring.": [0.0, 1.0]}
+    relevance_filter = EmbeddingRelevanceFilter(
+        embed=lambda texts: [vectors.get(text, [0.0, 1.0]) for text in texts],
+        tasks=[SYNTHESIS],
+        threshold=0.5,
+        top_k=None,
+        min_keep=0,
+    )
+    assembler = _assembler(budget=1000, relevance_filter=relevance_filter, pinned={SYNTHESIS: [CURATION]})
+    outputs = [
+        _output("Web", "Thresholds near one percent.\n\nCryostat wiring."),
+        _output(CURATION, "Curated: decoders matter."),
+    ]
+
+    context, report = assembler.assemble(SYNTHESIS, outputs, QUERY)
+
+    assert report["prefiltered"] == 1
+    assert context == f"[relevance 0.99] Thresholds near one percent.{CONTEXT_DIVIDER}Curated: decoders matter."
+
+    relevance_filter.label_scores = False
+    context, _ = assembler.assemble(SYNTHESIS, outputs, QUERY)
+    assert context.startswith("Thresholds near one percent.")
+
+
+@pytest.mark.parametrize("task", [SYNTHESIS, CURATION])
+def test_budgeted_tasks_without_outputs_get_an_empty_context(task: str) -> None:
+    context, report = _assembler(budget=100).assemble(task, [], QUERY)
+
+    assert context == ""
+    assert report["chunks"] == 0
+
+
+def test_tasks_without_a_budget_keep_every_paragraph() -> None:
+    assembler = ContextAssembler({}, max_chunk_tokens=60, encoding="cl100k_base")
+    outputs = [_output("RAG", _paragraphs(20, "surface codes")), _output("Web", _paragraphs(20, "surface codes"))]
+
+    context, report = assembler.assemble(SYNTHESIS, outputs, QUERY)
+
+    assert report["budget"] is None
+    assert report["duplicates"] == 20
+    assert context == _paragraphs(20, "surface codes")
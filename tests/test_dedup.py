@@ -0,0 +1,93 @@
+import numpy as np
+import pytest
+from crewai import TaskOutput
+
+from app.crew.context import ContextAssembler
+from app.crew.dedup import MinHashDeduplicator
+
+PASSAGE = (
+    "Surface codes protect logical qubits by measuring stabilizers on a two dimensional lattice "
+    "of physical qubits, and tolerate physical error rates of up to about one percent."
+)
+
+
+@pytest.fixture
+def deduplicator() -> MinHashDeduplicator:
+    return MinHashDeduplicator(threshold=0.75, num_perm=128, bands=32, shingle_size=3)
+
+
+def test_bands_must_divide_the_signature() -> None:
+    with pytest.raises(ValueError, match="multiple of bands"):
+        MinHashDeduplicator(threshold=0.75, num_perm=100, bands=32, shingle_size=3)
+
+
+def test_signatures_are_the_same_in_every_instance(deduplicator: MinHashDeduplicator) -> None:
+    other = MinHashDeduplicator(threshold=0.75, num_perm=128, bands=32, shingle_size=3)
+
+    signature = deduplicator.signature(PASSAGE)
+    assert signature.shape == (128,)
+    assert np.array_equal(signature, other.signature(PASSAGE))
+
+
+def test_similarity_ignores_case_and_punctuation(deduplicator: MinHashDeduplicator) -> None:
+    copy = PASSAGE.upper().replace(",", ";")
+
+    assert deduplicator.similarity(deduplicator.signature(PASSAGE), deduplicator.signature(copy)) == 1.0
+
+
+def test_similarity_estimates_jaccard_similarity(deduplicator: MinHashDeduplicator) -> None:
+    edited = PASSAGE.replace("about one percent", "roughly one percent")
+    unrelated = "Trapped ion processors shuttle ions between zones to run gates with very high fidelity."
+
+    assert deduplicator.similarity(deduplicator.signature(PASSAGE), deduplicator.signature(edited)) > 0.6
+    assert deduplicator.similarity(deduplicator.signature(PASSAGE), deduplicator.signature(unrelated)) < 0.2
+
+
+def test_short_texts_get_a_signature(deduplicator: MinHashDeduplicator) -> None:
+    assert deduplicator.signature("qubits").shape == (128,)
+    assert deduplicator.signature("").shape == (128,)
+
+
+def test_index_finds_the_first_near_duplicate(deduplicator: MinHashDeduplicator) -> None:
+    index = deduplicator.new_index()
+    index.add(0, deduplicator.signature("Trapped ion processors shuttle ions between zones to run gates."))
+    index.add(1, deduplicator.signature(PASSAGE))
+    index.add(2, deduplicator.signature(PASSAGE + " Mirrored."))
+
+    assert index.find(deduplicator.signature(PASSAGE.lower())) == 1
+    assert index.find(deduplicator.signature("Superconducting transmons need millikelvin cryostats.")) is None
+
+
+def test_index_applies_the_threshold_to_candidates() -> None:
+    strict = MinHashDeduplicator(threshold=1.0, num_perm=128, bands=32, shingle_size=3)
+    index = strict.new_index()
+    index.add(0, strict.signature(PASSAGE))
+
+    assert index.find(strict.signature(PASSAGE.replace("about one percent", "roughly one percent"))) is None
+    assert index.find(strict.signature(PASSAGE)) == 0
+
+
+@pytest.mark.parametrize("budgets", [{"Synthesis": 10_000}, {}])
+def test_assembler_merges_the_attribution_of_near_duplicates(budgets: dict[str, int]) -> None:
+    deduplicator = MinHashDeduplicator(threshold=0.75, num_perm=128, bands=32, shingle_size=3, tasks=["Synthesis"])
+    assembler = ContextAssembler(budgets, 600, "cl100k_base", deduplicator=deduplicator)
+    rag = TaskOutput(description="RAG", name="RAG", agent="a", raw=f"{PASSAGE}\nSource: https://kb.org/1")
+    web = TaskOutput(description="Web", name="Web", agent="a", raw=f"{PASSAGE.upper()}\nhttps://mirror.org/1")
+
+    context, report = assembler.assemble("Synthesis", [rag, web], query="surface codes")
+
+    assert report["near_duplicates"] == 1
+    assert context.count("lattice") == 1
+    assert "Source: https://kb.org/1" in context
+    assert "Also reported by: https://mirror.org/1" in context
+
+
+def test_assembler_only_deduplicates_the_deduplicator_tasks(deduplicator: MinHashDeduplicator) -> None:
+    assembler = ContextAssembler({"Synthesis": 10_000}, 600, "cl100k_base", deduplicator=deduplicator)
+    outputs = [
+        TaskOutput(description="RAG", name="RAG", agent="a", raw=PASSAGE),
+        TaskOutput(description="Web", name="Web", agent="a", raw=f"{PASSAGE} Mirrored."),
+    ]
+
+    assert not assembler.handles("Filtering")
+    assert assembler.assemble("Synthesis", outputs, query="surface codes")[1]["near_duplicates"] == 0
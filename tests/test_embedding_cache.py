@@ -0,0 +1,67 @@
+import sqlite3
+
+import numpy as np
+
+from app.cache.embedding_cache import DiskEmbeddingStore, embedding_key
+
+MODEL = "text-embedding-3-small"
+
+
+def _key(text: str) -> str:
+    return embedding_key(MODEL, text)
+
+
+def test_disk_store_reuses_the_least_recently_used_row(tmp_path, clock) -> None:
+    store = DiskEmbeddingStore(str(tmp_path), max_entries=2, touch_seconds=0)
+    store.set(_key("a"), MODEL, np.array([1.0, 0.0], dtype=np.float32))
+    clock.advance(1)
+    store.set(_key("b"), MODEL, np.array([0.0, 1.0], dtype=np.float32))
+    clock.advance(1)
+    store.get(_key("a"))
+    store.set(_key("c"), MODEL, np.array([1.0, 1.0], dtype=np.float32))
+
+    assert store.get(_key("b")) is None
+    np.testing.assert_array_equal(store.get(_key("a")), [1.0, 0.0])
+    np.testing.assert_array_equal(store.get(_key("c")), [1.0, 1.0])
+
+
+def test_disk_store_misses_a_row_taken_over_by_another_key(tmp_path) -> None:
+    store = DiskEmbeddingStore(str(tmp_path), max_entries=1)
+    store.set(_key("a"), MODEL, np.array([1.0, 0.0], dtype=np.float32))
+    # Another process evicts "a" and writes "b" into its row, but this index still points "a" there
+    other = DiskEmbeddingStore(str(tmp_path), max_entries=1)
+    other.set(_key("b"), MODEL, np.array([0.0, 1.0], dtype=np.float32))
+    with sqlite3.connect(tmp_path / "index.sqlite3") as index:
+        index.execute("INSERT INTO embeddings VALUES (?, ?, 2, 0, 0)", (_key("a"), MODEL))
+
+    assert store.get(_key("a")) is None
+    assert [key for key, _ in store.recent(2)] == [_key("b")]
+
+
+def test_disk_hits_only_touch_rows_once_they_have_aged(tmp_path, clock) -> None:
+    store = DiskEmbeddingStore(str(tmp_path), touch_seconds=60)
+    store.set(_key("a"), MODEL, np.array([1.0, 0.0], dtype=np.float32))
+    stored_at = clock.now
+
+    def used_at() -> float:
+        return store._index.execute("SELECT used_at FROM embeddings").fetchone()[0]
+
+    clock.advance(30)
+    store.get(_key("a"))
+    assert used_at() == stored_at
+
+    clock.advance(30)
+    store.get(_key("a"))
+    assert used_at() == clock.now
+
+
+def test_disk_store_drops_caches_of_an_older_layout(tmp_path) -> None:
+    (tmp_path / "legacy-2.f32").write_bytes(b"\0" * 8)
+    with sqlite3.connect(tmp_path / "index.sqlite3") as index:
+        index.execute("CREATE TABLE embeddings (key TEXT PRIMARY KEY, model TEXT, dim INTEGER, row INTEGER)")
+        index.execute("INSERT INTO embeddings VALUES (?, ?, 2, 0)", (_key("a"), MODEL))
+
+    store = DiskEmbeddingStore(str(tmp_path))
+
+    assert store.get(_key("a")) is None
+    assert not (tmp_path / "legacy-2.f32").exists()
@@ -0,0 +1,74 @@
+from app.cache.extraction_cache import (
+    ExtractionCache,
+    ExtractionStore,
+    InMemoryExtractionStore,
+    SqliteExtractionStore,
+)
+
+PAGE = {"url": "https://a.org/page", "raw_content": "Surface codes tolerate about 1% noise.", "images": []}
+
+
+BACKENDS = {
+    "memory": lambda _: InMemoryExtractionStore(max_entries=2),
+    "sqlite": lambda path: SqliteExtractionStore(max_entries=2, path=path),
+}
+
+
+def test_pages_are_cached_per_url_and_options(backend: ExtractionStore) -> None:
+    cache = ExtractionCache(backend, ttl_seconds=60)
+    cache.set("https://a.org/page", "basic", include_images=False, result=PAGE)
+
+    assert cache.get("https://a.org/page", "basic", include_images=False) == {
+        "raw_content": PAGE["raw_content"],
+        "images": [],
+    }
+    assert cache.get("https://a.org/page", "advanced", include_images=False) is None
+    assert cache.get("https://a.org/page", "basic", include_images=True) is None
+    assert cache.stats() == {"hits": 1, "misses": 2, "hit_rate": 1 / 3}
+
+
+def test_pages_expire_after_the_ttl(backend: ExtractionStore, clock) -> None:
+    cache = ExtractionCache(backend, ttl_seconds=60)
+    cache.set("https://a.org/page", "basic", include_images=False, result=PAGE)
+
+    clock.advance(59)
+    assert cache.get("https://a.org/page", "basic", include_images=False) is not None
+    clock.advance(1)
+    assert cache.get("https://a.org/page", "basic", include_images=False) is None
+
+
+def test_least_recently_used_page_is_evicted(backend: ExtractionStore, clock) -> None:
+    cache = ExtractionCache(backend, ttl_seconds=60)
+    for i, url in enumerate(["https://a.org/1", "https://a.org/2"]):
+        cache.set(url, "basic", include_images=False, result={**PAGE, "raw_content": f"page {i}"})
+        clock.advance(1)
+    assert cache.get("https://a.org/1", "basic", include_images=False) is not None
+    clock.advance(1)
+    cache.set("https://a.org/3", "basic", include_images=False, result=PAGE)
+
+    assert cache.get("https://a.org/2", "basic", include_images=False) is None
+    assert cache.get("https://a.org/1", "basic", include_images=False) == {"raw_content": "page 0", "images": []}
+    assert cache.get("https://a.org/3", "basic", include_images=False) is not None
+
+
+def test_identical_pages_share_one_blob() -> None:
+    store = InMemoryExtractionStore(max_entries=4)
+    cache = ExtractionCache(store, ttl_seconds=60)
+    cache.set("https://a.org/page", "basic", include_images=False, result=PAGE)
+    cache.set("https://mirror.org/page", "basic", include_images=False, result={**PAGE, "url": "https://mirror.org"})
+    assert len(store._blobs) == 1
+
+    cache.set("https://a.org/page", "basic", include_images=False, result={**PAGE, "raw_content": "Updated."})
+    assert len(store._blobs) == 2
+    cache.set("https://mirror.org/page", "basic", include_images=False, result={**PAGE, "raw_content": "Updated."})
+    assert len(store._blobs) == 1
+
+
+def test_sqlite_store_drops_unreferenced_blobs(tmp_path) -> None:
+    store = SqliteExtractionStore(max_entries=1, path=str(tmp_path / "extracts.sqlite3"))
+    cache = ExtractionCache(store, ttl_seconds=60)
+    cache.set("https://a.org/1", "basic", include_images=False, result=PAGE)
+    cache.set("https://a.org/2", "basic", include_images=False, result={**PAGE, "raw_content": "Other."})
+
+    (blobs,) = store._connection.execute("SELECT COUNT(*) FROM blobs").fetchone()
+    assert blobs == 1
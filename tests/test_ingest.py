@@ -0,0 +1,134 @@
+import hashlib
+from itertools import pairwise
+
+import pytest
+from qdrant_client import QdrantClient
+from qdrant_client.http.models import FieldCondition, Filter, MatchValue
+
+from app.ingest.pipeline import Document, Ingestor, chunk_document, split_text
+
+
+def _paragraph(i: int, words: int = 10) -> str:
+    return f"Paragraph {i} " + " ".join(f"word{j}" for j in range(words))
+
+
+def test_paragraphs_are_packed_into_chunks() -> None:
+    paragraphs = [_paragraph(i) for i in range(6)]
+
+    chunks = split_text("\n\n".join(paragraphs), chunk_size=200, overlap=20)
+
+    assert all(len(chunk) <= 200 for chunk in chunks)
+    assert "\n\n".join(chunks).split("\n\n") == paragraphs
+    assert len(chunks) < len(paragraphs)
+
+
+def test_blank_paragraphs_are_skipped() -> None:
+    assert split_text("\n\n  \n\nOnly paragraph.\n\n\n", chunk_size=100, overlap=10) == ["Only paragraph."]
+    assert split_text("", chunk_size=100, overlap=10) == []
+
+
+def test_long_paragraphs_are_cut_on_whitespace_with_overlap() -> None:
+    paragraph = _paragraph(0, words=80)
+
+    chunks = split_text(paragraph, chunk_size=100, overlap=30)
+
+    assert len(chunks) > 1
+    assert all(len(chunk) <= 100 for chunk in chunks)
+    words = set(paragraph.split())
+    for previous, chunk in pairwise(chunks):
+        assert set(chunk.split()) <= words
+        # Each window repeats the end of the one before it
+        assert chunk.split()[0] in previous.split()
+    assert chunks[-1].endswith("word79")
+
+
+def test_unbroken_text_is_cut_at_the_chunk_size() -> None:
+    chunks = split_text("x" * 250, chunk_size=100, overlap=10)
+
+    assert [len(chunk) for chunk in chunks] == [100, 100, 70]
+
+
+def test_chunk_ids_are_stable_per_source_and_position() -> None:
+    document = Document(source="docs/a.md", text="\n\n".join(_paragraph(i, 30) for i in range(4)), metadata={"k": 1})
+
+    chunks = chunk_document(document, chunk_size=200, overlap=20, embedding_model="model")
+    again = chunk_document(document, chunk_size=200, overlap=20, embedding_model="model")
+    moved = chunk_document(document.model_copy(update={"source": "docs/b.md"}), 200, 20, "model")
+
+    assert [chunk.id for chunk in chunks] == [chunk.id for chunk in again]
+    assert len({chunk.id for chunk in chunks}) == len(chunks)
+    assert not {chunk.id for chunk in chunks} & {chunk.id for chunk in moved}
+    assert [chunk.metadata for chunk in chunks] == [
+        {"k": 1, "source": "docs/a.md", "chunk_index": i} for i in range(len(chunks))
+    ]
+
+
+def test_content_hashes_change_with_text_metadata_and_model() -> None:
+    document = Document(source="a", text="Surface codes.")
+    (chunk,) = chunk_document(document, 100, 10, "model")
+
+    assert chunk_document(document, 100, 10, "model")[0].content_hash == chunk.content_hash
+    assert chunk_document(document, 100, 10, "other-model")[0].content_hash != chunk.content_hash
+    assert chunk_document(Document(source="a", text="Ion traps."), 100, 10, "model")[0].content_hash != (
+        chunk.content_hash
+    )
+    assert chunk_document(document.model_copy(update={"metadata": {"k": 2}}), 100, 10, "model")[0].content_hash != (
+        chunk.content_hash
+    )
+
+
+def _embed(texts: list[str]) -> list[list[float]]:
+    return [[byte / 255 for byte in hashlib.sha256(text.encode()).digest()[:8]] for text in texts]
+
+
+@pytest.fixture
+def ingestor() -> Ingestor:
+    return Ingestor(
+        client=QdrantClient(":memory:"),
+        collection_name="research",
+        embedding_model="stub",
+        embed=_embed,
+        chunk_size=200,
+        chunk_overlap=20,
+        batch_size=2,
+        max_in_flight=2,
+        max_retries=1,
+    )
+
+
+def _count(ingestor: Ingestor, source: str) -> int:
+    source_filter = Filter(must=[FieldCondition(key="metadata.source", match=MatchValue(value=source))])
+    return ingestor.client.count(ingestor.collection_name, count_filter=source_filter).count
+
+
+def _documents(paragraphs_of_b: int) -> list[Document]:
+    return [
+        Document(source="a", text="\n\n".join(_paragraph(i, 30) for i in range(5))),
+        Document(source="b", text="\n\n".join(_paragraph(i, 30) for i in range(paragraphs_of_b))),
+    ]
+
+
+def test_reingestion_skips_unchanged_chunks_and_deletes_stale_ones(ingestor: Ingestor) -> None:
+    first = ingestor.run(_documents(paragraphs_of_b=6))
+    chunks_of_a, chunks_of_b = _count(ingestor, "a"), _count(ingestor, "b")
+
+    ingestor.stats = type(first)()
+    second = ingestor.run(_documents(paragraphs_of_b=2))
+
+    assert first.failed == second.failed == 0
+    assert first.upserted == first.chunks == chunks_of_a + chunks_of_b
+    assert second.upserted == 0
+    assert _count(ingestor, "a") == chunks_of_a
+    assert _count(ingestor, "b") == second.chunks - chunks_of_a < chunks_of_b
+
+
+def test_delete_missing_drops_documents_no_longer_in_the_source(ingestor: Ingestor) -> None:
+    ingestor.run(_documents(paragraphs_of_b=2))
+    chunks_of_a = _count(ingestor, "a")
+
+    ingestor.sources = set()
+    ingestor.run(_documents(paragraphs_of_b=2)[:1])
+    ingestor.delete_missing()
+
+    assert _count(ingestor, "a") == chunks_of_a
+    assert _count(ingestor, "b") == 0
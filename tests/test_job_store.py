@@ -0,0 +1,98 @@
+import threading
+
+from app.jobs.store import InMemoryJobStore, JobStore, SqliteJobStore
+from app.schemas import JobStatus, ResearchQuery
+
+BACKENDS = {
+    "memory": lambda _: InMemoryJobStore(retention_seconds=60),
+    "sqlite": lambda path: SqliteJobStore(retention_seconds=60, path=path),
+}
+
+
+def _create(store: JobStore, clock, *queries: str) -> list[str]:
+    job_ids = []
+    for query in queries:
+        job_ids.append(store.create(ResearchQuery(query=query)).id)
+        clock.advance(1)
+    return job_ids
+
+
+def test_claim_takes_the_oldest_queued_job(backend: JobStore, clock) -> None:
+    first, second = _create(backend, clock, "first", "second")
+
+    claimed = backend.claim()
+
+    assert claimed.id == first
+    assert claimed.status == JobStatus.RUNNING
+    assert claimed.started_at == clock.now
+    assert backend.get(first).status == JobStatus.RUNNING
+    assert backend.claim().id == second
+    assert backend.claim() is None
+
+
+def test_each_job_is_claimed_once_by_concurrent_workers(tmp_path, clock) -> None:
+    path = str(tmp_path / "jobs.sqlite3")
+    # One store per API worker, sharing the database
+    stores = [SqliteJobStore(retention_seconds=60, path=path) for _ in range(4)]
+    job_ids = _create(stores[0], clock, *(f"query {i}" for i in range(20)))
+    claimed: list[str] = []
+    lock = threading.Lock()
+
+    def work(store: JobStore) -> None:
+        while (job := store.claim()) is not None:
+            with lock:
+                claimed.append(job.id)
+
+    threads = [threading.Thread(target=work, args=(store,)) for store in stores]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(claimed) == sorted(job_ids)
+
+
+def test_cancelling_a_queued_job_finishes_it(backend: JobStore, clock) -> None:
+    (job_id,) = _create(backend, clock, "query")
+
+    cancelled = backend.cancel(job_id)
+
+    assert cancelled.status == JobStatus.CANCELLED
+    assert cancelled.expires_at == cancelled.finished_at + 60
+    assert backend.claim() is None
+
+
+def test_cancelling_a_running_job_flags_it_for_its_worker(backend: JobStore, clock) -> None:
+    (job_id,) = _create(backend, clock, "query")
+    running = backend.claim()
+
+    cancelled = backend.cancel(job_id)
+    # The worker saves progress from its own copy, made before the cancellation
+    running.task_outputs = [{"task": "plan"}]
+    backend.save(running)
+
+    stored = backend.get(job_id)
+    assert cancelled.status == stored.status == JobStatus.RUNNING
+    assert stored.cancel_requested
+    assert stored.task_outputs == [{"task": "plan"}]
+
+
+def test_cancelling_unknown_or_finished_jobs(backend: JobStore, clock) -> None:
+    (job_id,) = _create(backend, clock, "query")
+    backend.complete(backend.claim(), JobStatus.SUCCEEDED)
+
+    assert backend.cancel("missing") is None
+    assert backend.cancel(job_id).status == JobStatus.SUCCEEDED
+
+
+def test_finished_jobs_expire_after_the_retention(backend: JobStore, clock) -> None:
+    finished, queued = _create(backend, clock, "finished", "queued")
+    backend.complete(backend.claim(), JobStatus.FAILED)
+
+    clock.advance(59)
+    assert backend.get(finished).status == JobStatus.FAILED
+    assert backend.purge_expired() == 0
+    clock.advance(1)
+    assert backend.get(finished) is None
+    assert backend.purge_expired() == 1
+    assert backend.get(queued).status == JobStatus.QUEUED
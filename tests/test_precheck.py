@@ -0,0 +1,42 @@
+import asyncio
+import threading
+
+import pytest
+
+from app.cache.tool_cache import InMemoryToolCacheBackend
+from app.crew.precheck import RelevancyPrecheck
+from app.models import QuestionRelevancyResponse
+from app.schemas import ResearchQuery
+
+
+@pytest.fixture
+def precheck(monkeypatch: pytest.MonkeyPatch) -> tuple[RelevancyPrecheck, threading.Event]:
+    precheck = RelevancyPrecheck(
+        "gpt-4o-mini", timeout=0.05, verdicts=InMemoryToolCacheBackend(max_entries=8), ttl_seconds=60, max_pending=1
+    )
+    answer = threading.Event()
+
+    def assess(query: ResearchQuery) -> QuestionRelevancyResponse:
+        answer.wait(5)
+        verdict = QuestionRelevancyResponse(query=query.query, relevant=True)
+        precheck.verdicts.set(precheck._key(query), verdict.model_dump(), precheck.ttl_seconds)
+        return verdict
+
+    monkeypatch.setattr(precheck, "_assess", assess)
+    return precheck, answer
+
+
+def test_abandoned_checks_hold_their_slot_until_they_end(precheck) -> None:
+    precheck, answer = precheck
+    query = ResearchQuery(query="How do surface codes correct errors?")
+
+    assert asyncio.run(precheck.check(query)) is None
+    # The timed-out check is still running, so the next query skips the precheck
+    skipped = ResearchQuery(query="What is a logical qubit?")
+    assert asyncio.run(precheck.check(skipped)) is None
+    answer.set()
+    precheck._executor.shutdown(wait=True)
+
+    assert precheck.cached_verdict(query).relevant
+    assert precheck.cached_verdict(skipped) is None
+    assert precheck._pending.acquire(blocking=False)
@@ -0,0 +1,102 @@
+import json
+
+import httpx
+import pytest
+
+from app.replay.recorder import ExternalCallRecorder, _normalize_body
+
+HOSTS = {"openai": ["api.openai.com"], "tavily": ["api.tavily.com"], "qdrant": ["localhost:6333"]}
+SEARCH_URL = "https://api.tavily.com/search"
+
+
+def _recorder(mode: str, fixtures_dir) -> ExternalCallRecorder:
+    return ExternalCallRecorder(mode=mode, fixtures_dir=str(fixtures_dir), latency_scale=0.0, hosts=HOSTS)
+
+
+def _search(query: str, api_key: str = "tvly-secret") -> str:
+    return _normalize_body(json.dumps({"query": query, "api_key": api_key, "max_results": 5}).encode())
+
+
+def _record(fixtures_dir, *queries: str) -> None:
+    recorder = _recorder("record", fixtures_dir)
+    for query in queries:
+        response = json.dumps({"query": query, "results": []}).encode()
+        recorder.record("tavily", "POST", SEARCH_URL, _search(query), 200, "application/json", response, 0.25)
+
+
+def test_calls_are_classified_by_host_and_path() -> None:
+    recorder = _recorder("record", "unused")
+
+    assert recorder.classify("https://api.openai.com/v1/embeddings", "/v1/embeddings") == "embedding"
+    assert recorder.classify("https://api.openai.com/v1/chat/completions", "/v1/chat/completions") == "llm"
+    assert recorder.classify(SEARCH_URL, "/search") == "tavily"
+    assert recorder.classify("http://localhost:6333/collections/research", "/collections/research") == "qdrant"
+    assert recorder.classify("https://example.org/", "/") is None
+
+
+def test_bodies_are_normalized_without_secrets() -> None:
+    assert _normalize_body(b'{"query": "q", "api_key": "secret", "depth": 1}') == '{"depth": 1, "query": "q"}'
+    assert _normalize_body(b"not json") == "not json"
+
+
+def test_recorded_calls_are_replayed_by_key(tmp_path) -> None:
+    _record(tmp_path, "surface codes", "ion traps")
+    assert "tvly-secret" not in (tmp_path / "tavily.jsonl").read_text()
+
+    recorder = _recorder("replay", tmp_path)
+    fixture = recorder.lookup("tavily", "POST", SEARCH_URL, _search("ion traps", api_key="tvly-other"))
+
+    assert json.loads(fixture.content())["query"] == "ion traps"
+    assert fixture.latency_seconds == 0.25
+    assert recorder.misses == 0
+
+
+def test_unrecorded_calls_get_the_route_fixtures_in_turn(tmp_path) -> None:
+    _record(tmp_path, "surface codes", "ion traps")
+    recorder = _recorder("replay", tmp_path)
+
+    queries = [
+        json.loads(recorder.lookup("tavily", "POST", SEARCH_URL, _search(f"new query {i}")).content())["query"]
+        for i in range(3)
+    ]
+
+    assert queries == ["surface codes", "ion traps", "surface codes"]
+    assert recorder.misses == 3
+
+
+def test_calls_without_a_route_fixture_fail(tmp_path) -> None:
+    _record(tmp_path, "surface codes")
+    recorder = _recorder("replay", tmp_path)
+
+    with pytest.raises(LookupError, match="No replay fixture for tavily call POST"):
+        recorder.lookup("tavily", "POST", "https://api.tavily.com/extract", _search("surface codes"))
+
+
+def test_replay_needs_fixtures(tmp_path) -> None:
+    with pytest.raises(ValueError, match="No replay fixtures"):
+        _recorder("replay", tmp_path)
+
+
+def test_binary_responses_round_trip(tmp_path) -> None:
+    content = bytes(range(256))
+    _recorder("record", tmp_path).record("qdrant", "GET", "http://localhost:6333/x", "", 200, None, content, 0.0)
+
+    fixture = _recorder("replay", tmp_path).lookup("qdrant", "GET", "http://localhost:6333/x", "")
+
+    assert fixture.binary
+    assert fixture.content() == content
+
+
+def test_installed_recorder_answers_httpx_clients(tmp_path) -> None:
+    _record(tmp_path, "surface codes")
+    recorder = _recorder("replay", tmp_path)
+    recorder.install()
+    try:
+        with httpx.Client() as client:
+            response = client.post(SEARCH_URL, json={"query": "surface codes", "api_key": "k", "max_results": 5})
+    finally:
+        recorder.uninstall()
+
+    assert response.status_code == 200
+    assert response.json() == {"query": "surface codes", "results": []}
+    assert recorder.misses == 0
@@ -0,0 +1,132 @@
+import asyncio
+
+import numpy as np
+import pytest
+
+from app.cache.response_cache import (
+    InMemoryResponseCacheBackend,
+    ResponseCache,
+    ResponseCacheBackend,
+    SqliteResponseCacheBackend,
+)
+from app.schemas import ResearchQuery, ResearchResponse
+
+
+def _unit(*values: float) -> np.ndarray:
+    vector = np.asarray(values, dtype=np.float32)
+    return vector / np.linalg.norm(vector)
+
+
+def _response(query: str) -> ResearchResponse:
+    return ResearchResponse(
+        query=query,
+        findings=f"Findings on {query}.",
+        sources=[{"url": "https://a.org"}],
+        confidence_score=0.9,
+        related_topics=[],
+        processing_time=12.0,
+        metadata={"schedule": {"wall_time": 10.0}},
+    )
+
+
+BACKENDS = {
+    "memory": lambda _: InMemoryResponseCacheBackend(ttl_seconds=60, max_entries=2),
+    "sqlite": lambda path: SqliteResponseCacheBackend(ttl_seconds=60, max_entries=2, path=path),
+}
+
+
+def test_entries_expire_after_the_ttl(backend: ResponseCacheBackend, clock) -> None:
+    backend.set("key", "scope", "question", _unit(1, 0), {"findings": "cached"})
+
+    clock.advance(59)
+    assert backend.get("key") == ({"findings": "cached"}, "question", clock.now - 59)
+    assert backend.nearest(_unit(1, 0), "scope") is not None
+    clock.advance(1)
+    assert backend.get("key") is None
+    assert backend.nearest(_unit(1, 0), "scope") is None
+
+
+def test_least_recently_used_entry_is_evicted(backend: ResponseCacheBackend, clock) -> None:
+    backend.set("first", "scope", "first", None, {"n": 1})
+    clock.advance(1)
+    backend.set("second", "scope", "second", None, {"n": 2})
+    clock.advance(1)
+    assert backend.get("first") is not None
+    clock.advance(1)
+    backend.set("third", "scope", "third", None, {"n": 3})
+
+    assert backend.get("second") is None
+    assert backend.get("first") is not None
+    assert backend.get("third") is not None
+
+
+def test_nearest_stays_within_the_scope(backend: ResponseCacheBackend) -> None:
+    backend.set("near", "scope", "near", _unit(1, 0.1), {"n": 1})
+    backend.set("other", "other-scope", "other", _unit(1, 0), {"n": 2})
+
+    response, text, _, similarity = backend.nearest(_unit(1, 0), "scope")
+    assert (response, text) == ({"n": 1}, "near")
+    assert similarity == pytest.approx(float(_unit(1, 0.1) @ _unit(1, 0)))
+    assert backend.nearest(_unit(1, 0), "missing-scope") is None
+
+
+@pytest.fixture
+def cache(monkeypatch: pytest.MonkeyPatch) -> ResponseCache:
+    cache = ResponseCache(InMemoryResponseCacheBackend(ttl_seconds=60, max_entries=8), similarity_threshold=0.95)
+    vectors = {
+        "What is a surface code?": _unit(1, 0),
+        "What's a surface code?": _unit(1, 0.05),
+        "How do ion traps work?": _unit(0, 1),
+    }
+
+    async def embed(text: str) -> np.ndarray:
+        return vectors[text]
+
+    monkeypatch.setattr(cache, "_embed", embed)
+    return cache
+
+
+def _serve(cache: ResponseCache, query: ResearchQuery) -> ResearchResponse:
+    """Answers ``query`` the way the research endpoint does, from the cache or a fresh response."""
+
+    async def serve() -> ResearchResponse:
+        lookup = await cache.lookup(query)
+        if lookup.response is not None:
+            return cache.build_response(lookup, processing_time=0.1)
+        response = _response(query.query)
+        await cache.store(query, response, lookup)
+        cache.mark_miss(response)
+        return response
+
+    return asyncio.run(serve())
+
+
+def test_lookup_matches_exact_and_similar_queries(cache: ResponseCache) -> None:
+    miss = _serve(cache, ResearchQuery(query="What is a surface code?"))
+    exact = _serve(cache, ResearchQuery(query="What is a surface code?"))
+    similar = _serve(cache, ResearchQuery(query="What's a surface code?"))
+    different = _serve(cache, ResearchQuery(query="How do ion traps work?"))
+
+    assert miss.metadata["cache"] == {"hit": False}
+    assert exact.metadata["cache"]["match"] == "exact"
+    assert similar.metadata["cache"]["match"] == "semantic"
+    assert similar.metadata["cache"]["cached_query"] == "What is a surface code?"
+    assert similar.findings == miss.findings
+    assert different.metadata["cache"] == {"hit": False}
+
+
+def test_semantic_matches_need_the_same_additional_params(cache: ResponseCache) -> None:
+    _serve(cache, ResearchQuery(query="What is a surface code?", additional_params={"depth": "basic"}))
+    response = _serve(cache, ResearchQuery(query="What's a surface code?", additional_params={"depth": "deep"}))
+
+    assert response.metadata["cache"] == {"hit": False}
+
+
+def test_hits_have_the_shape_of_the_response_that_was_stored(cache: ResponseCache) -> None:
+    miss = _serve(cache, ResearchQuery(query="What is a surface code?"))
+    hit = _serve(cache, ResearchQuery(query="What is a surface code?"))
+
+    assert hit.metadata.keys() == miss.metadata.keys()
+    assert hit.metadata["schedule"] == miss.metadata["schedule"]
+    assert hit.metadata["cache"]["original_processing_time"] == miss.processing_time
+    assert hit.processing_time == 0.1
@@ -0,0 +1,127 @@
+import threading
+import time
+
+import pytest
+from crewai import Agent, Task, TaskOutput
+
+from app.crew.base import ResearchTask
+from app.crew.scheduler import DagCrew, _schedule_report
+from app.metrics import RequestMetrics, observe_stage, track_request
+
+
+def _agent() -> Agent:
+    return Agent(role="Researcher", goal="Research", backstory="A researcher.", llm="gpt-4o-mini")
+
+
+def _task(name: str, agent: Agent, context: list[Task] | None = None) -> Task:
+    return Task(name=name, description=f"Do {name}.", expected_output=name, agent=agent, context=context or [])
+
+
+@pytest.fixture
+def diamond() -> DagCrew:
+    """A crew of plan -> (rag, web) -> report, with rag and web independent of each other."""
+    agent = _agent()
+    plan = _task("plan", agent)
+    rag = _task("rag", agent, [plan])
+    web = _task("web", agent, [plan])
+    report = _task("report", agent, [rag, web])
+    return DagCrew(agents=[agent], tasks=[plan, rag, web, report], max_parallelism=4)
+
+
+def test_dependencies_follow_task_contexts(diamond: DagCrew) -> None:
+    assert diamond._dependencies(diamond.tasks) == [set(), {0}, {0}, {1, 2}]
+
+
+def test_dependencies_reject_tasks_listed_after_their_dependents(diamond: DagCrew) -> None:
+    plan, rag, web, report = diamond.tasks
+    with pytest.raises(ValueError, match="'rag' depends on a task"):
+        diamond._dependencies([rag, plan, web, report])
+
+
+def test_dependencies_skip_seeded_tasks_left_out_of_the_crew(diamond: DagCrew) -> None:
+    plan, rag, web, report = diamond.tasks
+    plan.output = TaskOutput(description=plan.description, name=plan.name, agent="Researcher", raw="seeded")
+    assert diamond._dependencies([rag, web, report]) == [set(), set(), {0, 1}]
+
+
+def test_dependencies_reject_missing_tasks_without_output(diamond: DagCrew) -> None:
+    _, rag, web, report = diamond.tasks
+    with pytest.raises(ValueError, match="'rag' depends on a task"):
+        diamond._dependencies([rag, web, report])
+
+
+def test_run_starts_tasks_once_their_dependencies_finish(diamond: DagCrew, monkeypatch: pytest.MonkeyPatch) -> None:
+    events: list[tuple[str, str]] = []
+    lock = threading.Lock()
+
+    def run_task(_self: DagCrew, task: Task) -> tuple[TaskOutput, float, float]:
+        started_at = time.perf_counter()
+        with lock:
+            events.append(("start", task.name))
+        time.sleep(0.05)
+        with lock:
+            events.append(("end", task.name))
+        output = TaskOutput(description=task.description, name=task.name, agent="Researcher", raw=task.name)
+        return output, started_at, time.perf_counter()
+
+    monkeypatch.setattr(DagCrew, "_run_task", run_task)
+    output = diamond._run_sequential_process()
+
+    assert output.raw == "report"
+    position = {event: i for i, event in enumerate(events)}
+    assert position[("end", "plan")] < position[("start", "rag")]
+    assert position[("end", "plan")] < position[("start", "web")]
+    assert position[("end", "rag")] < position[("start", "report")]
+    assert position[("end", "web")] < position[("start", "report")]
+    # The independent branches overlap
+    assert position[("start", "web")] < position[("end", "rag")]
+    assert position[("start", "rag")] < position[("end", "web")]
+    assert diamond.schedule_report["critical_path"][0] == "plan"
+    assert diamond.schedule_report["critical_path"][-1] == "report"
+
+
+def test_run_stops_scheduling_after_a_failure(diamond: DagCrew, monkeypatch: pytest.MonkeyPatch) -> None:
+    started: list[str] = []
+
+    def run_task(_self: DagCrew, task: Task) -> tuple[TaskOutput, float, float]:
+        started.append(task.name)
+        if task.name == "rag":
+            msg = "rag failed"
+            raise RuntimeError(msg)
+        now = time.perf_counter()
+        return TaskOutput(description=task.description, name=task.name, agent="Researcher", raw=task.name), now, now
+
+    monkeypatch.setattr(DagCrew, "_run_task", run_task)
+    with pytest.raises(RuntimeError, match="rag failed"):
+        diamond._run_sequential_process()
+    assert "report" not in started
+
+
+def test_schedule_report_follows_the_latest_finishing_dependency(diamond: DagCrew) -> None:
+    dependencies = diamond._dependencies(diamond.tasks)
+    timings = {0: (0.0, 1.0), 1: (1.0, 2.0), 2: (1.5, 4.0), 3: (4.0, 5.0)}
+
+    report = _schedule_report(diamond.tasks, dependencies, timings, start_time=0.0)
+
+    assert report["critical_path"] == ["plan", "web", "report"]
+    assert report["wall_time"] == 5.0
+    assert report["serial_time"] == 5.5
+    assert report["parallel_speedup"] == 1.1
+    web = next(task for task in report["tasks"] if task["task"] == "web")
+    assert web["depends_on"] == ["plan"]
+    assert web["queued"] == 0.5
+
+
+def test_async_research_tasks_record_metrics_in_the_request_that_started_them(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    def execute_core(self: ResearchTask, *_: object) -> TaskOutput:
+        observe_stage("tool", "search", 0.5)
+        return TaskOutput(description=self.description, name=self.name, agent="Researcher", raw="done")
+
+    monkeypatch.setattr(ResearchTask, "_execute_core", execute_core)
+    task = ResearchTask(name="web", description="Do web.", expected_output="web", agent=_agent(), async_execution=True)
+    with track_request(RequestMetrics()) as request:
+        task.execute_async().result(timeout=5)
+
+    assert request.breakdown()["stages"] == {"tool": {"search": {"count": 1, "seconds": 0.5}}}
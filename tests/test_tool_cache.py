@@ -0,0 +1,82 @@
+from app.cache.tool_cache import DiskToolCacheBackend, InMemoryToolCacheBackend, ToolCacheBackend, ToolResultCache
+
+TTL_SECONDS = {"default": 600, "general": 600, "news": 60}
+TIME_RANGE_TTL_SECONDS = {"day": 30, "month": 6000}
+
+BACKENDS = {
+    "memory": lambda _: InMemoryToolCacheBackend(max_entries=2),
+    "sqlite": lambda path: DiskToolCacheBackend(max_entries=2, path=path),
+}
+
+
+def _cache(backend: ToolCacheBackend) -> ToolResultCache:
+    return ToolResultCache(backend, ttl_seconds=TTL_SECONDS, time_range_ttl_seconds=TIME_RANGE_TTL_SECONDS)
+
+
+def test_key_ignores_case_whitespace_timeouts_and_unset_params() -> None:
+    cache = _cache(InMemoryToolCacheBackend(max_entries=2))
+    key = cache.key("search", {"query": "Quantum  error correction", "include_domains": ["B.org", "a.org"]})
+
+    assert key == cache.key(
+        "search",
+        {"query": "quantum error correction", "include_domains": ["a.org", "b.org"], "timeout": 5, "topic": None},
+    )
+    assert key != cache.key("search", {"query": "quantum error correction", "max_results": 3})
+    assert key != cache.key("extract", {"query": "quantum error correction", "include_domains": ["a.org", "b.org"]})
+
+
+def test_ttl_depends_on_topic_and_is_capped_by_time_range() -> None:
+    cache = _cache(InMemoryToolCacheBackend(max_entries=2))
+
+    assert cache.ttl_for("search", {"query": "q"}) == 600
+    assert cache.ttl_for("search", {"query": "q", "topic": "news"}) == 60
+    assert cache.ttl_for("search", {"query": "q", "topic": "news", "time_range": "day"}) == 30
+    assert cache.ttl_for("search", {"query": "q", "topic": "news", "time_range": "month"}) == 60
+
+
+def test_entries_expire_after_their_ttl(backend: ToolCacheBackend, clock) -> None:
+    cache = _cache(backend)
+    cache.set("search", {"query": "general"}, {"results": [1]})
+    cache.set("search", {"query": "news", "topic": "news"}, {"results": [2]})
+
+    clock.advance(61)
+    assert cache.get("search", {"query": "news", "topic": "news"}) is None
+    assert cache.get("search", {"query": "general"}) == {"results": [1]}
+
+    clock.advance(600)
+    assert cache.get("search", {"query": "general"}) is None
+
+
+def test_least_recently_used_entry_is_evicted(backend: ToolCacheBackend, clock) -> None:
+    cache = _cache(backend)
+    cache.set("search", {"query": "first"}, "first")
+    clock.advance(1)
+    cache.set("search", {"query": "second"}, "second")
+    clock.advance(1)
+    assert cache.get("search", {"query": "first"}) == "first"
+    clock.advance(1)
+    cache.set("search", {"query": "third"}, "third")
+
+    assert cache.get("search", {"query": "second"}) is None
+    assert cache.get("search", {"query": "first"}) == "first"
+    assert cache.get("search", {"query": "third"}) == "third"
+
+
+def test_disk_entries_survive_a_new_backend(tmp_path) -> None:
+    path = str(tmp_path / "results.sqlite3")
+    _cache(DiskToolCacheBackend(max_entries=2, path=path)).set("search", {"query": "q"}, {"results": ["a"]})
+
+    assert _cache(DiskToolCacheBackend(max_entries=2, path=path)).get("search", {"query": "q"}) == {"results": ["a"]}
+
+
+def test_stats_count_hits_and_misses_per_namespace() -> None:
+    cache = _cache(InMemoryToolCacheBackend(max_entries=2))
+    cache.get("search", {"query": "q"})
+    cache.set("search", {"query": "q"}, "value")
+    cache.get("search", {"query": "q"})
+    cache.get("extract", {"urls": ["https://a.org"]})
+
+    assert cache.stats() == {
+        "search": {"hits": 1, "misses": 1, "hit_rate": 0.5},
+        "extract": {"hits": 0, "misses": 1, "hit_rate": 0.0},
+    }